@@ -18,6 +18,8 @@ class AdapterKeys:
     ADAPTER_METADATA_B = "adapter_metadata_b"
     ID = "id"
     IS_VALID = "is_valid"
+    # Bumped to invalidate the adapter config cache of the platform service
+    GENERATION_CACHE_KEY_PREFIX = "adapter_instance:generation"
     LLM_DEFAULT = "llm_default"
     VECTOR_DB_DEFAULT = "vector_db_default"
     EMBEDDING_DEFAULT = "embedding_default"
@@ -4,11 +4,15 @@ import uuid
 from typing import Any
 
 from account_v2.models import User
+from adapter_processor_v2.constants import AdapterKeys
 from cryptography.fernet import Fernet, InvalidToken
 from django.conf import settings
 from django.db import models
 from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from tenant_account_v2.models import OrganizationMember
+from utils.cache_service import CacheService
 from utils.exceptions import InvalidEncryptionKey
 from utils.models.base_model import BaseModel
 from utils.models.organization_mixin import (
@@ -167,6 +171,19 @@ class AdapterInstance(DefaultOrganizationMixin, BaseModel):
         return 0
 
 
+# Executed every time an AdapterInstance is saved or deleted
+@receiver(post_save, sender=AdapterInstance)
+@receiver(post_delete, sender=AdapterInstance)
+def invalidate_adapter_config_cache(sender, instance, **kwargs):
+    """Signal to invalidate the adapter config cached by the platform service."""
+    try:
+        CacheService.incr(f"{AdapterKeys.GENERATION_CACHE_KEY_PREFIX}:{instance.id}")
+    except Exception as e:
+        logger.warning(
+            f"Failed to invalidate cached config of adapter {instance.id}: {e}"
+        )
+
+
 class UserDefaultAdapter(BaseModel):
     organization_member = models.OneToOneField(
         OrganizationMember,
@@ -156,6 +156,10 @@ INSTANT_WF_POLLING_TIMEOUT = int(
     os.environ.get("INSTANT_WF_POLLING_TIMEOUT", "300")
 )  # 5 minutes
 MAX_PARALLEL_FILE_BATCHES = int(os.environ.get("MAX_PARALLEL_FILE_BATCHES", 1))
+# Run the tool over every file of a batch in one container instead of one per file
+TOOL_CONTAINER_BATCH_RUN_ENABLED = CommonUtils.str_to_bool(
+    os.environ.get("TOOL_CONTAINER_BATCH_RUN_ENABLED", "False")
+)
 
 CELERY_RESULT_CHORD_RETRY_INTERVAL = int(
     os.environ.get("CELERY_RESULT_CHORD_RETRY_INTERVAL", "3")
@@ -6,6 +6,7 @@ from account_v2.models import Organization, PlatformKey, User
 from account_v2.organization import OrganizationService
 from django.db import IntegrityError
 from tenant_account_v2.constants import ErrorMessage, PlatformServiceConstants
+from utils.cache_service import CacheService
 from utils.user_context import UserContext
 from utils.encryption import encryption_service
 
@@ -104,6 +105,7 @@ class PlatformAuthenticationService:
         try:
             platform_key: PlatformKey = PlatformKey.objects.get(pk=id)
             platform_key.delete()
+            PlatformAuthenticationService.invalidate_platform_key_cache()
             # TODO: Add organization details in logs in possible places once v2 enabled
             logger.info(f"platform_key {id} is deleted for {platform_key.organization}")
         except IntegrityError as error:
@@ -132,6 +134,7 @@ class PlatformAuthenticationService:
             platform_key.key = encryption_service.encrypt(new_key)
             platform_key.modified_by = user
             platform_key.save()
+            PlatformAuthenticationService.invalidate_platform_key_cache()
             result[PlatformServiceConstants.ID] = platform_key.id
             result[PlatformServiceConstants.KEY_NAME] = platform_key.key_name
             # Return the unencrypted key
@@ -190,6 +193,7 @@ class PlatformAuthenticationService:
                 )
                 raise InvalidRequest(f"Invalid action: {action}")
             platform_key.save()
+            PlatformAuthenticationService.invalidate_platform_key_cache()
         except IntegrityError as error:
             logger.error(
                 f"IntegrityError - Failed to {action} platform key {platform_key.id}"
@@ -197,6 +201,17 @@ class PlatformAuthenticationService:
             )
             raise DuplicateData(f"{ErrorMessage.KEY_EXIST}, {ErrorMessage.DUPLICATE_API}")
 
+    @staticmethod
+    def invalidate_platform_key_cache() -> None:
+        """Clears platform keys cached by the platform and prompt services.
+
+        Failures are logged since the cache also expires on its own.
+        """
+        try:
+            CacheService.incr(PlatformServiceConstants.KEY_GENERATION_CACHE_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate platform key cache: {e}")
+
     @staticmethod
     def list_platform_key_ids() -> list[PlatformKey]:
         """Method to fetch list of platform keys unique ids for internal usage.
@@ -7,6 +7,8 @@ class PlatformServiceConstants:
     DEACTIVATE = "DEACTIVATE"
     ACTION = "action"
     KEY_NAME = "key_name"
+    # Bumped to invalidate the platform key cache of the platform and prompt services
+    KEY_GENERATION_CACHE_KEY = "platform_key:generation"
 
 
 class ErrorMessage:
@@ -121,6 +121,11 @@ class CacheService:
         """Increment a value in a Redis hash."""
         redis_cache.hincrby(key, field, increment)
 
+    @staticmethod
+    def incr(key: str) -> int:
+        """Increment a counter in Redis."""
+        return redis_cache.incr(key)
+
     @staticmethod
     def exists(key: str) -> bool:
         """Check if a key exists in Redis."""
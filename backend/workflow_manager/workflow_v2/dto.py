@@ -5,7 +5,8 @@ from typing import Any
 
 from celery.result import AsyncResult
 
-from workflow_manager.endpoint_v2.dto import DestinationConfig, SourceConfig
+from workflow_manager.endpoint_v2.destination import DestinationConnector
+from workflow_manager.endpoint_v2.dto import DestinationConfig, FileHash, SourceConfig
 from workflow_manager.file_execution.models import WorkflowFileExecution
 from workflow_manager.utils.workflow_log import WorkflowLog
 from workflow_manager.workflow_v2.constants import WorkflowKey
@@ -234,3 +235,14 @@ class ExecutionContext:
     workflow_file_execution: WorkflowFileExecution
     source_config: SourceConfig
     destination_config: DestinationConfig
+
+
+@dataclass
+class PreparedFileExecution:
+    """A file that is ready for its workflow steps to be executed."""
+
+    current_file_idx: int
+    file_hash: FileHash
+    workflow_log: WorkflowLog
+    workflow_file_execution: WorkflowFileExecution
+    destination: DestinationConnector
@@ -29,6 +29,7 @@ from unstract.core.file_execution_tracker import (
     FileExecutionStatusTracker,
 )
 from unstract.core.tool_execution_status import ToolExecutionData, ToolExecutionTracker
+from unstract.tool_sandbox.dto import RunnerContainerRunResponse
 from unstract.workflow_execution.enums import LogComponent, LogStage, LogState
 from unstract.workflow_execution.exceptions import StopExecution
 from workflow_manager.endpoint_v2.destination import DestinationConnector
@@ -51,6 +52,7 @@ from workflow_manager.workflow_v2.dto import (
     FileBatchResult,
     FileData,
     FinalOutputResult,
+    PreparedFileExecution,
     ToolExecutionResult,
 )
 from workflow_manager.workflow_v2.enums import ExecutionStatus, TaskType
@@ -177,12 +179,8 @@ class FileExecutionTasks:
 
         logger.info(f"Processing {total_files} files of execution {execution_id}")
 
-        for file_number, (file_name, file_hash_dict) in enumerate(
-            file_batch_data.files, 1
-        ):
-            logger.info(
-                f"[{celery_task_id}][{file_number}/{total_files}] Processing file '{file_name}'"
-            )
+        file_hashes: list[FileHash] = []
+        for file_name, file_hash_dict in file_batch_data.files:
             file_hash = FileHash(
                 file_path=file_hash_dict.get("file_path"),
                 file_name=file_hash_dict.get("file_name"),
@@ -202,12 +200,32 @@ class FileExecutionTasks:
                 file_hash,
             )
             logger.info(f"File hash for file {file_name}: {file_hash.to_json()}")
-            file_execution_result = FileExecutionTasks._process_file(
-                current_file_idx=file_number,
-                total_files=total_files,
-                file_data=file_data,
-                file_hash=file_hash,
-                workflow_execution=workflow_execution,
+            file_hashes.append(file_hash)
+
+        if settings.TOOL_CONTAINER_BATCH_RUN_ENABLED and not file_data.single_step:
+            file_execution_results = (
+                FileExecutionTasks._process_files_with_batched_tool_run(
+                    file_data=file_data,
+                    file_hashes=file_hashes,
+                    workflow_execution=workflow_execution,
+                )
+            )
+        else:
+            file_execution_results = (
+                FileExecutionTasks._process_file(
+                    current_file_idx=file_number,
+                    total_files=total_files,
+                    file_data=file_data,
+                    file_hash=file_hash,
+                    workflow_execution=workflow_execution,
+                )
+                for file_number, file_hash in enumerate(file_hashes, 1)
+            )
+
+        for file_number, file_execution_result in enumerate(file_execution_results, 1):
+            file_name = file_execution_result.file
+            logger.info(
+                f"[{celery_task_id}][{file_number}/{total_files}] Processed file '{file_name}'"
             )
             if file_execution_result.error:
                 failed_files += 1
@@ -348,6 +366,143 @@ class FileExecutionTasks:
         Returns:
             FileExecutionResult: Result of the file execution
         """
+        prepared_file = cls._prepare_file(
+            current_file_idx=current_file_idx,
+            file_data=file_data,
+            file_hash=file_hash,
+            workflow_execution=workflow_execution,
+        )
+        if isinstance(prepared_file, FileExecutionResult):
+            return prepared_file
+        return cls._execute_prepared_file(
+            prepared_file=prepared_file,
+            total_files=total_files,
+            file_data=file_data,
+            workflow_execution=workflow_execution,
+        )
+
+    @classmethod
+    def _process_files_with_batched_tool_run(
+        cls,
+        file_data: FileData,
+        file_hashes: list[FileHash],
+        workflow_execution: WorkflowExecution,
+    ) -> list[FileExecutionResult]:
+        """Process the files of a batch with a single tool container.
+
+        Every file is prepared first, the tool is then run once over all files
+        that need it and each file is finalized with its own tool outcome.
+
+        Args:
+            file_data (FileData): File data
+            file_hashes (list[FileHash]): File hashes of the batch, in order
+            workflow_execution (WorkflowExecution): Workflow execution instance
+
+        Returns:
+            list[FileExecutionResult]: Result of each file execution, in order
+        """
+        total_files = len(file_hashes)
+        results: dict[int, FileExecutionResult] = {}
+        prepared_files: list[PreparedFileExecution] = []
+        for current_file_idx, file_hash in enumerate(file_hashes, 1):
+            prepared_file = cls._prepare_file(
+                current_file_idx=current_file_idx,
+                file_data=file_data,
+                file_hash=file_hash,
+                workflow_execution=workflow_execution,
+            )
+            if isinstance(prepared_file, FileExecutionResult):
+                results[current_file_idx] = prepared_file
+            else:
+                prepared_files.append(prepared_file)
+
+        tool_run_responses = cls._run_tool_batch(
+            file_data=file_data,
+            workflow_execution=workflow_execution,
+            file_execution_ids=[
+                str(prepared_file.workflow_file_execution.id)
+                for prepared_file in prepared_files
+                if not prepared_file.file_hash.is_executed
+            ],
+        )
+        for prepared_file in prepared_files:
+            results[prepared_file.current_file_idx] = cls._execute_prepared_file(
+                prepared_file=prepared_file,
+                total_files=total_files,
+                file_data=file_data,
+                workflow_execution=workflow_execution,
+                tool_run_response=tool_run_responses.get(
+                    str(prepared_file.workflow_file_execution.id)
+                ),
+            )
+        return [results[current_file_idx] for current_file_idx in sorted(results)]
+
+    @classmethod
+    def _run_tool_batch(
+        cls,
+        file_data: FileData,
+        workflow_execution: WorkflowExecution,
+        file_execution_ids: list[str],
+    ) -> dict[str, RunnerContainerRunResponse]:
+        """Run the workflow's tool over the given files in one container.
+
+        Returns no responses, so that each file runs the tool by itself, when
+        batching does not apply or the batched run fails.
+        """
+        if len(file_execution_ids) < 2:
+            return {}
+        tool_instances: list[ToolInstance] = (
+            ToolInstanceHelper.get_tool_instances_by_workflow(
+                file_data.workflow_id, ToolInstanceKey.STEP
+            )
+        )
+        if len(tool_instances) != 1:
+            return {}
+        try:
+            execution_service = cls._build_workflow_execution_service(
+                organization_id=file_data.organization_id,
+                workflow=workflow_execution.workflow,
+                tool_instances=tool_instances,
+                pipeline_id=file_data.pipeline_id,
+                single_step=file_data.single_step,
+                scheduled=file_data.scheduled,
+                execution_mode=file_data.execution_mode,
+                workflow_execution=workflow_execution,
+                use_file_history=file_data.use_file_history,
+                file_execution_id=file_execution_ids[0],
+            )
+            logger.info(
+                f"Running tool for a batch of {len(file_execution_ids)} files of execution '{workflow_execution.id}'"
+            )
+            return execution_service.execute_tool_batch(file_execution_ids)
+        except Exception as error:
+            logger.error(
+                f"Batched tool run failed, running the tool per file instead: {error}",
+                exc_info=True,
+            )
+            return {}
+
+    @classmethod
+    def _prepare_file(
+        cls,
+        current_file_idx: int,
+        file_data: FileData,
+        file_hash: FileHash,
+        workflow_execution: WorkflowExecution,
+    ) -> FileExecutionResult | PreparedFileExecution:
+        """Prepare a file for the execution of the workflow steps.
+
+        Args:
+            current_file_idx (int): Index of the current file
+            file_data (FileData): File data
+            file_hash (FileHash): File hash
+            workflow_execution (WorkflowExecution): Workflow execution instance
+
+        Returns:
+            FileExecutionResult | PreparedFileExecution: Result of the file
+                execution if it needs no further processing, else the file
+                prepared for `_execute_prepared_file()`
+        """
         try:
             logger.info(
                 f"[Execution {workflow_execution.id}] Processing file: '{file_hash.file_name}'"
@@ -388,24 +543,12 @@ class FileExecutionTasks:
                 logger.info(f"File hash {file_hash} set from file execution data")
 
                 if stage.is_before(FileExecutionStage.COMPLETED):
-                    # Core Execution Phase
-                    execution_result = cls._execute_workflow_steps(
-                        file_data,
-                        workflow_execution,
-                        workflow_file_execution,
-                        file_hash,
-                        current_file_idx,
-                        total_files,
-                    )
-
-                    # Finalization Phase
-                    return cls._finalize_execution(
-                        workflow_execution,
-                        workflow_file_execution,
-                        file_hash,
-                        workflow_log,
-                        destination,
-                        execution_result,
+                    return PreparedFileExecution(
+                        current_file_idx=current_file_idx,
+                        file_hash=file_hash,
+                        workflow_log=workflow_log,
+                        workflow_file_execution=workflow_file_execution,
+                        destination=destination,
                     )
                 # If stage is already completed.
                 # Skip execution since the result is already cached (For API)
@@ -459,24 +602,12 @@ class FileExecutionTasks:
                 )
                 return early_result
 
-            # Core Execution Phase
-            execution_result = cls._execute_workflow_steps(
-                file_data,
-                workflow_execution,
-                workflow_file_execution,
-                file_hash,
-                current_file_idx,
-                total_files,
-            )
-
-            # Finalization Phase
-            return cls._finalize_execution(
-                workflow_execution,
-                workflow_file_execution,
-                file_hash,
-                workflow_log,
-                destination,
-                execution_result,
+            return PreparedFileExecution(
+                current_file_idx=current_file_idx,
+                file_hash=file_hash,
+                workflow_log=workflow_log,
+                workflow_file_execution=workflow_file_execution,
+                destination=destination,
             )
         except ExecutionContextInitializationError as error:
             # This case is not expected under normal conditions — handled here as a safety net.
@@ -500,22 +631,94 @@ class FileExecutionTasks:
                 destination=destination,
             )
         except Exception as error:
-            error_msg = f"File execution failed: {error}"
-            workflow_log.log_error(logger=logger, message=error_msg)
-            workflow_file_execution.update_status(
-                status=ExecutionStatus.ERROR, execution_error=error_msg[:500]
-            )
-            result = FinalOutputResult(output=None, metadata=None, error=error_msg)
-            return cls._build_final_result(
+            return cls._handle_file_execution_error(
+                error=error,
                 workflow_execution=workflow_execution,
                 file_hash=file_hash,
-                result=result,
+                workflow_log=workflow_log,
                 workflow_file_execution=workflow_file_execution,
-                error=error_msg,
-                is_api=destination.is_api,
                 destination=destination,
             )
 
+    @classmethod
+    def _execute_prepared_file(
+        cls,
+        prepared_file: PreparedFileExecution,
+        total_files: int,
+        file_data: FileData,
+        workflow_execution: WorkflowExecution,
+        tool_run_response: RunnerContainerRunResponse | None = None,
+    ) -> FileExecutionResult:
+        """Execute the workflow steps on a prepared file and finalize it.
+
+        Args:
+            prepared_file (PreparedFileExecution): File from `_prepare_file()`
+            total_files (int): Total number of files
+            file_data (FileData): File data
+            workflow_execution (WorkflowExecution): Workflow execution instance
+            tool_run_response (RunnerContainerRunResponse | None): Outcome of
+                the tool if it was already run on the file in a batch
+
+        Returns:
+            FileExecutionResult: Result of the file execution
+        """
+        try:
+            # Core Execution Phase
+            execution_result = cls._execute_workflow_steps(
+                file_data,
+                workflow_execution,
+                prepared_file.workflow_file_execution,
+                prepared_file.file_hash,
+                prepared_file.current_file_idx,
+                total_files,
+                tool_run_response=tool_run_response,
+            )
+
+            # Finalization Phase
+            return cls._finalize_execution(
+                workflow_execution,
+                prepared_file.workflow_file_execution,
+                prepared_file.file_hash,
+                prepared_file.workflow_log,
+                prepared_file.destination,
+                execution_result,
+            )
+        except Exception as error:
+            return cls._handle_file_execution_error(
+                error=error,
+                workflow_execution=workflow_execution,
+                file_hash=prepared_file.file_hash,
+                workflow_log=prepared_file.workflow_log,
+                workflow_file_execution=prepared_file.workflow_file_execution,
+                destination=prepared_file.destination,
+            )
+
+    @classmethod
+    def _handle_file_execution_error(
+        cls,
+        error: Exception,
+        workflow_execution: WorkflowExecution,
+        file_hash: FileHash,
+        workflow_log: WorkflowLog,
+        workflow_file_execution: WorkflowFileExecution,
+        destination: DestinationConnector,
+    ) -> FileExecutionResult:
+        error_msg = f"File execution failed: {error}"
+        workflow_log.log_error(logger=logger, message=error_msg)
+        workflow_file_execution.update_status(
+            status=ExecutionStatus.ERROR, execution_error=error_msg[:500]
+        )
+        result = FinalOutputResult(output=None, metadata=None, error=error_msg)
+        return cls._build_final_result(
+            workflow_execution=workflow_execution,
+            file_hash=file_hash,
+            result=result,
+            workflow_file_execution=workflow_file_execution,
+            error=error_msg,
+            is_api=destination.is_api,
+            destination=destination,
+        )
+
     @classmethod
     def _set_file_execution_tracker(
         cls,
@@ -777,6 +980,7 @@ class FileExecutionTasks:
         file_hash: FileHash,
         current_file_idx: int,
         total_files: int,
+        tool_run_response: RunnerContainerRunResponse | None = None,
     ) -> ToolExecutionResult:
         """Execute main workflow processing steps with proper error handling."""
         logger.info(f"Executing workflow steps for file: '{file_hash.file_name}'")
@@ -798,6 +1002,7 @@ class FileExecutionTasks:
             file_execution_id=str(workflow_file_execution.id),
         )
         logger.info(f"Execution service built for file: '{file_hash.file_name}'")
+        execution_service.set_tool_run_response(tool_run_response)
         try:
             execution_service.initiate_tool_execution(
                 current_file_idx=current_file_idx,
@@ -31,7 +31,7 @@ def create_app() -> Flask:
     # Register URL routes
     app.register_blueprint(api)
 
-    # Initialize and connect to the database
+    # Initialize the database, connections are pooled across requests
     db.init(
         database=Env.PG_BE_DATABASE,
         user=Env.PG_BE_USERNAME,
@@ -39,6 +39,8 @@ def create_app() -> Flask:
         host=Env.PG_BE_HOST,
         port=Env.PG_BE_PORT,
         options=f"-c application_name={Env.APPLICATION_NAME}",
+        max_connections=Env.DB_POOL_MAX_CONNECTIONS,
+        stale_timeout=Env.DB_POOL_STALE_TIMEOUT_IN_SECOND,
     )
 
     return app
@@ -3,23 +3,50 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-import redis
 from cryptography.fernet import Fernet, InvalidToken
 from flask import Blueprint, Request, jsonify, make_response, request
 from flask import current_app as app
 
 from unstract.core.flask.exceptions import APIError
+from unstract.core.platform_key_cache import PlatformKeyCache, PlatformKeyDetails
 from unstract.platform_service.constants import DBTable
 from unstract.platform_service.env import Env
 from unstract.platform_service.extensions import db
+from unstract.platform_service.helper.adapter_config_cache import AdapterConfigCache
 from unstract.platform_service.helper.adapter_instance import (
     AdapterInstanceRequestHelper,
 )
 from unstract.platform_service.helper.cost_calculation import CostCalculationHelper
 from unstract.platform_service.helper.prompt_studio import PromptStudioRequestHelper
+from unstract.platform_service.helper.redis_helper import RedisHelper
 
 platform_bp = Blueprint("platform", __name__)
 
+platform_key_cache = PlatformKeyCache(
+    get_redis_client=RedisHelper.get_client,
+    ttl_in_second=Env.PLATFORM_KEY_CACHE_TTL_IN_SECOND,
+    max_entries=Env.PLATFORM_KEY_CACHE_MAX_ENTRIES,
+)
+
+USAGE_COLUMNS = (
+    "id",
+    "organization_id",
+    "workflow_id",
+    "execution_id",
+    "adapter_instance_id",
+    "run_id",
+    "usage_type",
+    "llm_usage_reason",
+    "model_name",
+    "embedding_tokens",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "cost_in_dollars",
+    "created_at",
+    "modified_at",
+)
+
 
 def get_token_from_auth_header(request: Request) -> Any:
     try:
@@ -45,7 +72,7 @@ def authentication_middleware(func: Any) -> Any:
     return wrapper
 
 
-def get_organization_from_bearer_token(token: str) -> tuple[int | None, str]:
+def get_organization_from_bearer_token(token: str) -> tuple[int | None, str | None]:
     """Fetch organization by platform key.
 
     Args:
@@ -54,26 +81,47 @@ def get_organization_from_bearer_token(token: str) -> tuple[int | None, str]:
     Returns:
         tuple[int, str]: organization uid and organization identifier
     """
-    query = f"""
-        SELECT organization_id FROM "{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY}
-        WHERE key=%s
-    """
-    organization_uid: int = execute_query(query, (token,))
-    query_org = f"""
-        SELECT organization_id FROM "{Env.DB_SCHEMA}".{DBTable.ORGANIZATION}
-        WHERE id=%s
-    """
-    organization_identifier: str = execute_query(query_org, (organization_uid,))
-    return organization_uid, organization_identifier
+    details = get_platform_key_details(token)
+    if not details:
+        return None, None
+    return details.organization_uid, details.organization_identifier
+
 
+def get_platform_key_details(token: str) -> PlatformKeyDetails | None:
+    """Fetch the organization of an active platform key.
 
-def execute_query(query: str, params: tuple = ()) -> Any:
-    cursor = db.execute_sql(query, params)
+    Validated keys are served from `platform_key_cache` and looked up in the
+    database otherwise.
+
+    Args:
+        token (str): platform key
+
+    Returns:
+        PlatformKeyDetails | None: Details of the key, None if the key does
+            not exist or is inactive
+    """
+    details = platform_key_cache.get(token)
+    if details:
+        return details
+    query = f"""
+        SELECT pk.is_active, pk.organization_id, o.organization_id
+        FROM "{Env.DB_SCHEMA}".{DBTable.PLATFORM_KEY} pk
+        LEFT JOIN "{Env.DB_SCHEMA}".{DBTable.ORGANIZATION} o
+        ON o.id = pk.organization_id
+        WHERE pk.key=%s
+    """
+    cursor = db.execute_sql(query, (token,))
     result_row = cursor.fetchone()
     cursor.close()
-    if not result_row or len(result_row) == 0:
+    if not result_row:
+        app.logger.error("Authentication failed. bearer token not found")
+        return None
+    is_active, organization_uid, organization_identifier = result_row
+    if not is_active:
+        app.logger.error("Token is not active. Activate before using it.")
+        platform_key_cache.invalidate(token)
         return None
-    return result_row[0]
+    return platform_key_cache.put(token, organization_uid, organization_identifier)
 
 
 def validate_bearer_token(token: str | None) -> bool:
@@ -81,30 +129,8 @@ def validate_bearer_token(token: str | None) -> bool:
         if token is None:
             app.logger.error("Authentication failed. Empty bearer token")
             return False
-
-        platform_key_table = DBTable.PLATFORM_KEY
-        query = f"""
-            SELECT * FROM \"{Env.DB_SCHEMA}\".{platform_key_table}
-            WHERE key = '{token}'
-        """
-
-        cursor = db.execute_sql(query)
-        result_row = cursor.fetchone()
-        cursor.close()
-        if not result_row or len(result_row) == 0:
-            app.logger.error(f"Authentication failed. bearer token not found {token}")
-            return False
-        platform_key = str(result_row[1])
-        is_active = bool(result_row[2])
-        if not is_active:
-            app.logger.error(
-                f"Token is not active. Activate before using it. token {token}"
-            )
-            return False
-        if platform_key != token:
-            app.logger.error(f"Authentication failed. Invalid bearer token: {token}")
+        if not get_platform_key_details(token):
             return False
-
     except Exception as e:
         app.logger.error(
             f"Error while validating bearer token: {e}",
@@ -164,16 +190,17 @@ def page_usage() -> Any:
             result["unique_id"] = usage_id
 
             # Check if the subscription_usage table exists
-            check_table_query = f"""
+            check_table_query = """
                 SELECT EXISTS (
                     SELECT FROM information_schema.tables
-                    WHERE table_schema = '{Env.DB_SCHEMA}'
-                    AND table_name = '{DBTable.SUBSCRIPTION_USAGE}'
+                    WHERE table_schema = %s AND table_name = %s
                 );
             """
             app.logger.info("Checking if subscription_usage table exists")
 
-            table_exists = db.execute_sql(check_table_query).fetchone()[0]
+            table_exists = db.execute_sql(
+                check_table_query, (Env.DB_SCHEMA, DBTable.SUBSCRIPTION_USAGE)
+            ).fetchone()[0]
 
             if table_exists:
                 app.logger.info("subscription_usage table exists")
@@ -244,31 +271,19 @@ def page_usage() -> Any:
         return make_response(result, 500)
 
 
-@platform_bp.route("/usage", methods=["POST"])
-@authentication_middleware
-def usage() -> Any:
-    """Usage endpoint.
-    Sample Usage:
-    curl -X POST  http://localhost:3001/usage \
-    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
-    -H "Content-Type: application/json" \
-    -d '{
-            "workflow_id": "test",
-            "execution_id": "test",
-            ....
-        }'
+def get_usage_params(
+    payload: dict[Any, Any], organization_uid: int | None, current_time: datetime
+) -> tuple[Any, ...]:
+    """Builds the row of a usage record, including its cost.
+
+    Args:
+        payload (dict[Any, Any]): Usage record posted by the SDK
+        organization_uid (int | None): Organization the usage belongs to
+        current_time (datetime): Creation time of the record
+
+    Returns:
+        tuple[Any, ...]: Values in the column order of `USAGE_COLUMNS`
     """
-    result: dict[str, Any] = {
-        "status": "ERROR",
-        "error": "",
-        "unique_id": "",
-    }
-    payload: dict[Any, Any] | None = request.json
-    if not payload:
-        result["error"] = Env.INVALID_PAYLOAD
-        return make_response(result, 400)
-    bearer_token = get_token_from_auth_header(request)
-    organization_uid, org_id = get_organization_from_bearer_token(bearer_token)
     workflow_id = payload.get("workflow_id")
     execution_id = payload.get("execution_id", "")
     adapter_instance_id = payload.get("adapter_instance_id", "")
@@ -286,27 +301,15 @@ def usage() -> Any:
         input_tokens = embedding_tokens
     cost_in_dollars = 0.0
     if provider:
-        cost_calculation_helper = CostCalculationHelper()
+        cost_calculation_helper = CostCalculationHelper.get_instance()
         cost_in_dollars = cost_calculation_helper.calculate_cost(
             model_name=model_name,
             provider=provider,
             input_tokens=input_tokens,
             output_tokens=completion_tokens,
         )
-    usage_id = uuid.uuid4()
-    current_time = datetime.now()
-    query = f"""
-        INSERT INTO \"{Env.DB_SCHEMA}\".{DBTable.TOKEN_USAGE} (
-        id, organization_id, workflow_id,
-        execution_id, adapter_instance_id, run_id, usage_type,
-        llm_usage_reason, model_name, embedding_tokens, prompt_tokens,
-        completion_tokens, total_tokens, cost_in_dollars, created_at, modified_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-    usage_id = uuid.uuid4()
-    current_time = datetime.now()
-    params = (
-        usage_id,
+    return (
+        uuid.uuid4(),
         organization_uid,
         workflow_id,
         execution_id,
@@ -324,20 +327,114 @@ def usage() -> Any:
         current_time,
     )
 
+
+def insert_usages(rows: list[tuple[Any, ...]]) -> None:
+    """Inserts usage records with a single multi-row statement."""
+    row_placeholder = "(" + ", ".join(["%s"] * len(USAGE_COLUMNS)) + ")"
+    query = f"""
+        INSERT INTO \"{Env.DB_SCHEMA}\".{DBTable.TOKEN_USAGE} (
+        {", ".join(USAGE_COLUMNS)})
+        VALUES {", ".join([row_placeholder] * len(rows))}
+    """
+    params = tuple(value for row in rows for value in row)
+    with db.atomic():
+        db.execute_sql(query, params)
+
+
+@platform_bp.route("/usage", methods=["POST"])
+@authentication_middleware
+def usage() -> Any:
+    """Usage endpoint.
+    Sample Usage:
+    curl -X POST  http://localhost:3001/usage \
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
+    -H "Content-Type: application/json" \
+    -d '{
+            "workflow_id": "test",
+            "execution_id": "test",
+            ....
+        }'
+    """
+    result: dict[str, Any] = {
+        "status": "ERROR",
+        "error": "",
+        "unique_id": "",
+    }
+    payload: dict[Any, Any] | None = request.json
+    if not payload:
+        result["error"] = Env.INVALID_PAYLOAD
+        return make_response(result, 400)
+    bearer_token = get_token_from_auth_header(request)
+    organization_uid, org_id = get_organization_from_bearer_token(bearer_token)
+    params = get_usage_params(payload, organization_uid, datetime.now())
+    usage_id = params[0]
+
     try:
-        with db.atomic() as transaction:
-            db.execute_sql(query, params)
-            transaction.commit()
-            app.logger.info("Adapter usage recorded with id %s for %s", usage_id, org_id)
-            result["status"] = "OK"
-            result["unique_id"] = usage_id
-            return make_response(result, 200)
+        insert_usages([params])
+        app.logger.info("Adapter usage recorded with id %s for %s", usage_id, org_id)
+        result["status"] = "OK"
+        result["unique_id"] = usage_id
+        return make_response(result, 200)
     except Exception as e:
         app.logger.error(f"Error while creating usage entry: {e}")
         result["error"] = "Internal Server Error"
         return make_response(result, 500)
 
 
+@platform_bp.route("/usage/batch", methods=["POST"], endpoint="usage_batch")
+@authentication_middleware
+def usage_batch() -> Any:
+    """Batch usage endpoint, records many usages in one insert.
+
+    Accepts up to `USAGE_BATCH_MAX_RECORDS` records in the format of the
+    `/usage` endpoint.
+
+    Sample Usage:
+    curl -X POST  http://localhost:3001/usage/batch \
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
+    -H "Content-Type: application/json" \
+    -d '{
+            "usages": [
+                {"workflow_id": "test", "execution_id": "test", ....},
+                ....
+            ]
+        }'
+    """
+    result: dict[str, Any] = {
+        "status": "ERROR",
+        "error": "",
+        "unique_ids": [],
+    }
+    payload: dict[Any, Any] | None = request.json
+    usages = payload.get("usages") if isinstance(payload, dict) else None
+    if not usages or not isinstance(usages, list):
+        result["error"] = Env.INVALID_PAYLOAD
+        return make_response(result, 400)
+    if len(usages) > Env.USAGE_BATCH_MAX_RECORDS:
+        result["error"] = (
+            f"Batch exceeds the limit of {Env.USAGE_BATCH_MAX_RECORDS} usage records"
+        )
+        return make_response(result, 400)
+    if not all(isinstance(usage, dict) and usage for usage in usages):
+        result["error"] = Env.INVALID_PAYLOAD
+        return make_response(result, 400)
+    bearer_token = get_token_from_auth_header(request)
+    organization_uid, org_id = get_organization_from_bearer_token(bearer_token)
+    current_time = datetime.now()
+    rows = [get_usage_params(usage, organization_uid, current_time) for usage in usages]
+
+    try:
+        insert_usages(rows)
+        app.logger.info("Recorded %d adapter usages for %s", len(rows), org_id)
+        result["status"] = "OK"
+        result["unique_ids"] = [row[0] for row in rows]
+        return make_response(result, 200)
+    except Exception as e:
+        app.logger.error(f"Error while creating usage entries: {e}")
+        result["error"] = "Internal Server Error"
+        return make_response(result, 500)
+
+
 @platform_bp.route(
     "/platform_details",
     methods=["GET"],
@@ -364,20 +461,54 @@ def platform_details() -> Any:
     return result, 200
 
 
+def _parse_cache_ttl(ttl: Any) -> int | None:
+    """Parses the optional TTL in seconds of a cache entry.
+
+    Returns:
+        int | None: TTL, None for entries which do not expire (no TTL or 0)
+
+    Raises:
+        ValueError: If the TTL is not a non-negative whole number
+    """
+    if ttl is None:
+        return None
+    if isinstance(ttl, bool) or not isinstance(ttl, int | str):
+        raise ValueError(f"Invalid TTL: {ttl}")
+    parsed_ttl = int(ttl)
+    if parsed_ttl < 0:
+        raise ValueError(f"Invalid TTL: {ttl}")
+    return parsed_ttl or None
+
+
 @platform_bp.route("/cache", methods=["POST", "GET", "DELETE"], endpoint="cache")
 @authentication_middleware
 def cache() -> Any:
     """Cache endpoint.
 
+    Single keys are set with `key` and `value` and read or deleted with the
+    `key` query param. Many keys can be handled in one call by posting
+    `items` and passing the `keys` query param repeatedly, in which case GET
+    responds with a JSON object of each key to its value (null if missing).
+    `ttl` in seconds is optional for every key being set.
+
     Sample Usage:
     curl -X POST  http://localhost:3001/cache \
     -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
     -H "Content-Type: application/json" \
     -d '{"key": "key1", "value": "value1"}'
 
+    curl -X POST  http://localhost:3001/cache \
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx" \
+    -H "Content-Type: application/json" \
+    -d '{"items": [{"key": "key1", "value": "value1", "ttl": 3600}, ...]}'
+
     curl -X GET
     -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
     http://localhost:3001/cache?key=key1
+
+    curl -X GET
+    -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
+    http://localhost:3001/cache?keys=key1&keys=key2
     """
     bearer_token = get_token_from_auth_header(request)
     _, account_id = get_organization_from_bearer_token(bearer_token)
@@ -385,36 +516,52 @@ def cache() -> Any:
         payload: dict[Any, Any] | None = request.json
         if not payload:
             return Env.BAD_REQUEST, 400
-        key = payload.get("key")
-        value = payload.get("value")
-        if key is None or value is None:
+        items = payload.get("items")
+        if items is None:
+            items = [payload]
+        if not isinstance(items, list) or not items:
             return Env.BAD_REQUEST, 400
+        ttls: list[int | None] = []
+        for item in items:
+            if (
+                not isinstance(item, dict)
+                or item.get("key") is None
+                or item.get("value") is None
+            ):
+                return Env.BAD_REQUEST, 400
+            try:
+                ttls.append(_parse_cache_ttl(item.get("ttl")))
+            except ValueError:
+                return Env.BAD_REQUEST, 400
         try:
-            r = redis.Redis(
-                host=Env.REDIS_HOST,
-                port=Env.REDIS_PORT,
-                username=Env.REDIS_USERNAME,
-                password=Env.REDIS_PASSWORD,
-            )
-            redis_key = f"{account_id}:{key}"
-            r.set(redis_key, value)
-            r.close()
+            r = RedisHelper.get_client()
+            with r.pipeline(transaction=False) as pipe:
+                for item, ttl in zip(items, ttls, strict=True):
+                    redis_key = f"{account_id}:{item['key']}"
+                    if ttl:
+                        pipe.setex(redis_key, ttl, item["value"])
+                    else:
+                        pipe.set(redis_key, item["value"])
+                pipe.execute()
         except Exception as e:
             raise APIError(message=f"Error while caching data: {e}") from e
     elif request.method == "GET":
-        key = request.args.get("key")
+        keys = request.args.getlist("keys")
         try:
-            r = redis.Redis(
-                host=Env.REDIS_HOST,
-                port=Env.REDIS_PORT,
-                username=Env.REDIS_USERNAME,
-                password=Env.REDIS_PASSWORD,
-            )
+            r = RedisHelper.get_client()
+            if keys:
+                # Log only the action, not the potentially sensitive keys
+                app.logger.info(f"Getting {len(keys)} cached entries from Redis")
+                values = r.mget([f"{account_id}:{key}" for key in keys])
+                return {
+                    key: value.decode("utf-8") if value is not None else None
+                    for key, value in zip(keys, values, strict=True)
+                }, 200
+            key = request.args.get("key")
             redis_key = f"{account_id}:{key}"
             # Log only the action, not the potentially sensitive key
             app.logger.info("Getting cached data from Redis")
             value = r.get(redis_key)
-            r.close()
             if value is None:
                 return "Not Found", 404
             else:
@@ -422,19 +569,12 @@ def cache() -> Any:
         except Exception as e:
             raise APIError(message=f"Error while getting cached data: {e}") from e
     elif request.method == "DELETE":
-        key = request.args.get("key")
+        keys = request.args.getlist("keys") or [request.args.get("key")]
         try:
-            r = redis.Redis(
-                host=Env.REDIS_HOST,
-                port=Env.REDIS_PORT,
-                username=Env.REDIS_USERNAME,
-                password=Env.REDIS_PASSWORD,
-            )
-            redis_key = f"{account_id}:{key}"
+            r = RedisHelper.get_client()
             # Log only the action, not the potentially sensitive key
             app.logger.info("Deleting cached data from Redis")
-            r.delete(redis_key)
-            r.close()
+            r.delete(*[f"{account_id}:{key}" for key in keys])
             return "OK", 200
         except Exception as e:
             raise APIError(message=f"Error while deleting cached data: {e}") from e
@@ -466,6 +606,12 @@ def adapter_instance() -> Any:
     adapter_instance_id = request.args.get("adapter_instance_id")
 
     try:
+        cached_data, generation = AdapterConfigCache.get(
+            organization_uid, adapter_instance_id
+        )
+        if cached_data:
+            return jsonify(cached_data)
+
         data_dict = AdapterInstanceRequestHelper.get_adapter_instance_from_db(
             organization_id=organization_id,
             adapter_instance_id=adapter_instance_id,
@@ -477,6 +623,9 @@ def adapter_instance() -> Any:
         data_dict["adapter_metadata"] = json.loads(
             f.decrypt(bytes(data_dict.pop("adapter_metadata_b")).decode("utf-8"))
         )
+        AdapterConfigCache.put(
+            organization_uid, adapter_instance_id, data_dict, generation
+        )
 
         return jsonify(data_dict)
     except InvalidToken:
@@ -508,6 +657,9 @@ def custom_tool_instance() -> Any:
     curl -X GET
     -H "Authorization: 0xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
     http://localhost:3001/db/custom_tool_instance/prompt_registry_id=id1
+
+    The response carries the tool's version as its ETag. Requests sending it
+    back through `If-None-Match` receive a 304 if the tool is unchanged.
     """
     bearer_token = get_token_from_auth_header(request)
     _, organization_id = get_organization_from_bearer_token(bearer_token)
@@ -517,11 +669,24 @@ def custom_tool_instance() -> Any:
     prompt_registry_id = request.args.get("prompt_registry_id")
 
     try:
+        # Allow clients holding a copy of the exported tool to revalidate it
+        # without fetching the whole tool metadata again
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            version = PromptStudioRequestHelper.get_prompt_instance_version_from_db(
+                prompt_registry_id=prompt_registry_id
+            )
+            if version and if_none_match.strip('"') == version:
+                response = make_response("", 304)
+                response.set_etag(version)
+                return response
         data_dict = PromptStudioRequestHelper.get_prompt_instance_from_db(
             organization_id=organization_id,
             prompt_registry_id=prompt_registry_id,
         )
-        return jsonify(data_dict)
+        response = jsonify(data_dict)
+        response.set_etag(data_dict["version"])
+        return response
     except Exception as e:
         if isinstance(e, APIError):
             raise e
@@ -17,12 +17,32 @@ class Env:
     PG_BE_USERNAME = os.environ.get("PG_BE_USERNAME")
     PG_BE_PASSWORD = os.environ.get("PG_BE_PASSWORD")
     PG_BE_DATABASE = os.environ.get("PG_BE_DATABASE")
+    DB_POOL_MAX_CONNECTIONS = int(os.environ.get("DB_POOL_MAX_CONNECTIONS", 20))
+    DB_POOL_STALE_TIMEOUT_IN_SECOND = int(
+        os.environ.get("DB_POOL_STALE_TIMEOUT_IN_SECOND", 300)
+    )
+    PLATFORM_KEY_CACHE_TTL_IN_SECOND = int(
+        os.environ.get("PLATFORM_KEY_CACHE_TTL_IN_SECOND", 60)
+    )
+    PLATFORM_KEY_CACHE_MAX_ENTRIES = int(
+        os.environ.get("PLATFORM_KEY_CACHE_MAX_ENTRIES", 1000)
+    )
     ENCRYPTION_KEY = EnvManager.get_required_setting("ENCRYPTION_KEY")
     MODEL_PRICES_URL = EnvManager.get_required_setting("MODEL_PRICES_URL")
     MODEL_PRICES_TTL_IN_DAYS = int(
         EnvManager.get_required_setting("MODEL_PRICES_TTL_IN_DAYS")
     )
     MODEL_PRICES_FILE_PATH = EnvManager.get_required_setting("MODEL_PRICES_FILE_PATH")
+    MODEL_PRICES_REFRESH_INTERVAL_IN_SECOND = int(
+        os.environ.get("MODEL_PRICES_REFRESH_INTERVAL_IN_SECOND", 900)
+    )
+    ADAPTER_CONFIG_CACHE_TTL_IN_SECOND = int(
+        os.environ.get("ADAPTER_CONFIG_CACHE_TTL_IN_SECOND", 60)
+    )
+    ADAPTER_CONFIG_CACHE_MAX_ENTRIES = int(
+        os.environ.get("ADAPTER_CONFIG_CACHE_MAX_ENTRIES", 500)
+    )
+    USAGE_BATCH_MAX_RECORDS = int(os.environ.get("USAGE_BATCH_MAX_RECORDS", 1000))
     APPLICATION_NAME = EnvManager.get_required_setting(
         "APPLICATION_NAME", "unstract-platform-service"
     )
@@ -1,3 +1,3 @@
-from peewee import PostgresqlDatabase
+from playhouse.pool import PooledPostgresqlDatabase
 
-db = PostgresqlDatabase(None)
+db = PooledPostgresqlDatabase(None)
@@ -0,0 +1,107 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from unstract.platform_service.env import Env
+from unstract.platform_service.helper.redis_helper import RedisHelper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedAdapterConfig:
+    data: dict[str, Any]
+    generation: bytes | None
+    expires_at: float
+
+
+class AdapterConfigCache:
+    """Short lived in-process cache of decrypted adapter instances.
+
+    Entries are scoped to the organization that requested them, expire after
+    `ADAPTER_CONFIG_CACHE_TTL_IN_SECOND` and the least recently used ones are
+    evicted beyond `ADAPTER_CONFIG_CACHE_MAX_ENTRIES`. Decrypted configs never
+    leave the process, Redis only holds a generation counter per adapter which
+    the backend bumps whenever the adapter is saved or deleted. Setting the
+    TTL to 0 disables the cache.
+    """
+
+    GENERATION_KEY_PREFIX = "adapter_instance:generation"
+
+    _entries: OrderedDict[tuple[Any, str], CachedAdapterConfig] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return (
+            Env.ADAPTER_CONFIG_CACHE_TTL_IN_SECOND > 0
+            and Env.ADAPTER_CONFIG_CACHE_MAX_ENTRIES > 0
+        )
+
+    @classmethod
+    def get_generation(cls, adapter_instance_id: str) -> bytes | None:
+        """Returns the current generation of an adapter instance.
+
+        Raises:
+            redis.RedisError: If the generation could not be read
+        """
+        return RedisHelper.get_client().get(
+            f"{cls.GENERATION_KEY_PREFIX}:{adapter_instance_id}"
+        )
+
+    @classmethod
+    def get(
+        cls, organization_uid: Any, adapter_instance_id: str
+    ) -> tuple[dict[str, Any] | None, bytes | None]:
+        """Returns the cached adapter instance if it is still current.
+
+        Args:
+            organization_uid (Any): Organization requesting the adapter
+            adapter_instance_id (str): Adapter instance ID
+
+        Returns:
+            tuple[dict[str, Any] | None, bytes | None]: Cached adapter instance
+                if any, and the generation to cache a fresh one with
+        """
+        if not cls.is_enabled():
+            return None, None
+        try:
+            generation = cls.get_generation(adapter_instance_id)
+        except Exception as e:
+            logger.warning(f"Unable to read adapter instance generation: {e}")
+            return None, None
+        key = (organization_uid, adapter_instance_id)
+        with cls._lock:
+            cached = cls._entries.get(key)
+            if not cached:
+                return None, generation
+            if cached.generation != generation or cached.expires_at <= time.monotonic():
+                del cls._entries[key]
+                return None, generation
+            cls._entries.move_to_end(key)
+            return cached.data, generation
+
+    @classmethod
+    def put(
+        cls,
+        organization_uid: Any,
+        adapter_instance_id: str,
+        data: dict[str, Any],
+        generation: bytes | None,
+    ) -> None:
+        """Caches a decrypted adapter instance read at the given generation."""
+        if not cls.is_enabled():
+            return
+        key = (organization_uid, adapter_instance_id)
+        with cls._lock:
+            cls._entries[key] = CachedAdapterConfig(
+                data=data,
+                generation=generation,
+                expires_at=time.monotonic() + Env.ADAPTER_CONFIG_CACHE_TTL_IN_SECOND,
+            )
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > Env.ADAPTER_CONFIG_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
@@ -27,10 +27,9 @@ class AdapterInstanceRequestHelper:
         query = (
             "SELECT id, adapter_id, adapter_name, adapter_type, adapter_metadata_b"
             f' FROM "{DB_SCHEMA}".{DBTable.ADAPTER_INSTANCE} x '
-            f"WHERE id='{adapter_instance_id}' and "
-            f"organization_id='{organization_uid}'"
+            "WHERE id=%s and organization_id=%s"
         )
-        cursor = db.execute_sql(query)
+        cursor = db.execute_sql(query, (adapter_instance_id, organization_uid))
         result_row = cursor.fetchone()
         if not result_row:
             raise APIError(message=f"Adapter '{adapter_instance_id}' not found", code=404)
@@ -1,17 +1,35 @@
 import json
+import logging
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import requests
-from flask import current_app as app
 
 from unstract.platform_service.env import Env
 from unstract.platform_service.utils import format_float_positional
 from unstract.sdk.exceptions import FileStorageError
 from unstract.sdk.file_storage import EnvHelper, StorageType
 
+logger = logging.getLogger(__name__)
+
 
 class CostCalculationHelper:
+    """Calculates the cost of LLM and embedding usage from model prices.
+
+    Prices are loaded once per process through `get_instance()` and kept in
+    memory. A background thread checks the price file every
+    `MODEL_PRICES_REFRESH_INTERVAL_IN_SECOND` and reloads it when it was
+    modified or its TTL expired. Matches of a model and provider are memoized
+    per price table, so repeated lookups don't scan every model.
+    """
+
+    MAX_MEMOIZED_MODELS = 10000
+
+    _instance: "CostCalculationHelper | None" = None
+    _instance_lock = threading.Lock()
+
     def __init__(
         self,
         url: str = Env.MODEL_PRICES_URL,
@@ -21,16 +39,18 @@ class CostCalculationHelper:
         self.ttl_days = ttl_days
         self.url = url
         self.file_path = file_path
+        self.file_mtime: datetime | None = None
+        self.model_lookup: dict[tuple[str, str], dict[str, Any] | None] = {}
 
         try:
             self.file_storage = EnvHelper.get_storage(
                 StorageType.PERMANENT, "FILE_STORAGE_CREDENTIALS"
             )
         except KeyError as e:
-            app.logger.error(f"Required credentials is missing in the env: {str(e)}")
+            logger.error(f"Required credentials is missing in the env: {str(e)}")
             raise e
         except FileStorageError as e:
-            app.logger.error(
+            logger.error(
                 "Error while initialising storage: %s",
                 e,
                 stack_info=True,
@@ -40,23 +60,87 @@ class CostCalculationHelper:
 
         self.model_token_data = self._get_model_token_data()
 
+    @classmethod
+    def get_instance(cls) -> "CostCalculationHelper":
+        """Returns the helper shared by the process.
+
+        The first call loads the model prices and starts refreshing them in
+        the background.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = cls()
+                    instance._start_refresher()
+                    cls._instance = instance
+        return cls._instance
+
+    def _start_refresher(self) -> None:
+        interval = Env.MODEL_PRICES_REFRESH_INTERVAL_IN_SECOND
+        if interval <= 0:
+            return
+
+        def refresh_periodically() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.warning(f"Error while refreshing model prices: {e}")
+
+        threading.Thread(
+            target=refresh_periodically, name="model-prices-refresher", daemon=True
+        ).start()
+
+    def refresh(self) -> None:
+        """Reloads the model prices if the price file changed or expired."""
+        if self.model_token_data and not self._is_file_stale():
+            return
+        model_token_data = self._get_model_token_data()
+        if model_token_data:
+            # Swap the table before its lookups so that concurrent readers
+            # never memoize matches of the old table into the new lookups
+            self.model_token_data = model_token_data
+            self.model_lookup = {}
+
+    def _is_file_stale(self) -> bool:
+        if not self.file_storage.exists(self.file_path):
+            return True
+        file_mtime = self.file_storage.modification_time(self.file_path)
+        if file_mtime != self.file_mtime:
+            return True
+        file_expiry_date_utc = (file_mtime + timedelta(days=self.ttl_days)).replace(
+            tzinfo=UTC
+        )
+        return datetime.now().replace(tzinfo=UTC) >= file_expiry_date_utc
+
+    def _find_model(self, model_name: str, provider: str) -> dict[str, Any] | None:
+        model_lookup = self.model_lookup
+        key = (model_name, provider)
+        if key in model_lookup:
+            return model_lookup[key]
+        item = None
+        # Filter the model objects by model name and check if the lite llm
+        # provider contains the given provider
+        for model, model_info in self.model_token_data.items():
+            if model.endswith(model_name) and provider in model_info.get(
+                "litellm_provider", ""
+            ):
+                item = model_info
+                break
+        if len(model_lookup) >= self.MAX_MEMOIZED_MODELS:
+            model_lookup.clear()
+        model_lookup[key] = item
+        return item
+
     def calculate_cost(
         self, model_name: str, provider: str, input_tokens: int, output_tokens: int
     ) -> str:
         cost = 0.0
-        item = None
 
         if not self.model_token_data:
             return json.loads(format_float_positional(cost))
-        # Filter the model objects by model name
-        filtered_models = {
-            k: v for k, v in self.model_token_data.items() if k.endswith(model_name)
-        }
-        # Check if the lite llm provider starts with the given provider
-        for _, model_info in filtered_models.items():
-            if provider in model_info.get("litellm_provider", ""):
-                item = model_info
-                break
+        item = self._find_model(model_name=model_name, provider=provider)
         if item:
             input_cost_per_token = item.get("input_cost_per_token", 0)
             output_cost_per_token = item.get("output_cost_per_token", 0)
@@ -71,12 +155,13 @@ class CostCalculationHelper:
                 return self._fetch_and_save_json()
 
             file_mtime = self.file_storage.modification_time(self.file_path)
+            self.file_mtime = file_mtime
             file_expiry_date = file_mtime + timedelta(days=self.ttl_days)
             file_expiry_date_utc = file_expiry_date.replace(tzinfo=UTC)
             now_utc = datetime.now().replace(tzinfo=UTC)
 
             if now_utc < file_expiry_date_utc:
-                app.logger.info(f"Reading model token data from {self.file_path}")
+                logger.info(f"Reading model token data from {self.file_path}")
                 # File exists and TTL has not expired, read and return content
                 file_contents = self.file_storage.read(
                     self.file_path, mode="r", encoding="utf-8"
@@ -86,7 +171,7 @@ class CostCalculationHelper:
                 # TTL expired, fetch updated JSON data from API
                 return self._fetch_and_save_json()
         except Exception as e:
-            app.logger.warning(
+            logger.warning(
                 "Error in calculate_cost: %s", e, stack_info=True, exc_info=True
             )
             return None
@@ -111,14 +196,15 @@ class CostCalculationHelper:
                 ensure_ascii=False,
                 indent=4,
             )
-            app.logger.info(
+            self.file_mtime = self.file_storage.modification_time(self.file_path)
+            logger.info(
                 "File '%s' updated successfully with TTL set to %d days.",
                 self.file_path,
                 self.ttl_days,
             )
             return json_data
         except Exception as e:
-            app.logger.error(
+            logger.error(
                 "Error fetching data from API: %s", e, stack_info=True, exc_info=True
             )
             return None
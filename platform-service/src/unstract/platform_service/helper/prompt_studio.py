@@ -1,3 +1,5 @@
+import hashlib
+from datetime import datetime
 from typing import Any
 
 from unstract.core.flask.exceptions import APIError
@@ -21,15 +23,15 @@ class PromptStudioRequestHelper:
             prompt_registry_id (str): prompt_registry_id
 
         Returns:
-            _type_: _description_
+            dict[str, Any]: Exported tool along with its `version`
         """
         query = (
             "SELECT prompt_registry_id, tool_spec, "
-            "tool_metadata, tool_property FROM "
+            "tool_metadata, tool_property, modified_at FROM "
             f'"{DB_SCHEMA}".{DBTable.PROMPT_STUDIO_REGISTRY} x '
-            f"WHERE prompt_registry_id='{prompt_registry_id}'"
+            "WHERE prompt_registry_id=%s"
         )
-        cursor = db.execute_sql(query)
+        cursor = db.execute_sql(query, (prompt_registry_id,))
         result_row = cursor.fetchone()
         if not result_row:
             raise APIError(
@@ -39,4 +41,47 @@ class PromptStudioRequestHelper:
         columns = [desc[0] for desc in cursor.description]
         data_dict: dict[str, Any] = dict(zip(columns, result_row, strict=False))
         cursor.close()
+        modified_at = data_dict.pop("modified_at")
+        data_dict["version"] = PromptStudioRequestHelper.get_prompt_instance_version(
+            prompt_registry_id=prompt_registry_id, modified_at=modified_at
+        )
         return data_dict
+
+    @staticmethod
+    def get_prompt_instance_version_from_db(prompt_registry_id: str) -> str | None:
+        """Get the version of an exported prompt studio tool.
+
+        This only reads the modification time of the registry entry, which is
+        far cheaper than fetching its tool metadata.
+
+        Args:
+            prompt_registry_id (str): prompt_registry_id
+
+        Returns:
+            str | None: Version of the exported tool, None if it doesn't exist
+        """
+        query = (
+            f'SELECT modified_at FROM "{DB_SCHEMA}".{DBTable.PROMPT_STUDIO_REGISTRY} '
+            "WHERE prompt_registry_id=%s"
+        )
+        cursor = db.execute_sql(query, (prompt_registry_id,))
+        result_row = cursor.fetchone()
+        cursor.close()
+        if not result_row:
+            return None
+        return PromptStudioRequestHelper.get_prompt_instance_version(
+            prompt_registry_id=prompt_registry_id, modified_at=result_row[0]
+        )
+
+    @staticmethod
+    def get_prompt_instance_version(
+        prompt_registry_id: str, modified_at: datetime
+    ) -> str:
+        """Derives the version (used as ETag) of an exported tool.
+
+        The registry entry is updated on every export, so its modification
+        time identifies the exported tool's contents.
+        """
+        return hashlib.sha256(
+            f"{prompt_registry_id}:{modified_at.isoformat()}".encode()
+        ).hexdigest()
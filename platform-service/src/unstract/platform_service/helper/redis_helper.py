@@ -0,0 +1,26 @@
+import redis
+
+from unstract.platform_service.env import Env
+
+
+class RedisHelper:
+    _client: redis.Redis | None = None
+
+    @classmethod
+    def get_client(cls) -> redis.Redis:
+        """Returns a Redis client shared by the process.
+
+        The client keeps a pool of connections, so it is safe to use across
+        requests without connecting on every call.
+
+        Returns:
+            redis.Redis: Client configured from the `REDIS_*` env variables
+        """
+        if cls._client is None:
+            cls._client = redis.Redis(
+                host=Env.REDIS_HOST,
+                port=Env.REDIS_PORT,
+                username=Env.REDIS_USERNAME,
+                password=Env.REDIS_PASSWORD,
+            )
+        return cls._client
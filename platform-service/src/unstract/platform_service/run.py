@@ -14,6 +14,6 @@ def before_request() -> None:
 
 @app.teardown_request
 def after_request(exception: Any) -> None:
-    # Close the connection after each request
+    # Return the connection to the pool after each request
     if not db.is_closed():
         db.close()
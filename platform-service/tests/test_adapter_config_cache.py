@@ -0,0 +1,105 @@
+import unittest
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+from unstract.platform_service.helper import adapter_config_cache
+from unstract.platform_service.helper.adapter_config_cache import AdapterConfigCache
+
+ADAPTER_ID = "adapter-1"
+GENERATION_KEY = f"{AdapterConfigCache.GENERATION_KEY_PREFIX}:{ADAPTER_ID}"
+CONFIG = {"id": ADAPTER_ID, "adapter_metadata": {"api_key": "secret"}}
+
+
+class AdapterConfigCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        # Generation counters the backend bumps on save / delete
+        self.generations: dict[str, bytes] = {GENERATION_KEY: b"1"}
+        redis_client = MagicMock()
+        redis_client.get.side_effect = self.generations.get
+        patchers = [
+            patch.object(AdapterConfigCache, "_entries", OrderedDict()),
+            patch.object(
+                adapter_config_cache.Env, "ADAPTER_CONFIG_CACHE_TTL_IN_SECOND", 60
+            ),
+            patch.object(adapter_config_cache.Env, "ADAPTER_CONFIG_CACHE_MAX_ENTRIES", 2),
+            patch.object(
+                adapter_config_cache.RedisHelper, "get_client", return_value=redis_client
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        monotonic_patcher = patch.object(adapter_config_cache.time, "monotonic")
+        self.monotonic = monotonic_patcher.start()
+        self.monotonic.return_value = 1000.0
+        self.addCleanup(monotonic_patcher.stop)
+
+    def cache(self, organization_uid: int = 1, adapter_instance_id: str = ADAPTER_ID):
+        _, generation = AdapterConfigCache.get(organization_uid, adapter_instance_id)
+        AdapterConfigCache.put(organization_uid, adapter_instance_id, CONFIG, generation)
+
+    def test_cached_config_is_returned(self) -> None:
+        self.cache()
+
+        self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID), (CONFIG, b"1"))
+
+    def test_cached_config_expires(self) -> None:
+        self.cache()
+
+        self.monotonic.return_value = 1000.0 + 59
+        self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID)[0], CONFIG)
+        self.monotonic.return_value = 1000.0 + 60
+        self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID), (None, b"1"))
+        self.assertFalse(AdapterConfigCache._entries)
+
+    def test_cached_config_is_scoped_to_organization(self) -> None:
+        self.cache(organization_uid=1)
+
+        self.assertEqual(AdapterConfigCache.get(2, ADAPTER_ID), (None, b"1"))
+        self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID)[0], CONFIG)
+
+    def test_saved_adapter_invalidates_cached_config(self) -> None:
+        self.cache()
+
+        self.generations[GENERATION_KEY] = b"2"
+
+        self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID), (None, b"2"))
+        self.assertFalse(AdapterConfigCache._entries)
+
+    def test_config_read_before_save_is_not_served_after_it(self) -> None:
+        _, generation = AdapterConfigCache.get(1, ADAPTER_ID)
+        # Saved while the stale config was read from the database
+        self.generations[GENERATION_KEY] = b"2"
+        AdapterConfigCache.put(1, ADAPTER_ID, CONFIG, generation)
+
+        self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID), (None, b"2"))
+
+    def test_least_recently_used_config_is_evicted(self) -> None:
+        for adapter_instance_id in ("adapter-1", "adapter-2"):
+            self.cache(adapter_instance_id=adapter_instance_id)
+        AdapterConfigCache.get(1, "adapter-1")
+
+        self.cache(adapter_instance_id="adapter-3")
+
+        self.assertEqual(
+            [key[1] for key in AdapterConfigCache._entries], ["adapter-1", "adapter-3"]
+        )
+
+    def test_unreadable_generation_bypasses_cache(self) -> None:
+        self.cache()
+        adapter_config_cache.RedisHelper.get_client().get.side_effect = ConnectionError
+
+        self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID), (None, None))
+
+    def test_disabled_cache(self) -> None:
+        with patch.object(
+            adapter_config_cache.Env, "ADAPTER_CONFIG_CACHE_TTL_IN_SECOND", 0
+        ):
+            self.cache()
+
+            self.assertEqual(AdapterConfigCache.get(1, ADAPTER_ID), (None, None))
+        self.assertFalse(AdapterConfigCache._entries)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from flask import Flask
+
+from unstract.platform_service.controller import platform
+from unstract.platform_service.controller.platform import platform_bp
+
+HEADERS = {"Authorization": "Bearer platform-key"}
+
+
+class CacheEndpointTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.redis_client = MagicMock()
+        self.pipe = self.redis_client.pipeline.return_value.__enter__.return_value
+        patchers = [
+            patch.object(platform, "validate_bearer_token", return_value=True),
+            patch.object(
+                platform,
+                "get_organization_from_bearer_token",
+                return_value=(1, "org"),
+            ),
+            patch.object(
+                platform.RedisHelper, "get_client", return_value=self.redis_client
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        app = Flask(__name__)
+        app.register_blueprint(platform_bp)
+        self.client = app.test_client()
+
+    def post(self, payload: dict):
+        return self.client.post("/cache", json=payload, headers=HEADERS)
+
+    def test_set_many_keys(self) -> None:
+        response = self.post(
+            {
+                "items": [
+                    {"key": "key1", "value": "value1", "ttl": 3600},
+                    {"key": "key2", "value": "value2", "ttl": "60"},
+                    {"key": "key3", "value": "value3"},
+                ]
+            }
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.pipe.mock_calls,
+            [
+                call.setex("org:key1", 3600, "value1"),
+                call.setex("org:key2", 60, "value2"),
+                call.set("org:key3", "value3"),
+                call.execute(),
+            ],
+        )
+
+    def test_get_many_keys(self) -> None:
+        self.redis_client.mget.return_value = [b"value1", b"value3", None]
+
+        response = self.client.get(
+            "/cache?keys=key1&keys=key3&keys=missing", headers=HEADERS
+        )
+
+        self.redis_client.mget.assert_called_once_with(
+            ["org:key1", "org:key3", "org:missing"]
+        )
+        self.assertEqual(
+            response.json, {"key1": "value1", "key3": "value3", "missing": None}
+        )
+
+    def test_invalid_ttl(self) -> None:
+        for ttl in ("one hour", -1, 1.5, True, [60]):
+            with self.subTest(ttl=ttl):
+                response = self.post(
+                    {
+                        "items": [
+                            {"key": "key1", "value": "value1"},
+                            {"key": "key2", "value": "value2", "ttl": ttl},
+                        ]
+                    }
+                )
+
+                self.assertEqual(response.status_code, 400)
+                # Nothing of the batch is cached
+                self.redis_client.pipeline.assert_not_called()
+
+    def test_invalid_single_key_ttl(self) -> None:
+        response = self.post({"key": "key1", "value": "value1", "ttl": "soon"})
+
+        self.assertEqual(response.status_code, 400)
+        self.redis_client.pipeline.assert_not_called()
+
+    def test_zero_ttl_does_not_expire(self) -> None:
+        response = self.post({"key": "key1", "value": "value1", "ttl": 0})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.pipe.mock_calls, [call.set("org:key1", "value1"), call.execute()]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
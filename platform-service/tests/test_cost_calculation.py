@@ -0,0 +1,164 @@
+import json
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from unstract.platform_service.helper import cost_calculation
+from unstract.platform_service.helper.cost_calculation import CostCalculationHelper
+
+PRICES = {
+    "gpt-4o": {
+        "litellm_provider": "openai",
+        "input_cost_per_token": 0.5,
+        "output_cost_per_token": 1.0,
+    },
+    "azure/gpt-4o": {
+        "litellm_provider": "azure",
+        "input_cost_per_token": 0.25,
+        "output_cost_per_token": 0.5,
+    },
+}
+NEW_PRICES = {
+    "gpt-4o": {
+        "litellm_provider": "openai",
+        "input_cost_per_token": 2.0,
+        "output_cost_per_token": 4.0,
+    },
+}
+
+
+class CostCalculationHelperTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.file_storage = MagicMock()
+        self.file_storage.exists.return_value = True
+        self.file_storage.modification_time.return_value = datetime.now()
+        self.file_storage.read.return_value = json.dumps(PRICES)
+        patchers = [
+            patch.object(
+                cost_calculation.EnvHelper,
+                "get_storage",
+                return_value=self.file_storage,
+            ),
+            patch.object(CostCalculationHelper, "_instance", None),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.helper = CostCalculationHelper(
+            url="http://prices", ttl_days=7, file_path="cost/model_prices.json"
+        )
+
+    def calculate_cost(self, provider: str = "openai") -> str:
+        return self.helper.calculate_cost(
+            model_name="gpt-4o", provider=provider, input_tokens=2, output_tokens=1
+        )
+
+    def test_calculate_cost(self) -> None:
+        self.assertEqual(self.calculate_cost(), "2")
+        self.assertEqual(self.calculate_cost(provider="azure"), "1")
+        self.assertEqual(
+            self.helper.calculate_cost(
+                model_name="unknown", provider="openai", input_tokens=1, output_tokens=1
+            ),
+            "0",
+        )
+
+    def test_model_matches_are_memoized(self) -> None:
+        with patch.object(self.helper, "model_token_data", wraps=PRICES) as prices:
+            for _ in range(3):
+                self.calculate_cost()
+
+        # The price table is scanned only for the first lookup
+        prices.items.assert_called_once()
+        self.assertEqual(
+            self.helper.model_lookup, {("gpt-4o", "openai"): PRICES["gpt-4o"]}
+        )
+
+    def test_memoized_models_are_bounded(self) -> None:
+        with patch.object(CostCalculationHelper, "MAX_MEMOIZED_MODELS", 2):
+            for provider in ("openai", "azure", "other"):
+                self.calculate_cost(provider=provider)
+
+        self.assertEqual(list(self.helper.model_lookup), [("gpt-4o", "other")])
+
+    def test_refresh_reloads_modified_prices(self) -> None:
+        self.assertEqual(self.calculate_cost(), "2")
+
+        self.file_storage.modification_time.return_value = datetime.now() + timedelta(
+            seconds=1
+        )
+        self.file_storage.read.return_value = json.dumps(NEW_PRICES)
+        self.helper.refresh()
+
+        self.assertEqual(self.helper.model_token_data, NEW_PRICES)
+        # Matches of the old table are not served for the new one
+        self.assertEqual(self.calculate_cost(), "8")
+
+    def test_refresh_keeps_unmodified_prices(self) -> None:
+        self.calculate_cost()
+        model_lookup = self.helper.model_lookup
+
+        self.helper.refresh()
+
+        self.file_storage.read.assert_called_once()
+        self.assertIs(self.helper.model_lookup, model_lookup)
+
+    def test_refresh_keeps_prices_when_reload_fails(self) -> None:
+        self.file_storage.modification_time.return_value = datetime.now() + timedelta(
+            seconds=1
+        )
+        self.file_storage.read.side_effect = OSError("Storage unavailable")
+
+        self.helper.refresh()
+
+        self.assertEqual(self.helper.model_token_data, PRICES)
+        self.assertEqual(self.calculate_cost(), "2")
+
+    def test_instance_is_shared(self) -> None:
+        with patch.object(CostCalculationHelper, "_start_refresher") as start_refresher:
+            instance = CostCalculationHelper.get_instance()
+
+            self.assertIs(CostCalculationHelper.get_instance(), instance)
+        start_refresher.assert_called_once()
+        # Once for the helper of `setUp()` and once for the shared one
+        self.assertEqual(self.file_storage.read.call_count, 2)
+
+    def test_refresher_keeps_refreshing_after_errors(self) -> None:
+        class StopRefresher(Exception):
+            pass
+
+        with patch.object(cost_calculation.threading, "Thread") as thread:
+            self.helper._start_refresher()
+        refresh_periodically = thread.call_args.kwargs["target"]
+        self.assertTrue(thread.call_args.kwargs["daemon"])
+
+        with (
+            patch.object(
+                cost_calculation.time, "sleep", side_effect=[None, None, StopRefresher]
+            ) as sleep,
+            patch.object(
+                self.helper, "refresh", side_effect=[RuntimeError("Refresh failed"), None]
+            ) as refresh,
+            self.assertRaises(StopRefresher),
+        ):
+            refresh_periodically()
+
+        sleep.assert_called_with(
+            cost_calculation.Env.MODEL_PRICES_REFRESH_INTERVAL_IN_SECOND
+        )
+        self.assertEqual(refresh.call_count, 2)
+
+    def test_refresher_is_not_started_when_disabled(self) -> None:
+        with (
+            patch.object(
+                cost_calculation.Env, "MODEL_PRICES_REFRESH_INTERVAL_IN_SECOND", 0
+            ),
+            patch.object(cost_calculation.threading, "Thread") as thread,
+        ):
+            CostCalculationHelper.get_instance()
+
+        thread.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from unstract.platform_service.controller import platform
+from unstract.platform_service.controller.platform import USAGE_COLUMNS, platform_bp
+
+HEADERS = {"Authorization": "Bearer platform-key"}
+
+
+def usage_record(run_id: str, **kwargs) -> dict:
+    return {
+        "workflow_id": "workflow",
+        "execution_id": "execution",
+        "adapter_instance_id": "adapter",
+        "run_id": run_id,
+        "usage_type": "llm",
+        "llm_usage_reason": "extraction",
+        "model_name": "gpt-4o",
+        "provider": "openai",
+        "prompt_tokens": 10,
+        "completion_tokens": 5,
+        "total_tokens": 15,
+        **kwargs,
+    }
+
+
+class UsageBatchEndpointTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.db = MagicMock()
+        self.cost_calculation_helper = MagicMock()
+        self.cost_calculation_helper.calculate_cost.return_value = "0.5"
+        patchers = [
+            patch.object(platform, "validate_bearer_token", return_value=True),
+            patch.object(
+                platform,
+                "get_organization_from_bearer_token",
+                return_value=(1, "org"),
+            ),
+            patch.object(platform, "db", self.db),
+            patch.object(
+                platform.CostCalculationHelper,
+                "get_instance",
+                return_value=self.cost_calculation_helper,
+            ),
+            patch.object(platform.Env, "USAGE_BATCH_MAX_RECORDS", 3),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        app = Flask(__name__)
+        app.register_blueprint(platform_bp)
+        self.client = app.test_client()
+
+    def post(self, payload):
+        return self.client.post("/usage/batch", json=payload, headers=HEADERS)
+
+    def test_usages_are_inserted_with_one_statement(self) -> None:
+        response = self.post(
+            {
+                "usages": [
+                    usage_record("run-1"),
+                    usage_record("run-2", usage_type="embedding", embedding_tokens=20),
+                ]
+            }
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["status"], "OK")
+        self.db.execute_sql.assert_called_once()
+        self.db.atomic.assert_called_once()
+        query, params = self.db.execute_sql.call_args.args
+        self.assertEqual(query.count("(%s"), 2)
+        self.assertEqual(len(params), 2 * len(USAGE_COLUMNS))
+        rows = [
+            dict(zip(USAGE_COLUMNS, params[i : i + len(USAGE_COLUMNS)], strict=True))
+            for i in range(0, len(params), len(USAGE_COLUMNS))
+        ]
+        self.assertEqual(response.json["unique_ids"], [str(row["id"]) for row in rows])
+        self.assertEqual([row["run_id"] for row in rows], ["run-1", "run-2"])
+        self.assertEqual({row["organization_id"] for row in rows}, {1})
+        self.assertEqual({row["cost_in_dollars"] for row in rows}, {"0.5"})
+        # Embedding usage is priced by its embedding tokens
+        self.assertEqual(
+            [
+                c.kwargs["input_tokens"]
+                for c in self.cost_calculation_helper.calculate_cost.call_args_list
+            ],
+            [10, 20],
+        )
+
+    def test_batch_within_limit(self) -> None:
+        response = self.post({"usages": [usage_record(f"run-{i}") for i in range(3)]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json["unique_ids"]), 3)
+
+    def test_batch_over_limit_is_rejected(self) -> None:
+        response = self.post({"usages": [usage_record(f"run-{i}") for i in range(4)]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json["error"], "Batch exceeds the limit of 3 usage records"
+        )
+        self.db.execute_sql.assert_not_called()
+
+    def test_invalid_payloads_are_rejected(self) -> None:
+        for payload in (
+            {},
+            {"usages": []},
+            {"usages": {"run_id": "run-1"}},
+            {"usages": [usage_record("run-1"), "run-2"]},
+            {"usages": [usage_record("run-1"), {}]},
+        ):
+            with self.subTest(payload=payload):
+                response = self.post(payload)
+
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json["error"], platform.Env.INVALID_PAYLOAD)
+        self.db.execute_sql.assert_not_called()
+
+    def test_failed_insert(self) -> None:
+        self.db.execute_sql.side_effect = Exception("Database is down")
+
+        response = self.post({"usages": [usage_record("run-1")]})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json["unique_ids"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 """Published API Controller"""
 
+import sys
 from typing import Any
 
 from flask import Blueprint, request
@@ -13,6 +14,7 @@ from unstract.prompt_service.helpers.auth import AuthHelper
 from unstract.prompt_service.helpers.plugin import PluginManager
 from unstract.prompt_service.helpers.prompt_ide_base_tool import PromptServiceBaseTool
 from unstract.prompt_service.helpers.usage import UsageHelper
+from unstract.prompt_service.helpers.vector_db_pool import VectorDBPool
 from unstract.prompt_service.services.answer_prompt import AnswerPromptService
 from unstract.prompt_service.services.retrieval import RetrievalService
 from unstract.prompt_service.services.variable_replacement import (
@@ -25,7 +27,6 @@ from unstract.sdk.embedding import Embedding
 from unstract.sdk.exceptions import SdkError
 from unstract.sdk.index import Index
 from unstract.sdk.llm import LLM
-from unstract.sdk.vector_db import VectorDB
 
 answer_prompt_bp = Blueprint("answer-prompt", __name__)
 
@@ -74,6 +75,14 @@ def prompt_processor() -> Any:
             PSKeys.REQUIRED, None
         )
 
+    # Embed queries known upfront in one batch per embedding adapter
+    query_embeddings = RetrievalService.precompute_query_embeddings(
+        prompts=prompts,
+        variable_names=variable_names,
+        util=PromptServiceBaseTool(platform_key=platform_key),
+        usage_kwargs={"run_id": run_id, "execution_id": execution_id},
+    )
+
     for output in prompts:  # type:ignore
         prompt_name = output[PSKeys.NAME]
         prompt_text = output[PSKeys.PROMPT]
@@ -150,8 +159,9 @@ def prompt_processor() -> Any:
                 usage_kwargs=usage_kwargs.copy(),
             )
 
-            vector_db = VectorDB(
+            vector_db = VectorDBPool.acquire(
                 tool=util,
+                platform_key=platform_key,
                 adapter_instance_id=output[PSKeys.VECTOR_DB],
                 embedding=embedding,
             )
@@ -180,6 +190,7 @@ def prompt_processor() -> Any:
                     execution_source=execution_source,
                     prompt=prompt_text,
                 )
+                VectorDBPool.release(vector_db)
                 metadata = UsageHelper.query_usage_metadata(
                     token=platform_key, metadata=metadata
                 )
@@ -218,6 +229,7 @@ def prompt_processor() -> Any:
                     metadata=metadata,
                     execution_source=execution_source,
                 )
+                VectorDBPool.release(vector_db)
                 continue
             except APIError as e:
                 app.logger.error(
@@ -256,6 +268,7 @@ def prompt_processor() -> Any:
 
             if retrieval_strategy in {PSKeys.SIMPLE, PSKeys.SUBQUESTION}:
                 app.logger.info(f"[{tool_id}] Performing retrieval for : {file_path}")
+                query, query_embedding = query_embeddings.get(prompt_name, (None, None))
                 answer, context = RetrievalService.perform_retrieval(
                     tool_settings=tool_settings,
                     output=output,
@@ -268,6 +281,9 @@ def prompt_processor() -> Any:
                     execution_source=execution_source,
                     file_path=file_path,
                     context_retrieval_metrics=context_retrieval_metrics,
+                    query_embedding=(
+                        query_embedding if query == output[PSKeys.PROMPTX] else None
+                    ),
                 )
                 metadata[PSKeys.CONTEXT][output[PSKeys.NAME]] = context
             else:
@@ -542,7 +558,8 @@ def prompt_processor() -> Any:
                     **challenge_metrics,
                 }
             )
-            vector_db.close()
+            # Clients are pooled for reuse unless an error occurred
+            VectorDBPool.release(vector_db, discard=sys.exc_info()[0] is not None)
     publish_log(
         log_events_id,
         {"tool_id": tool_id, "doc_name": doc_name},
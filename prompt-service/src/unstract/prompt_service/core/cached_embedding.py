@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import os
+from array import array
+from typing import ClassVar
+
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+from llama_index.core.callbacks import CallbackManager
+from pydantic import Field
+
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model which caches the embeddings of text chunks in Redis.
+
+    Chunks are keyed by the hash of their text along with a fingerprint of
+    the wrapped embedding model, so reindexing a document only embeds chunks
+    which changed. Only chunks missing from the cache are sent to the wrapped
+    model, whose callbacks alone capture usage. Query embeddings are not
+    cached.
+
+    Vectors are stored as float32 to halve their size in Redis. The cache is
+    disabled unless `CHUNK_EMBEDDING_CACHE_TTL_IN_SECOND` is set.
+    """
+
+    KEY_PREFIX: ClassVar[str] = "chunk_embedding_f32"
+    TTL_IN_SECOND: ClassVar[int] = int(
+        os.environ.get("CHUNK_EMBEDDING_CACHE_TTL_IN_SECOND", 0)
+    )
+
+    embedding: BaseEmbedding = Field(description="Wrapped embedding model.")
+    fingerprint: str = Field(description="Fingerprint of the embedding model.")
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.TTL_IN_SECOND > 0
+
+    @classmethod
+    def wrap(cls, embedding: BaseEmbedding, adapter_instance_id: str) -> BaseEmbedding:
+        """Wraps an embedding model with the chunk embedding cache.
+
+        Args:
+            embedding (BaseEmbedding): Embedding model of the adapter
+            adapter_instance_id (str): Embedding adapter instance ID
+
+        Returns:
+            BaseEmbedding: The cached model, or the model itself if the cache
+                is disabled
+        """
+        if not cls.is_enabled() or isinstance(embedding, cls):
+            return embedding
+        return cls(
+            embedding=embedding,
+            fingerprint=cls.get_fingerprint(embedding, adapter_instance_id),
+            model_name=embedding.model_name,
+            embed_batch_size=embedding.embed_batch_size,
+            num_workers=embedding.num_workers,
+            # Usage is recorded by the wrapped model for the chunks it embeds
+            callback_manager=CallbackManager([]),
+        )
+
+    @staticmethod
+    def get_fingerprint(embedding: BaseEmbedding, adapter_instance_id: str) -> str:
+        """Fingerprints the adapter and the configuration of its model."""
+        try:
+            config = embedding.to_dict()
+        except Exception:
+            config = {"model_name": embedding.model_name}
+        config["class_name"] = type(embedding).__name__
+        config["adapter_instance_id"] = adapter_instance_id
+        return hashlib.sha256(
+            json.dumps(config, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def _get_key(self, text: str) -> str:
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{self.fingerprint}:{text_hash}"
+
+    def _get_cached(self, texts: list[str]) -> list[Embedding | None]:
+        try:
+            values = RedisUtils.get_client().mget([self._get_key(t) for t in texts])
+        except Exception as e:
+            logger.warning(f"Unable to read chunk embeddings from cache: {e}")
+            return [None] * len(texts)
+        return [array("f", value).tolist() if value else None for value in values]
+
+    def _set_cached(self, texts: list[str], embeddings: list[Embedding]) -> None:
+        try:
+            with RedisUtils.get_client().pipeline(transaction=False) as pipe:
+                for text, embedding in zip(texts, embeddings, strict=True):
+                    pipe.set(
+                        self._get_key(text),
+                        array("f", embedding).tobytes(),
+                        ex=self.TTL_IN_SECOND,
+                    )
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"Unable to write chunk embeddings to cache: {e}")
+
+    def _merge(
+        self,
+        cached: list[Embedding | None],
+        missing_indices: list[int],
+        computed: list[Embedding],
+    ) -> list[Embedding]:
+        for index, embedding in zip(missing_indices, computed, strict=True):
+            cached[index] = embedding
+        return cached  # type: ignore[return-value]
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[Embedding]:
+        cached = self._get_cached(texts)
+        missing_indices = [i for i, e in enumerate(cached) if e is None]
+        if not missing_indices:
+            return cached  # type: ignore[return-value]
+        missing_texts = [texts[i] for i in missing_indices]
+        computed = self.embedding.get_text_embedding_batch(missing_texts)
+        self._set_cached(missing_texts, computed)
+        return self._merge(cached, missing_indices, computed)
+
+    async def _aget_text_embeddings(self, texts: list[str]) -> list[Embedding]:
+        cached = self._get_cached(texts)
+        missing_indices = [i for i, e in enumerate(cached) if e is None]
+        if not missing_indices:
+            return cached  # type: ignore[return-value]
+        missing_texts = [texts[i] for i in missing_indices]
+        computed = await self.embedding.aget_text_embedding_batch(missing_texts)
+        self._set_cached(missing_texts, computed)
+        return self._merge(cached, missing_indices, computed)
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._get_text_embeddings([text])[0]
+
+    async def _aget_text_embedding(self, text: str) -> Embedding:
+        return (await self._aget_text_embeddings([text]))[0]
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self.embedding.get_query_embedding(query)
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        return await self.embedding.aget_query_embedding(query)
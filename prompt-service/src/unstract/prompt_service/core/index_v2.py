@@ -1,8 +1,16 @@
 import json
 import logging
-from typing import Any
+import os
+import random
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
 
-from llama_index.core import Document
+from llama_index.core import Document, VectorStoreIndex
+from llama_index.core.constants import DEFAULT_EMBED_BATCH_SIZE
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import BaseNode, MetadataMode, NodeRelationship
 from llama_index.core.vector_stores import (
     FilterOperator,
     MetadataFilter,
@@ -11,12 +19,14 @@ from llama_index.core.vector_stores import (
     VectorStoreQueryResult,
 )
 
+from unstract.prompt_service.core.cached_embedding import CachedEmbedding
 from unstract.prompt_service.dto import (
     ChunkingConfig,
     FileInfo,
     InstanceIdentifiers,
     ProcessingOptions,
 )
+from unstract.prompt_service.helpers.index_confirmation import IndexConfirmation
 from unstract.sdk.adapter import ToolAdapter
 from unstract.sdk.adapters.vectordb.no_op.src.no_op_custom_vectordb import (
     NoOpCustomVectorDB,
@@ -33,8 +43,32 @@ from unstract.sdk.vector_db import VectorDB
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Index:
+    CONFIRMATION_MAX_ATTEMPTS = int(os.environ.get("INDEX_CONFIRMATION_MAX_ATTEMPTS", 5))
+    CONFIRMATION_BASE_DELAY_IN_SECOND = float(
+        os.environ.get("INDEX_CONFIRMATION_BASE_DELAY_IN_SECOND", 0.1)
+    )
+    EMBEDDING_BATCH_SIZE = int(os.environ.get("INDEXING_EMBEDDING_BATCH_SIZE", 50))
+    EMBEDDING_MAX_CONCURRENCY = int(
+        os.environ.get("INDEXING_EMBEDDING_MAX_CONCURRENCY", 4)
+    )
+    VECTOR_DB_INSERT_BATCH_SIZE = int(
+        os.environ.get("INDEXING_VECTOR_DB_INSERT_BATCH_SIZE", 2048)
+    )
+    RATE_LIMIT_MAX_RETRIES = int(os.environ.get("INDEXING_RATE_LIMIT_MAX_RETRIES", 3))
+    RATE_LIMIT_BASE_DELAY_IN_SECOND = float(
+        os.environ.get("INDEXING_RATE_LIMIT_BASE_DELAY_IN_SECOND", 2)
+    )
+    STREAMING_THRESHOLD_CHARS = int(
+        os.environ.get("INDEXING_STREAMING_THRESHOLD_CHARS", 10_000_000)
+    )
+    STREAMING_WINDOW_CHARS = int(
+        os.environ.get("INDEXING_STREAMING_WINDOW_CHARS", 1_000_000)
+    )
+
     def __init__(
         self,
         tool: StreamMixin,
@@ -117,22 +151,14 @@ class Index:
             str: The document ID.
         """
         # Checking if document is already indexed against doc_id
-        doc_id_eq_filter = MetadataFilter.from_dict(
-            {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
-        )
-        filters = MetadataFilters(filters=[doc_id_eq_filter])
-        q = VectorStoreQuery(
-            query_embedding=embedding.get_query_embedding(" "),
-            doc_ids=[doc_id],
-            filters=filters,
-        )
-
         doc_id_found = False
         try:
-            n: VectorStoreQueryResult = vector_db.query(query=q)
-            if len(n.nodes) > 0:
+            node_count = self._get_node_count(doc_id, embedding, vector_db)
+            if node_count > 0:
                 doc_id_found = True
-                self.tool.stream_log(f"Found {len(n.nodes)} nodes for {doc_id}")
+                # Nodes are visible to queries, retrieval need not retry
+                IndexConfirmation.mark_confirmed(doc_id)
+                self.tool.stream_log(f"Found {node_count} nodes for {doc_id}")
             else:
                 self.tool.stream_log(f"No nodes found for {doc_id}")
         except Exception as e:
@@ -148,6 +174,57 @@ class Index:
 
         return doc_id_found
 
+    def _get_node_count(
+        self, doc_id: str, embedding: Embedding, vector_db: VectorDB
+    ) -> int:
+        """Returns the number of nodes visible to queries for the doc_id."""
+        doc_id_eq_filter = MetadataFilter.from_dict(
+            {"key": "doc_id", "operator": FilterOperator.EQ, "value": doc_id}
+        )
+        filters = MetadataFilters(filters=[doc_id_eq_filter])
+        q = VectorStoreQuery(
+            query_embedding=embedding.get_query_embedding(" "),
+            doc_ids=[doc_id],
+            filters=filters,
+        )
+        n: VectorStoreQueryResult = vector_db.query(query=q)
+        return len(n.nodes)
+
+    def confirm_indexing(
+        self, doc_id: str, embedding: Embedding, vector_db: VectorDB
+    ) -> bool:
+        """Waits for the indexed nodes of the doc_id to become visible.
+
+        Polls the vector DB with exponential backoff and records the doc_id
+        as confirmed once its nodes can be queried, so that retrieval only
+        retries for documents whose writes are not confirmed yet.
+
+        Returns:
+            bool: True if the indexed nodes were found
+        """
+        if self._is_no_op_vector_db(vector_db):
+            return False
+        for attempt in range(self.CONFIRMATION_MAX_ATTEMPTS):
+            try:
+                if self._get_node_count(doc_id, embedding, vector_db) > 0:
+                    IndexConfirmation.mark_confirmed(doc_id)
+                    return True
+            except Exception as e:
+                logger.warning(f"Error confirming indexing of {doc_id}: {e}")
+            if attempt < self.CONFIRMATION_MAX_ATTEMPTS - 1:
+                time.sleep(self.CONFIRMATION_BASE_DELAY_IN_SECOND * (2**attempt))
+        logger.warning(f"Unable to confirm that nodes of {doc_id} are queryable")
+        return False
+
+    def _is_no_op_vector_db(self, vector_db: VectorDB) -> bool:
+        return isinstance(
+            vector_db.get_vector_db(
+                adapter_instance_id=self.instance_identifiers.vector_db_instance_id,
+                embedding_dimension=1,
+            ),
+            (NoOpCustomVectorDB),
+        )
+
     @capture_metrics
     def perform_indexing(
         self,
@@ -155,14 +232,9 @@ class Index:
         doc_id: str,
         extracted_text: str,
         doc_id_found: bool,
+        embedding: Embedding | None = None,
     ):
-        if isinstance(
-            vector_db.get_vector_db(
-                adapter_instance_id=self.instance_identifiers.vector_db_instance_id,
-                embedding_dimension=1,
-            ),
-            (NoOpCustomVectorDB),
-        ):
+        if self._is_no_op_vector_db(vector_db):
             return doc_id
 
         self.tool.stream_log("Indexing file...")
@@ -174,19 +246,81 @@ class Index:
         ]
         # Convert raw text to llama index usage Document
         documents = self._prepare_documents(doc_id, full_text)
+        IndexConfirmation.clear(doc_id)
         if self.processing_options.reindex and doc_id_found:
             self.delete_nodes(vector_db, doc_id)
-        self._trigger_indexing(vector_db, documents)
+        if embedding:
+            self._configure_embedding_batches(embedding)
+        self._trigger_indexing(vector_db, documents, doc_id)
         return doc_id
 
-    def _trigger_indexing(self, vector_db, documents):
+    def _configure_embedding_batches(self, embedding: Embedding) -> None:
+        """Embeds nodes in larger batches with bounded concurrent requests.
+
+        Only models left at the llama-index defaults are changed, batch sizes
+        and workers configured on the adapter (e.g. to respect the provider's
+        limits) are kept. The nodes produced for the document are the same.
+        """
+        embedding_instances = [embedding._embedding_instance]
+        if isinstance(embedding._embedding_instance, CachedEmbedding):
+            embedding_instances.append(embedding._embedding_instance.embedding)
+        for embedding_instance in embedding_instances:
+            if embedding_instance.embed_batch_size == DEFAULT_EMBED_BATCH_SIZE:
+                embedding_instance.embed_batch_size = self.EMBEDDING_BATCH_SIZE
+            if embedding_instance.num_workers is None:
+                embedding_instance.num_workers = self.EMBEDDING_MAX_CONCURRENCY
+
+    @staticmethod
+    def _is_rate_limit_error(error: BaseException | None) -> bool:
+        while error:
+            status_code = getattr(error, "status_code", None)
+            message = str(error).lower()
+            if (
+                status_code == 429
+                or "rate limit" in message
+                or "too many requests" in message
+            ):
+                return True
+            error = error.__cause__
+        return False
+
+    def _call_with_rate_limit_retries(
+        self,
+        func: Callable[[], T],
+        on_retry: Callable[[], None] | None = None,
+    ) -> T:
+        """Calls func, retrying with jittered backoff when rate limited."""
+        for attempt in range(self.RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                return func()
+            except Exception as e:
+                is_last_attempt = attempt == self.RATE_LIMIT_MAX_RETRIES
+                if is_last_attempt or not self._is_rate_limit_error(e):
+                    raise
+                delay = self.RATE_LIMIT_BASE_DELAY_IN_SECOND * (2**attempt)
+                delay *= random.uniform(0.5, 1.5)
+                self.tool.stream_log(
+                    f"Rate limited while indexing, retrying in {delay:.1f}s",
+                    level=LogLevel.WARN,
+                )
+                if on_retry:
+                    on_retry()
+                time.sleep(delay)
+
+    def _trigger_indexing(self, vector_db, documents, doc_id: str):
         self.tool.stream_log("Adding nodes to vector db...")
         try:
-            vector_db.index_document(
-                documents,
-                chunk_size=self.chunking_config.chunk_size,
-                chunk_overlap=self.chunking_config.chunk_overlap,
-                show_progress=True,
+            self._call_with_rate_limit_retries(
+                lambda: vector_db.index_document(
+                    documents,
+                    chunk_size=self.chunking_config.chunk_size,
+                    chunk_overlap=self.chunking_config.chunk_overlap,
+                    show_progress=True,
+                    use_async=self.EMBEDDING_MAX_CONCURRENCY > 1,
+                    insert_batch_size=self.VECTOR_DB_INSERT_BATCH_SIZE,
+                ),
+                # Drop nodes of the partial attempt before retrying
+                on_retry=lambda: self.delete_nodes(vector_db, doc_id),
             )
             self.tool.stream_log("File has been indexed successfully")
         except Exception as e:
@@ -196,6 +330,157 @@ class Index:
             )
             raise IndexingError(str(e)) from e
 
+    @capture_metrics
+    def perform_streaming_indexing(
+        self,
+        vector_db: VectorDB,
+        embedding: Embedding,
+        doc_id: str,
+        text_windows: Iterable[str],
+        doc_id_found: bool,
+    ):
+        """Indexes a large document without materializing all of its nodes.
+
+        Text is split into nodes one window at a time and each window's nodes
+        are embedded while the previous window's nodes are being inserted, so
+        memory stays bounded by a couple of windows. Nodes carry the same
+        metadata and relationships as when indexing the whole document.
+
+        Args:
+            vector_db (VectorDB): Vector DB to insert nodes into
+            embedding (Embedding): Embedding used for the nodes
+            doc_id (str): Document ID
+            text_windows (Iterable[str]): Consecutive windows of the text
+            doc_id_found (bool): Whether nodes already exist for the doc_id
+        """
+        if self._is_no_op_vector_db(vector_db):
+            return doc_id
+
+        self.tool.stream_log("Indexing file in a streaming manner...")
+        IndexConfirmation.clear(doc_id)
+        if self.processing_options.reindex and doc_id_found:
+            self.delete_nodes(vector_db, doc_id)
+        self._configure_embedding_batches(embedding)
+        embedding_instance = embedding._embedding_instance
+        vector_store_index = vector_db.get_vector_store_index()
+        node_count = 0
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending_insert: Future | None = None
+                for nodes in self._iter_node_batches(doc_id, text_windows):
+                    texts = [
+                        node.get_content(metadata_mode=MetadataMode.EMBED)
+                        for node in nodes
+                    ]
+                    embeddings = self._call_with_rate_limit_retries(
+                        lambda t=texts: embedding_instance.get_text_embedding_batch(t)
+                    )
+                    for node, node_embedding in zip(nodes, embeddings, strict=True):
+                        node.embedding = node_embedding
+                    if pending_insert:
+                        pending_insert.result()
+                    pending_insert = executor.submit(
+                        self._insert_nodes, vector_store_index, nodes
+                    )
+                    node_count += len(nodes)
+                if pending_insert:
+                    pending_insert.result()
+            self.tool.stream_log(
+                f"File has been indexed successfully with {node_count} nodes"
+            )
+        except Exception as e:
+            self.tool.stream_log(
+                f"Error adding nodes to vector db: {e}",
+                level=LogLevel.ERROR,
+            )
+            raise IndexingError(str(e)) from e
+        return doc_id
+
+    def _insert_nodes(
+        self, vector_store_index: VectorStoreIndex, nodes: list[BaseNode]
+    ) -> None:
+        """Inserts a batch of nodes, retrying when rate limited.
+
+        Nodes of the batch written by a failed attempt are deleted before
+        retrying, so that stores which do not upsert are not left with
+        duplicates.
+        """
+        node_ids = [node.node_id for node in nodes]
+
+        def delete_batch() -> None:
+            try:
+                vector_store_index.delete_nodes(node_ids)
+            except NotImplementedError:
+                logger.warning(
+                    "Vector DB can not delete nodes by ID, retrying the insert of "
+                    f"{len(node_ids)} nodes without deleting them"
+                )
+
+        self._call_with_rate_limit_retries(
+            lambda: vector_store_index.insert_nodes(nodes), on_retry=delete_batch
+        )
+
+    def _iter_node_batches(
+        self, doc_id: str, text_windows: Iterable[str]
+    ) -> Iterator[list[BaseNode]]:
+        """Splits text windows into nodes, yielding a batch per window.
+
+        The last node of a window is split again along with the next window
+        so that chunks are not cut at window boundaries. Each batch holds back
+        its last node until the following node is known, to link them.
+        """
+        splitter = SentenceSplitter.from_defaults(
+            chunk_size=self.chunking_config.chunk_size,
+            chunk_overlap=self.chunking_config.chunk_overlap,
+        )
+        carry = ""
+        offset = 0
+        previous_node: BaseNode | None = None
+        windows = iter(text_windows)
+        window = next(windows, None)
+        while window is not None:
+            next_window = next(windows, None)
+            is_last_window = next_window is None
+            text = carry + window
+            document = self._prepare_documents(
+                doc_id, [{"section": "full", "text_contents": text}]
+            )[0]
+            nodes = splitter.get_nodes_from_documents([document])
+            carry = ""
+            if not is_last_window:
+                if len(nodes) <= 1:
+                    carry, nodes = text, []
+                elif nodes[-1].start_char_idx is not None:
+                    carry = text[nodes[-1].start_char_idx :]
+                    nodes = nodes[:-1]
+            for node in nodes:
+                if node.start_char_idx is not None:
+                    node.start_char_idx += offset
+                if node.end_char_idx is not None:
+                    node.end_char_idx += offset
+            offset += len(text) - len(carry)
+            window = next_window
+            if not nodes:
+                continue
+            if previous_node:
+                previous_node.relationships[NodeRelationship.NEXT] = nodes[
+                    0
+                ].as_related_node_info()
+                nodes[0].relationships[NodeRelationship.PREVIOUS] = (
+                    previous_node.as_related_node_info()
+                )
+                nodes.insert(0, previous_node)
+            previous_node = nodes.pop()
+            if nodes:
+                yield nodes
+        if previous_node:
+            yield [previous_node]
+
+    @staticmethod
+    def iter_text_windows(text: str, window_size: int) -> Iterator[str]:
+        for start in range(0, len(text), window_size):
+            yield text[start : start + window_size]
+
     def delete_nodes(self, vector_db: VectorDB, doc_id: str):
         try:
             vector_db.delete(ref_doc_id=doc_id)
@@ -10,6 +10,7 @@ class BaseRetriever:
         doc_id: str,
         top_k: int,
         llm: LLM | None = None,
+        query_embedding: list[float] | None = None,
     ):
         """Initialize the Retrieval class.
 
@@ -18,12 +19,15 @@ class BaseRetriever:
             prompt (str): The query prompt.
             doc_id (str): Document identifier for query context.
             top_k (int): Number of top results to retrieve.
+            query_embedding (list[float] | None): Precomputed embedding of
+                the prompt, if any.
         """
         self.vector_db = vector_db
         self.prompt = prompt
         self.doc_id = doc_id
         self.top_k = top_k
         self.llm = llm._llm_instance if llm else None
+        self.query_embedding = query_embedding
 
     @staticmethod
     def retrieve() -> set[str]:
@@ -1,10 +1,10 @@
-import time
-
 from flask import current_app as app
 from llama_index.core import VectorStoreIndex
+from llama_index.core.schema import QueryBundle
 from llama_index.core.vector_stores import ExactMatchFilter, MetadataFilters
 
 from unstract.prompt_service.core.retrievers.base_retriever import BaseRetriever
+from unstract.prompt_service.helpers.index_confirmation import IndexConfirmation
 
 
 class SimpleRetriever(BaseRetriever):
@@ -13,16 +13,18 @@ class SimpleRetriever(BaseRetriever):
             f"Retrieving context for prompt: {self.prompt} with doc_id: {self.doc_id}"
         )
         context = self._simple_retrieval()
-        if not context:
-            # UN-1288 For Pinecone, we are seeing an inconsistent case where
-            # query with doc_id fails even though indexing just happened.
-            # This causes the following retrieve to return no text.
-            # To rule out any lag on the Pinecone vector DB write,
-            # the following sleep is added
-            # Note: This will not fix the issue. Since this issue is inconsistent
-            # and not reproducible easily, this is just a safety net.
-            time.sleep(2)
+        if context or IndexConfirmation.is_confirmed(self.doc_id):
+            return context
+        # UN-1288 For Pinecone, we are seeing an inconsistent case where
+        # query with doc_id fails even though indexing just happened.
+        # Retry with a short backoff only while the write of this doc_id
+        # has not been confirmed visible by indexing.
+        for attempt in range(IndexConfirmation.RETRY_MAX_ATTEMPTS):
+            IndexConfirmation.sleep_before_retry(attempt)
             context = self._simple_retrieval()
+            if context:
+                IndexConfirmation.mark_confirmed(self.doc_id)
+                break
         return context
 
     def _simple_retrieval(self):
@@ -35,7 +37,9 @@ class SimpleRetriever(BaseRetriever):
                 ],
             ),
         )
-        nodes = retriever.retrieve(self.prompt)
+        nodes = retriever.retrieve(
+            QueryBundle(query_str=self.prompt, embedding=self.query_embedding)
+        )
         context: set[str] = set()
         for node in nodes:
             # May have to fine-tune this value for node score or keep it
@@ -3,6 +3,7 @@ from contextlib import contextmanager
 from os import environ as env
 from typing import Any
 
+from playhouse.pool import PooledPostgresqlExtDatabase
 from playhouse.postgres_ext import PostgresqlExtDatabase
 
 from unstract.prompt_service.utils.env_loader import get_env_or_die
@@ -14,10 +15,14 @@ db_user = get_env_or_die("PG_BE_USERNAME")
 db_pass = get_env_or_die("PG_BE_PASSWORD")
 db_name = get_env_or_die("PG_BE_DATABASE")
 application_name = env.get("APPLICATION_NAME", "unstract-prompt-service")
+db_pool_max_connections = int(env.get("DB_POOL_MAX_CONNECTIONS", 20))
+db_pool_stale_timeout = int(env.get("DB_POOL_STALE_TIMEOUT_IN_SECOND", 300))
 
-# Initialize and connect to the database
-db = PostgresqlExtDatabase(
+# Initialize the database, connections are pooled across requests
+db = PooledPostgresqlExtDatabase(
     database=db_name,
+    max_connections=db_pool_max_connections,
+    stale_timeout=db_pool_stale_timeout,
     user=db_user,
     host=db_host,
     password=db_pass,
@@ -28,9 +33,14 @@ db = PostgresqlExtDatabase(
 
 @contextmanager
 def db_context() -> Generator[PostgresqlExtDatabase, Any, None]:
+    """Checks out a pooled connection for the block.
+
+    Nested blocks reuse the connection of the outermost one, which returns
+    it to the pool on exit.
+    """
+    opened = db.connect(reuse_if_open=True)
     try:
-        db.connect()
         yield db
     finally:
-        if not db.is_closed():
+        if opened and not db.is_closed():
             db.close()
@@ -4,7 +4,6 @@ from flask import Request, request
 from flask import current_app as app
 
 from unstract.prompt_service.constants import DBTableV2
-from unstract.prompt_service.extensions import db, db_context
 from unstract.prompt_service.utils.db_utils import DBUtils
 from unstract.prompt_service.utils.env_loader import get_env_or_die
 
@@ -19,27 +18,8 @@ class AuthHelper:
                 app.logger.error("Authentication failed. Empty bearer token")
                 return False
 
-            platform_key_table = f'"{DB_SCHEMA}".{DBTableV2.PLATFORM_KEY}'
-            with db_context():
-                query = f"SELECT * FROM {platform_key_table} WHERE key = '{token}'"
-                cursor = db.execute_sql(query)
-                result_row = cursor.fetchone()
-                cursor.close()
-            if not result_row or len(result_row) == 0:
-                app.logger.error(f"Authentication failed. bearer token not found {token}")
+            if not DBUtils.get_platform_key_details(token):
                 return False
-            platform_key = str(result_row[1])
-            is_active = bool(result_row[2])
-            if not is_active:
-                app.logger.error(
-                    f"Token is not active. Activate \
-                        before using it. token {token}"
-                )
-                return False
-            if platform_key != token:
-                app.logger.error(f"Authentication failed. Invalid bearer token: {token}")
-                return False
-
         except Exception as e:
             app.logger.error(
                 f"Error while validating bearer token: {e}",
@@ -66,12 +46,10 @@ class AuthHelper:
         platform_key_table = DBTableV2.PLATFORM_KEY
         organization_table = DBTableV2.ORGANIZATION
 
-        query = f"SELECT organization_id FROM {platform_key_table} WHERE key='{token}'"
-        organization = DBUtils.execute_query(query)
-        query_org = (
-            f"SELECT schema_name FROM {organization_table} WHERE id='{organization}'"
-        )
-        schema_name: str = DBUtils.execute_query(query_org)
+        query = f"SELECT organization_id FROM {platform_key_table} WHERE key=%s"
+        organization = DBUtils.execute_query(query, (token,))
+        query_org = f"SELECT schema_name FROM {organization_table} WHERE id=%s"
+        schema_name: str = DBUtils.execute_query(query_org, (organization,))
         return schema_name
 
     @staticmethod
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from unstract.prompt_service.utils.request import HTTPMethod, make_http_request
+
+logger = logging.getLogger(__name__)
+
+
+def _get_ttl_overrides() -> dict[str, int]:
+    try:
+        overrides = json.loads(os.environ.get("DYNAMIC_VARIABLE_CACHE_TTLS", "{}"))
+        return {url: int(ttl) for url, ttl in overrides.items()}
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring invalid DYNAMIC_VARIABLE_CACHE_TTLS: {e}")
+        return {}
+
+
+class DynamicVariableFetcher:
+    """Resolves dynamic variables over pooled connections.
+
+    Responses can be cached in-process by opting in through
+    `DYNAMIC_VARIABLE_CACHE_TTL_IN_SECOND` for every endpoint, or per
+    endpoint URL through the `DYNAMIC_VARIABLE_CACHE_TTLS` JSON mapping.
+    Entries are keyed by the URL and request body. Concurrent lookups of the
+    same URL and body share a single in-flight request.
+    """
+
+    TIMEOUT_IN_SECOND = float(os.environ.get("DYNAMIC_VARIABLE_TIMEOUT_IN_SECOND", 30))
+    POOL_MAXSIZE = int(os.environ.get("DYNAMIC_VARIABLE_POOL_MAXSIZE", 10))
+    CACHE_TTL_IN_SECOND = int(os.environ.get("DYNAMIC_VARIABLE_CACHE_TTL_IN_SECOND", 0))
+    CACHE_TTLS = _get_ttl_overrides()
+    CACHE_MAX_ENTRIES = int(os.environ.get("DYNAMIC_VARIABLE_CACHE_MAX_ENTRIES", 1000))
+
+    _session: requests.Session | None = None
+    _cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+    _in_flight: dict[str, Future] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        if cls._session is None:
+            with cls._lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_maxsize=cls.POOL_MAXSIZE)
+                    session.mount("http://", adapter)
+                    session.mount("https://", adapter)
+                    cls._session = session
+        return cls._session
+
+    @classmethod
+    def get_ttl(cls, url: str) -> int:
+        return cls.CACHE_TTLS.get(url, cls.CACHE_TTL_IN_SECOND)
+
+    @staticmethod
+    def get_key(url: str, data: Any) -> str:
+        body = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha256(f"{url}:{body}".encode()).hexdigest()
+
+    @classmethod
+    def fetch(cls, url: str, data: Any) -> Any:
+        """Fetches the value of a dynamic variable.
+
+        Args:
+            url (str): Endpoint of the dynamic variable
+            data (Any): Value posted to the endpoint
+
+        Returns:
+            Any: Response of the endpoint, JSON decoded if applicable
+        """
+        key = cls.get_key(url, data)
+        ttl = cls.get_ttl(url)
+        with cls._lock:
+            cached = cls._cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                cls._cache.move_to_end(key)
+                return cached[1]
+            in_flight = cls._in_flight.get(key)
+            if in_flight is None:
+                future: Future = Future()
+                cls._in_flight[key] = future
+        if in_flight is not None:
+            logger.info(f"Waiting on in-flight request to dynamic variable {url}")
+            return in_flight.result()
+
+        try:
+            value = cls._request(url=url, data=data)
+        except BaseException as e:
+            with cls._lock:
+                cls._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with cls._lock:
+            cls._in_flight.pop(key, None)
+            if ttl > 0:
+                cls._cache[key] = (time.monotonic() + ttl, value)
+                cls._cache.move_to_end(key)
+                while len(cls._cache) > cls.CACHE_MAX_ENTRIES:
+                    cls._cache.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    @classmethod
+    def _request(cls, url: str, data: Any) -> Any:
+        # This prototype method currently supports
+        # only endpoints that do not require authentication.
+        # Additionally, it only accepts plain text
+        # inputs for POST requests in this version.
+        # Future versions may include support for
+        #  authentication and other input formats.
+        headers = {"Content-Type": "text/plain"}
+        return make_http_request(
+            verb=HTTPMethod.POST,
+            url=url,
+            data=data,
+            headers=headers,
+            session=cls.get_session(),
+            timeout=cls.TIMEOUT_IN_SECOND,
+        )
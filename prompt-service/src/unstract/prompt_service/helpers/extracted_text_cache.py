@@ -0,0 +1,69 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from flask import g, has_app_context
+
+from unstract.sdk.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractedTextCache:
+    """Caches extracted text read for full context prompts.
+
+    Text is read at most once per request. Optionally, it is also shared
+    across requests of the process through an LRU bounded by
+    `EXTRACTED_TEXT_CACHE_MAX_CHARS`, where entries are keyed by the file
+    path and its modification time so that re-extracted files are re-read.
+    """
+
+    MAX_CHARS = int(os.environ.get("EXTRACTED_TEXT_CACHE_MAX_CHARS", 0))
+
+    _texts: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+    _size = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def read(cls, fs: FileStorage, file_path: str, execution_source: str) -> str:
+        """Reads the extracted text of a file through the cache.
+
+        Args:
+            fs (FileStorage): File storage holding the extracted text
+            file_path (str): Path to the extracted text
+            execution_source (str): Source of execution, which determines the
+                file storage used
+
+        Returns:
+            str: Extracted text
+        """
+        request_texts: dict[tuple[str, str], str] = (
+            g.setdefault("extracted_texts", {}) if has_app_context() else {}
+        )
+        request_key = (execution_source, file_path)
+        if request_key not in request_texts:
+            request_texts[request_key] = cls._read_shared(fs, file_path, execution_source)
+        return request_texts[request_key]
+
+    @classmethod
+    def _read_shared(cls, fs: FileStorage, file_path: str, execution_source: str) -> str:
+        if cls.MAX_CHARS <= 0:
+            return fs.read(path=file_path, mode="r", encoding="utf-8")
+        key = (execution_source, file_path, str(fs.modification_time(file_path)))
+        with cls._lock:
+            text = cls._texts.get(key)
+            if text is not None:
+                cls._texts.move_to_end(key)
+                return text
+        text = fs.read(path=file_path, mode="r", encoding="utf-8")
+        if len(text) > cls.MAX_CHARS:
+            return text
+        with cls._lock:
+            if key not in cls._texts:
+                cls._texts[key] = text
+                cls._size += len(text)
+            while cls._size > cls.MAX_CHARS:
+                _, evicted = cls._texts.popitem(last=False)
+                cls._size -= len(evicted)
+        return text
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+from unstract.sdk.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedExtraction:
+    extracted_text: str
+    whisper_hash: str | None = None
+    # Line metadata written next to the extracted text for highlighting
+    line_metadata: str | None = None
+
+
+class ExtractionCache:
+    """Cross-execution cache of text extraction results.
+
+    Extracted text and its extraction metadata (needed to serve highlights)
+    are stored as files on the file storage of the execution source. Redis
+    tracks the size and last access time of every entry so that the least
+    recently used entries can be evicted once the cache grows beyond
+    `EXTRACTION_CACHE_MAX_BYTES`. The cache is disabled while it is 0, which
+    is the default.
+
+    Execution sources use different file storages, hence each of them has its
+    own directory and Redis index.
+    """
+
+    CACHE_DIR = os.environ.get(
+        "EXTRACTION_CACHE_DIR", "unstract/extraction-cache/"
+    ).rstrip("/")
+    MAX_BYTES = int(os.environ.get("EXTRACTION_CACHE_MAX_BYTES", 0))
+
+    REDIS_KEY_PREFIX = "extraction_cache"
+
+    TEXT_SUFFIX = ".txt"
+    METADATA_SUFFIX = ".metadata.json"
+    LINE_METADATA_SUFFIX = ".line_metadata.json"
+
+    def __init__(self, fs: FileStorage, execution_source: str | None) -> None:
+        self.fs = fs
+        self.execution_source = execution_source or "default"
+        self.cache_dir = f"{self.CACHE_DIR}/{self.execution_source}"
+        namespace = f"{self.REDIS_KEY_PREFIX}:{self.execution_source}"
+        self.lru_key = f"{namespace}:lru"
+        self.sizes_key = f"{namespace}:sizes"
+        self.total_bytes_key = f"{namespace}:total_bytes"
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.MAX_BYTES > 0
+
+    @staticmethod
+    def get_key(
+        file_hash: str,
+        x2text_instance_id: str,
+        adapter_settings: dict[str, Any],
+        enable_highlight: bool,
+        execution_source: str | None,
+    ) -> str:
+        """Builds the cache key of an extraction.
+
+        Args:
+            file_hash (str): Hash of the file contents.
+            x2text_instance_id (str): Adapter instance used for extraction.
+            adapter_settings (dict[str, Any]): Adapter configuration, so that
+                editing the adapter invalidates its cached extractions.
+            enable_highlight (bool): Whether highlight metadata was requested.
+            execution_source (str | None): Source of execution, which
+                determines the file storage holding the entry.
+
+        Returns:
+            str: Hex digest identifying the extraction.
+        """
+        settings_fingerprint = hashlib.sha256(
+            json.dumps(adapter_settings, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        fingerprint = (
+            f"{execution_source}:{file_hash}:{x2text_instance_id}:"
+            f"{settings_fingerprint}:{enable_highlight}"
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def _get_paths(self, key: str) -> tuple[str, str, str]:
+        return (
+            f"{self.cache_dir}/{key}{self.TEXT_SUFFIX}",
+            f"{self.cache_dir}/{key}{self.METADATA_SUFFIX}",
+            f"{self.cache_dir}/{key}{self.LINE_METADATA_SUFFIX}",
+        )
+
+    def get(self, key: str) -> CachedExtraction | None:
+        """Returns the cached extraction for the key, if any.
+
+        Errors are logged and treated as a miss since the cache is only an
+        optimization.
+        """
+        if not self.is_enabled():
+            return None
+        text_path, metadata_path, line_metadata_path = self._get_paths(key)
+        try:
+            redis_client = RedisUtils.get_client()
+            if redis_client.zscore(self.lru_key, key) is None:
+                return None
+            if not self.fs.exists(text_path):
+                self._forget(key)
+                return None
+            extracted_text: str = self.fs.read(path=text_path, mode="r")
+            whisper_hash = None
+            if self.fs.exists(metadata_path):
+                metadata = json.loads(self.fs.read(path=metadata_path, mode="r"))
+                whisper_hash = metadata.get("whisper_hash")
+            line_metadata = None
+            if self.fs.exists(line_metadata_path):
+                line_metadata = self.fs.read(path=line_metadata_path, mode="r")
+            redis_client.zadd(self.lru_key, {key: time.time()})
+        except Exception as e:
+            logger.warning(f"Unable to read extraction cache entry '{key}': {e}")
+            return None
+        return CachedExtraction(
+            extracted_text=extracted_text,
+            whisper_hash=whisper_hash,
+            line_metadata=line_metadata,
+        )
+
+    def put(self, key: str, extraction: CachedExtraction) -> None:
+        """Stores an extraction and evicts least recently used entries."""
+        if not self.is_enabled() or not extraction.extracted_text:
+            return
+        text_path, metadata_path, line_metadata_path = self._get_paths(key)
+        metadata = json.dumps({"whisper_hash": extraction.whisper_hash})
+        size = len(extraction.extracted_text.encode("utf-8")) + len(metadata)
+        if extraction.line_metadata is not None:
+            size += len(extraction.line_metadata.encode("utf-8"))
+        if size > self.MAX_BYTES:
+            return
+        try:
+            self.fs.mkdir(self.cache_dir, create_parents=True)
+            self.fs.write(path=text_path, mode="w", data=extraction.extracted_text)
+            self.fs.write(path=metadata_path, mode="w", data=metadata)
+            if extraction.line_metadata is not None:
+                self.fs.write(
+                    path=line_metadata_path, mode="w", data=extraction.line_metadata
+                )
+            redis_client = RedisUtils.get_client()
+            previous_size = redis_client.hget(self.sizes_key, key)
+            with redis_client.pipeline() as pipe:
+                pipe.hset(self.sizes_key, key, size)
+                pipe.zadd(self.lru_key, {key: time.time()})
+                pipe.incrby(self.total_bytes_key, size - int(previous_size or 0))
+                pipe.execute()
+            self._evict()
+        except Exception as e:
+            logger.warning(f"Unable to write extraction cache entry '{key}': {e}")
+
+    def _evict(self) -> None:
+        redis_client = RedisUtils.get_client()
+        while int(redis_client.get(self.total_bytes_key) or 0) > self.MAX_BYTES:
+            oldest = redis_client.zrange(self.lru_key, 0, 0)
+            if not oldest:
+                # Sizes drifted from the tracked entries, start afresh
+                redis_client.delete(self.total_bytes_key, self.sizes_key)
+                return
+            key = oldest[0].decode("utf-8")
+            logger.info(f"Evicting extraction cache entry '{key}'")
+            for path in self._get_paths(key):
+                if self.fs.exists(path):
+                    self.fs.rm(path)
+            self._forget(key)
+
+    def _forget(self, key: str) -> None:
+        redis_client = RedisUtils.get_client()
+        size = redis_client.hget(self.sizes_key, key)
+        with redis_client.pipeline() as pipe:
+            pipe.zrem(self.lru_key, key)
+            pipe.hdel(self.sizes_key, key)
+            if size:
+                pipe.decrby(self.total_bytes_key, int(size))
+            pipe.execute()
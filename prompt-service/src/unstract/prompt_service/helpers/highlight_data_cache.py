@@ -0,0 +1,68 @@
+from collections.abc import Callable
+from typing import Any
+
+from flask import g, has_app_context
+
+from unstract.prompt_service.utils.file_utils import FileUtils
+from unstract.sdk.file_storage import FileStorage
+
+
+class _ReadOnceFileStorage:
+    """Proxies a file storage, reading each file at most once."""
+
+    def __init__(self, fs: FileStorage) -> None:
+        self._fs = fs
+        self._reads: dict[tuple[Any, ...], Any] = {}
+
+    def read(self, *args: Any, **kwargs: Any) -> Any:
+        key = (args, tuple(sorted(kwargs.items())))
+        if key not in self._reads:
+            self._reads[key] = self._fs.read(*args, **kwargs)
+        return self._reads[key]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fs, name)
+
+
+class HighlightDataCache:
+    """Shares highlight metadata reads across the prompts of a request.
+
+    Every prompt gets its own highlight data plugin instance, but all the
+    instances of a document read through one storage proxy, so the document's
+    highlight metadata is fetched from storage only once per request.
+    """
+
+    @staticmethod
+    def _get_fs_instance(execution_source: str, file_path: str) -> FileStorage:
+        fs_instances: dict[tuple[str, str], FileStorage] = (
+            g.setdefault("highlight_fs_instances", {}) if has_app_context() else {}
+        )
+        key = (execution_source, file_path)
+        if key not in fs_instances:
+            fs_instances[key] = _ReadOnceFileStorage(
+                FileUtils.get_fs_instance(execution_source=execution_source)
+            )
+        return fs_instances[key]
+
+    @classmethod
+    def get_highlight_data(
+        cls,
+        highlight_data_plugin: dict[str, Any],
+        file_path: str,
+        execution_source: str,
+    ) -> Callable[..., Any]:
+        """Returns the highlight data processor of a prompt.
+
+        Args:
+            highlight_data_plugin (dict[str, Any]): Highlight data plugin
+            file_path (str): Path to the document's extracted text
+            execution_source (str): Source of execution, which determines the
+                file storage used
+
+        Returns:
+            Callable[..., Any]: Processor to pass to `LLM.complete()`
+        """
+        return highlight_data_plugin["entrypoint_cls"](
+            file_path=file_path,
+            fs_instance=cls._get_fs_instance(execution_source, file_path),
+        ).run
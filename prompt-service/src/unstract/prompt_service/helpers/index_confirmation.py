@@ -0,0 +1,68 @@
+import logging
+import os
+import random
+import time
+
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+
+logger = logging.getLogger(__name__)
+
+
+class IndexConfirmation:
+    """Tracks doc_ids whose indexed nodes are confirmed visible for queries.
+
+    Some vector DBs (e.g. Pinecone) are eventually consistent, so a document
+    can be missing from queries shortly after it is indexed. Indexing records
+    a doc_id once its nodes are visible, letting retrieval skip retries for
+    confirmed documents whose context is genuinely empty.
+    """
+
+    KEY_PREFIX = "index_confirmed"
+    TTL_IN_SECOND = int(os.environ.get("INDEX_CONFIRMATION_TTL_IN_SECOND", 86400))
+    RETRY_BASE_DELAY_IN_SECOND = float(
+        os.environ.get("RETRIEVAL_RETRY_BASE_DELAY_IN_SECOND", 0.25)
+    )
+    RETRY_MAX_ATTEMPTS = int(os.environ.get("RETRIEVAL_RETRY_MAX_ATTEMPTS", 3))
+
+    @classmethod
+    def _get_key(cls, doc_id: str) -> str:
+        return f"{cls.KEY_PREFIX}:{doc_id}"
+
+    @classmethod
+    def mark_confirmed(cls, doc_id: str) -> None:
+        try:
+            RedisUtils.get_client().set(cls._get_key(doc_id), 1, ex=cls.TTL_IN_SECOND)
+        except Exception as e:
+            logger.warning(f"Unable to record index confirmation for {doc_id}: {e}")
+
+    @classmethod
+    def clear(cls, doc_id: str) -> None:
+        try:
+            RedisUtils.get_client().delete(cls._get_key(doc_id))
+        except Exception as e:
+            logger.warning(f"Unable to clear index confirmation for {doc_id}: {e}")
+
+    @classmethod
+    def is_confirmed(cls, doc_id: str) -> bool:
+        try:
+            return bool(RedisUtils.get_client().exists(cls._get_key(doc_id)))
+        except Exception as e:
+            logger.warning(f"Unable to check index confirmation for {doc_id}: {e}")
+            return False
+
+    @classmethod
+    def get_backoff_delay(cls, attempt: int) -> float:
+        """Returns a jittered exponential backoff delay for the attempt.
+
+        Args:
+            attempt (int): Zero based retry attempt
+
+        Returns:
+            float: Seconds to wait before the attempt
+        """
+        delay = cls.RETRY_BASE_DELAY_IN_SECOND * (2**attempt)
+        return delay * random.uniform(0.5, 1.5)
+
+    @classmethod
+    def sleep_before_retry(cls, attempt: int) -> None:
+        time.sleep(cls.get_backoff_delay(attempt))
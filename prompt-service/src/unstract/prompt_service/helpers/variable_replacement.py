@@ -6,7 +6,9 @@ from typing import Any
 from flask import current_app as app
 
 from unstract.prompt_service.constants import VariableConstants, VariableType
-from unstract.prompt_service.utils.request import HTTPMethod, make_http_request
+from unstract.prompt_service.helpers.dynamic_variable_fetcher import (
+    DynamicVariableFetcher,
+)
 
 
 class VariableReplacementHelper:
@@ -101,14 +103,5 @@ class VariableReplacementHelper:
 
     @staticmethod
     def fetch_dynamic_variable_value(url: str, data: str) -> Any:
-        # This prototype method currently supports
-        # only endpoints that do not require authentication.
-        # Additionally, it only accepts plain text
-        # inputs for POST requests in this version.
-        # Future versions may include support for
-        #  authentication and other input formats.
-
-        verb: HTTPMethod = HTTPMethod.POST
-        headers = {"Content-Type": "text/plain"}
-        response: Any = make_http_request(verb=verb, url=url, data=data, headers=headers)
+        response: Any = DynamicVariableFetcher.fetch(url=url, data=data)
         return response
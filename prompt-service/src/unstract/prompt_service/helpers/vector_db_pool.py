@@ -0,0 +1,141 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from unstract.prompt_service.utils.db_utils import DBUtils
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+from unstract.sdk.embedding import Embedding
+from unstract.sdk.tool.base import BaseTool
+from unstract.sdk.vector_db import VectorDB
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str | None, str, int | None, bytes | None]
+
+
+class VectorDBPool:
+    """Process-wide pool of vector DB clients.
+
+    Clients are keyed by organization, adapter instance, embedding dimension
+    and the adapter's generation (bumped by the backend when the adapter is
+    edited) so that a borrowed client always matches its configuration. A
+    borrowed client is used by a single caller until it is released, at which
+    point the embedding of the next borrower is bound to it. Clients released
+    after an error are closed rather than pooled, and idle clients are closed
+    after `VECTOR_DB_POOL_IDLE_TIMEOUT_IN_SECOND`. Pooling is disabled unless
+    `VECTOR_DB_POOL_MAX_IDLE_PER_KEY` is set.
+    """
+
+    MAX_IDLE_PER_KEY = int(os.environ.get("VECTOR_DB_POOL_MAX_IDLE_PER_KEY", 0))
+    IDLE_TIMEOUT_IN_SECOND = int(
+        os.environ.get("VECTOR_DB_POOL_IDLE_TIMEOUT_IN_SECOND", 300)
+    )
+    GENERATION_KEY_PREFIX = "adapter_instance:generation"
+
+    _idle: defaultdict[PoolKey, list[tuple[VectorDB, float]]] = defaultdict(list)
+    _lock = threading.Lock()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.MAX_IDLE_PER_KEY > 0 and cls.IDLE_TIMEOUT_IN_SECOND > 0
+
+    @classmethod
+    def _get_key(
+        cls, platform_key: str, adapter_instance_id: str, embedding: Embedding
+    ) -> PoolKey | None:
+        try:
+            _, organization_id = DBUtils.get_organization_from_bearer_token(platform_key)
+            generation = RedisUtils.get_client().get(
+                f"{cls.GENERATION_KEY_PREFIX}:{adapter_instance_id}"
+            )
+        except Exception as e:
+            logger.warning(f"Unable to pool vector DB {adapter_instance_id}: {e}")
+            return None
+        dimension = getattr(embedding, "_length", None)
+        return organization_id, adapter_instance_id, dimension, generation
+
+    @staticmethod
+    def _bind(vector_db: VectorDB, tool: BaseTool, embedding: Embedding) -> None:
+        # Clients carry the tool and embedding model (along with its usage
+        # callbacks) of the request that created them
+        vector_db._tool = tool
+        vector_db._embedding_instance = embedding._embedding_instance
+
+    @classmethod
+    def acquire(
+        cls,
+        tool: BaseTool,
+        platform_key: str,
+        adapter_instance_id: str,
+        embedding: Embedding,
+    ) -> VectorDB:
+        """Borrows a vector DB client, creating one if none is idle.
+
+        Args:
+            tool (BaseTool): Tool of the current request
+            platform_key (str): Platform key of the current request
+            adapter_instance_id (str): Vector DB adapter instance ID
+            embedding (Embedding): Embedding to use with the vector DB
+
+        Returns:
+            VectorDB: Client to return through `release()`
+        """
+        key = None
+        if cls.is_enabled():
+            key = cls._get_key(platform_key, adapter_instance_id, embedding)
+        vector_db = None
+        if key:
+            cls._evict_idle()
+            with cls._lock:
+                if cls._idle.get(key):
+                    vector_db, _ = cls._idle[key].pop()
+            if vector_db:
+                cls._bind(vector_db, tool, embedding)
+        if not vector_db:
+            vector_db = VectorDB(
+                tool=tool,
+                adapter_instance_id=adapter_instance_id,
+                embedding=embedding,
+            )
+        vector_db._pool_key = key
+        return vector_db
+
+    @classmethod
+    def release(cls, vector_db: VectorDB, discard: bool = False) -> None:
+        """Returns a borrowed client to the pool.
+
+        Args:
+            vector_db (VectorDB): Client obtained from `acquire()`
+            discard (bool): Closes the client instead, e.g. after an error
+        """
+        key: PoolKey | None = getattr(vector_db, "_pool_key", None)
+        if key and not discard and cls.is_enabled():
+            with cls._lock:
+                idle = cls._idle[key]
+                if len(idle) < cls.MAX_IDLE_PER_KEY:
+                    idle.append((vector_db, time.monotonic()))
+                    return
+        cls._close(vector_db)
+
+    @classmethod
+    def _evict_idle(cls) -> None:
+        expired: list[VectorDB] = []
+        deadline = time.monotonic() - cls.IDLE_TIMEOUT_IN_SECOND
+        with cls._lock:
+            for key in list(cls._idle):
+                idle = cls._idle[key]
+                expired.extend(vector_db for vector_db, t in idle if t < deadline)
+                idle[:] = [(vector_db, t) for vector_db, t in idle if t >= deadline]
+                if not idle:
+                    del cls._idle[key]
+        for vector_db in expired:
+            cls._close(vector_db)
+
+    @staticmethod
+    def _close(vector_db: VectorDB) -> None:
+        try:
+            vector_db.close()
+        except Exception as e:
+            logger.warning(f"Error while closing vector DB: {e}")
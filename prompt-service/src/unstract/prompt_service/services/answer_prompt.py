@@ -6,18 +6,19 @@ from flask import current_app as app
 from json_repair import repair_json
 
 from unstract.core.flask.exceptions import APIError
-from unstract.prompt_service.constants import ExecutionSource, FileStorageKeys, RunLevel
+from unstract.prompt_service.constants import ExecutionSource, RunLevel
 from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
 from unstract.prompt_service.exceptions import RateLimitError
+from unstract.prompt_service.helpers.extracted_text_cache import ExtractedTextCache
+from unstract.prompt_service.helpers.highlight_data_cache import HighlightDataCache
 from unstract.prompt_service.helpers.plugin import PluginManager
 from unstract.prompt_service.utils.env_loader import get_env_or_die
+from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.prompt_service.utils.log import publish_log
 from unstract.sdk.constants import LogLevel
 from unstract.sdk.exceptions import RateLimitError as SdkRateLimitError
 from unstract.sdk.exceptions import SdkError
-from unstract.sdk.file_storage import FileStorage, FileStorageProvider
-from unstract.sdk.file_storage.constants import StorageType
-from unstract.sdk.file_storage.env_helper import EnvHelper
+from unstract.sdk.file_storage import FileStorage
 from unstract.sdk.llm import LLM
 
 
@@ -141,21 +142,11 @@ class AnswerPromptService:
             )
             highlight_data = None
             if highlight_data_plugin and enable_highlight:
-                fs_instance: FileStorage = FileStorage(FileStorageProvider.LOCAL)
-                if execution_source == ExecutionSource.IDE.value:
-                    fs_instance = EnvHelper.get_storage(
-                        storage_type=StorageType.PERMANENT,
-                        env_name=FileStorageKeys.PERMANENT_REMOTE_STORAGE,
-                    )
-                if execution_source == ExecutionSource.TOOL.value:
-                    fs_instance = EnvHelper.get_storage(
-                        storage_type=StorageType.SHARED_TEMPORARY,
-                        env_name=FileStorageKeys.TEMPORARY_REMOTE_STORAGE,
-                    )
-                highlight_data = highlight_data_plugin["entrypoint_cls"](
+                highlight_data = HighlightDataCache.get_highlight_data(
+                    highlight_data_plugin=highlight_data_plugin,
                     file_path=file_path,
-                    fs_instance=fs_instance,
-                ).run
+                    execution_source=execution_source,
+                )
             completion = llm.complete(
                 prompt=prompt,
                 process_text=highlight_data,
@@ -200,17 +191,9 @@ class AnswerPromptService:
                 "Unable to extract table details. "
                 "Please contact admin to resolve this issue."
             )
-        fs_instance: FileStorage = FileStorage(FileStorageProvider.LOCAL)
-        if execution_source == ExecutionSource.IDE.value:
-            fs_instance = EnvHelper.get_storage(
-                storage_type=StorageType.PERMANENT,
-                env_name=FileStorageKeys.PERMANENT_REMOTE_STORAGE,
-            )
-        if execution_source == ExecutionSource.TOOL.value:
-            fs_instance = EnvHelper.get_storage(
-                storage_type=StorageType.SHARED_TEMPORARY,
-                env_name=FileStorageKeys.TEMPORARY_REMOTE_STORAGE,
-            )
+        fs_instance: FileStorage = FileUtils.get_fs_instance(
+            execution_source=execution_source
+        )
         try:
             answer = table_extractor["entrypoint_cls"].run_table_extraction(
                 llm=llm,
@@ -293,23 +276,19 @@ class AnswerPromptService:
         extract_file_path = file_path
 
         # Read file content into context
-        fs_instance: FileStorage = FileStorage(FileStorageProvider.LOCAL)
-        if execution_source == ExecutionSource.IDE.value:
-            fs_instance = EnvHelper.get_storage(
-                storage_type=StorageType.PERMANENT,
-                env_name=FileStorageKeys.PERMANENT_REMOTE_STORAGE,
-            )
-        if execution_source == ExecutionSource.TOOL.value:
-            fs_instance = EnvHelper.get_storage(
-                storage_type=StorageType.SHARED_TEMPORARY,
-                env_name=FileStorageKeys.TEMPORARY_REMOTE_STORAGE,
-            )
+        fs_instance: FileStorage = FileUtils.get_fs_instance(
+            execution_source=execution_source
+        )
 
         if not fs_instance.exists(extract_file_path):
             raise FileNotFoundError(
                 f"The file at path '{extract_file_path}' does not exist."
             )
-        context = fs_instance.read(path=extract_file_path, encoding="utf-8", mode="r")
+        context = ExtractedTextCache.read(
+            fs=fs_instance,
+            file_path=extract_file_path,
+            execution_source=execution_source,
+        )
 
         prompt = AnswerPromptService.construct_prompt(
             preamble=tool_settings.get(PSKeys.PREAMBLE, ""),
@@ -1,9 +1,14 @@
+import logging
 from pathlib import Path
 from typing import Any
 
 from unstract.prompt_service.constants import ExecutionSource
 from unstract.prompt_service.constants import IndexingConstants as IKeys
 from unstract.prompt_service.exceptions import ExtractionError
+from unstract.prompt_service.helpers.extraction_cache import (
+    CachedExtraction,
+    ExtractionCache,
+)
 from unstract.prompt_service.helpers.prompt_ide_base_tool import PromptServiceBaseTool
 from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.sdk.adapters.exceptions import AdapterError
@@ -14,6 +19,8 @@ from unstract.sdk.utils import ToolUtils
 from unstract.sdk.utils.common_utils import log_elapsed
 from unstract.sdk.x2txt import TextExtractionResult, X2Text
 
+logger = logging.getLogger(__name__)
+
 
 class ExtractionService:
     @staticmethod
@@ -37,11 +44,56 @@ class ExtractionService:
             tool=util, adapter_instance_id=x2text_instance_id, usage_kwargs=usage_kwargs
         )
         fs = FileUtils.get_fs_instance(execution_source=execution_source)
-        try:
-            if enable_highlight and (
-                isinstance(x2text.x2text_instance, LLMWhisperer)
-                or isinstance(x2text.x2text_instance, LLMWhispererV2)
+        is_highlight_supported = enable_highlight and (
+            isinstance(x2text.x2text_instance, LLMWhisperer)
+            or isinstance(x2text.x2text_instance, LLMWhispererV2)
+        )
+        cache = ExtractionCache(fs=fs, execution_source=execution_source)
+        cache_key = None
+        # Highlighting also needs the line metadata written next to the output
+        line_metadata_path = None
+        if is_highlight_supported and output_file_path:
+            line_metadata_path = ExtractionService.get_line_metadata_path(
+                output_file_path
+            )
+        if cache.is_enabled():
+            cache_key = ExtractionCache.get_key(
+                file_hash=fs.get_hash_from_file(path=file_path),
+                x2text_instance_id=x2text_instance_id,
+                adapter_settings=getattr(x2text.x2text_instance, "config", {}),
+                enable_highlight=is_highlight_supported,
+                execution_source=execution_source,
+            )
+            cached_extraction = cache.get(cache_key)
+            if cached_extraction and (
+                line_metadata_path is None or cached_extraction.line_metadata is not None
             ):
+                logger.info(f"Serving extraction of '{file_path}' from cache")
+                if output_file_path:
+                    fs.write(
+                        path=output_file_path,
+                        mode="w",
+                        data=cached_extraction.extracted_text,
+                    )
+                if line_metadata_path:
+                    fs.mkdir(line_metadata_path.parent, create_parents=True)
+                    fs.write(
+                        path=line_metadata_path,
+                        mode="w",
+                        data=cached_extraction.line_metadata,
+                    )
+                if is_highlight_supported:
+                    ExtractionService.update_exec_metadata(
+                        fs,
+                        execution_source,
+                        tool_exec_metadata,
+                        execution_run_data_folder,
+                        cached_extraction.whisper_hash,
+                    )
+                return cached_extraction.extracted_text
+        try:
+            whisper_hash = None
+            if is_highlight_supported:
                 process_response: TextExtractionResult = x2text.process(
                     input_file_path=file_path,
                     output_file_path=output_file_path,
@@ -49,12 +101,13 @@ class ExtractionService:
                     tags=tags,
                     fs=fs,
                 )
+                whisper_hash = process_response.extraction_metadata.whisper_hash
                 ExtractionService.update_exec_metadata(
                     fs,
                     execution_source,
                     tool_exec_metadata,
                     execution_run_data_folder,
-                    process_response,
+                    whisper_hash,
                 )
             else:
                 process_response: TextExtractionResult = x2text.process(
@@ -64,6 +117,19 @@ class ExtractionService:
                     fs=fs,
                 )
             extracted_text = process_response.extracted_text
+            line_metadata = None
+            if line_metadata_path and fs.exists(line_metadata_path):
+                line_metadata = fs.read(path=line_metadata_path, mode="r")
+            # Without its line metadata an entry could not serve highlights
+            if cache_key and (line_metadata_path is None or line_metadata):
+                cache.put(
+                    cache_key,
+                    CachedExtraction(
+                        extracted_text=extracted_text,
+                        whisper_hash=whisper_hash,
+                        line_metadata=line_metadata,
+                    ),
+                )
             return extracted_text
         except AdapterError as e:
             msg = f"Error from text extractor '{x2text.x2text_instance.get_name()}'. "
@@ -71,16 +137,25 @@ class ExtractionService:
             code = e.status_code if e.status_code != -1 else 500
             raise ExtractionError(msg, code=code) from e
 
+    @staticmethod
+    def get_line_metadata_path(output_file_path: str) -> Path:
+        """Returns where LLMWhisperer writes the line metadata of an output.
+
+        i.e. `<output_dir>/metadata/<output_file_stem>.json`, which the
+        highlight data plugin reads to locate answers in the document.
+        """
+        output_path = Path(output_file_path)
+        return output_path.parent / "metadata" / output_path.with_suffix(".json").name
+
     @staticmethod
     def update_exec_metadata(
         fs,
         execution_source,
         tool_exec_metadata,
         execution_run_data_folder,
-        process_response,
+        whisper_hash_value,
     ):
         if execution_source == ExecutionSource.TOOL.value:
-            whisper_hash_value = process_response.extraction_metadata.whisper_hash
             metadata = {X2TextConstants.WHISPER_HASH: whisper_hash_value}
             for key, value in metadata.items():
                 tool_exec_metadata[key] = value
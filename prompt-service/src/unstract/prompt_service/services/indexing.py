@@ -1,5 +1,6 @@
 import logging
 
+from unstract.prompt_service.core.cached_embedding import CachedEmbedding
 from unstract.prompt_service.core.index_v2 import Index
 from unstract.prompt_service.dto import (
     ChunkingConfig,
@@ -9,10 +10,10 @@ from unstract.prompt_service.dto import (
 )
 from unstract.prompt_service.exceptions import APIError
 from unstract.prompt_service.helpers.prompt_ide_base_tool import PromptServiceBaseTool
+from unstract.prompt_service.helpers.vector_db_pool import VectorDBPool
 from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.sdk.embedding import Embedding
 from unstract.sdk.utils.indexing_utils import IndexingUtils
-from unstract.sdk.vector_db import VectorDB
 
 logger = logging.getLogger(__name__)
 
@@ -56,9 +57,15 @@ class IndexingService:
                 adapter_instance_id=instance_identifiers.embedding_instance_id,
                 usage_kwargs=processing_options.usage_kwargs,
             )
+            # Reuse embeddings of chunks which were embedded before
+            embedding._embedding_instance = CachedEmbedding.wrap(
+                embedding._embedding_instance,
+                adapter_instance_id=instance_identifiers.embedding_instance_id,
+            )
 
-            vector_db = VectorDB(
+            vector_db = VectorDBPool.acquire(
                 tool=util,
+                platform_key=platform_key,
                 adapter_instance_id=instance_identifiers.vector_db_instance_id,
                 embedding=embedding,
             )
@@ -70,15 +77,30 @@ class IndexingService:
             )
 
             # Index and return doc_id
-            index.perform_indexing(
-                vector_db=vector_db,
-                doc_id=doc_id,
-                extracted_text=extracted_text,
-                doc_id_found=doc_id_found,
+            if len(extracted_text) > Index.STREAMING_THRESHOLD_CHARS:
+                index.perform_streaming_indexing(
+                    vector_db=vector_db,
+                    embedding=embedding,
+                    doc_id=doc_id,
+                    text_windows=Index.iter_text_windows(
+                        extracted_text, Index.STREAMING_WINDOW_CHARS
+                    ),
+                    doc_id_found=doc_id_found,
+                )
+            else:
+                index.perform_indexing(
+                    vector_db=vector_db,
+                    doc_id=doc_id,
+                    extracted_text=extracted_text,
+                    doc_id_found=doc_id_found,
+                    embedding=embedding,
+                )
+            index.confirm_indexing(
+                doc_id=doc_id, embedding=embedding, vector_db=vector_db
             )
-            return doc_id
         except Exception as e:
-            raise APIError(f"Error while indexing : {str(e)}") from e
-        finally:
             if "vector_db" in locals():
-                vector_db.close()
+                VectorDBPool.release(vector_db, discard=True)
+            raise APIError(f"Error while indexing : {str(e)}") from e
+        VectorDBPool.release(vector_db)
+        return doc_id
@@ -1,15 +1,27 @@
+import asyncio
 import datetime
+import logging
 from typing import Any
 
+from llama_index.core.base.embeddings.base import BaseEmbedding
+
 from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
 from unstract.prompt_service.core.retrievers.simple import SimpleRetriever
 from unstract.prompt_service.core.retrievers.subquestion import SubquestionRetriever
+from unstract.prompt_service.helpers.extracted_text_cache import ExtractedTextCache
+from unstract.prompt_service.helpers.prompt_ide_base_tool import PromptServiceBaseTool
 from unstract.prompt_service.services.answer_prompt import AnswerPromptService
+from unstract.prompt_service.services.variable_replacement import (
+    VariableReplacementService,
+)
 from unstract.prompt_service.utils.file_utils import FileUtils
 from unstract.prompt_service.utils.metrics import Metrics
+from unstract.sdk.embedding import Embedding
 from unstract.sdk.llm import LLM
 from unstract.sdk.vector_db import VectorDB
 
+logger = logging.getLogger(__name__)
+
 
 class RetrievalService:
     @staticmethod
@@ -25,6 +37,7 @@ class RetrievalService:
         execution_source: str,
         file_path: str,
         context_retrieval_metrics: dict[str, Any],
+        query_embedding: list[float] | None = None,
     ) -> tuple[str, list[str]]:
         context: list[str]
         if chunk_size == 0:
@@ -42,6 +55,7 @@ class RetrievalService:
                 vector_db=vector_db,
                 retrieval_type=retrieval_type,
                 context_retrieval_metrics=context_retrieval_metrics,
+                query_embedding=query_embedding,
             )
         answer = AnswerPromptService.construct_and_run_prompt(  # type:ignore
             tool_settings=tool_settings,
@@ -63,6 +77,7 @@ class RetrievalService:
         vector_db: VectorDB,
         retrieval_type: str,
         context_retrieval_metrics: dict[str, Any],
+        query_embedding: list[float] | None = None,
     ) -> list[str]:
         context: set[str]
         prompt = output[PSKeys.PROMPTX]
@@ -84,6 +99,7 @@ class RetrievalService:
                 prompt=prompt,
                 top_k=top_k,
                 llm=llm,
+                query_embedding=query_embedding,
             ).retrieve()
         context_retrieval_metrics[prompt_key] = {
             "time_taken(s)": Metrics.elapsed_time(start_time=retrieval_start_time)
@@ -107,8 +123,89 @@ class RetrievalService:
         """
         fs_instance = FileUtils.get_fs_instance(execution_source=execution_source)
         retrieval_start_time = datetime.datetime.now()
-        context = fs_instance.read(path=file_path, mode="r")
+        context = ExtractedTextCache.read(
+            fs=fs_instance, file_path=file_path, execution_source=execution_source
+        )
         context_retrieval_metrics[prompt_key] = {
             "time_taken(s)": Metrics.elapsed_time(start_time=retrieval_start_time)
         }
         return [context]
+
+    @staticmethod
+    def precompute_query_embeddings(
+        prompts: list[dict[str, Any]],
+        variable_names: list[str],
+        util: PromptServiceBaseTool,
+        usage_kwargs: dict[str, Any],
+    ) -> dict[str, tuple[str, list[float]]]:
+        """Embeds the queries of all prompts of a request upfront.
+
+        Queries are grouped by embedding adapter and embedded concurrently.
+        Only prompts whose query is known before execution are considered,
+        i.e. prompts using simple retrieval which neither reference variables
+        nor other prompts' answers.
+
+        Args:
+            prompts (list[dict[str, Any]]): Prompts of the request
+            variable_names (list[str]): Names of all prompts of the request
+            util (PromptServiceBaseTool): Tool used to fetch adapters
+            usage_kwargs (dict[str, Any]): Kwargs used to record usage
+
+        Returns:
+            dict[str, tuple[str, list[float]]]: Query text and its embedding
+                keyed by prompt name
+        """
+        queries: dict[str, dict[str, str]] = {}
+        for output in prompts:
+            prompt_text = output[PSKeys.PROMPT]
+            if (
+                output.get(PSKeys.RETRIEVAL_STRATEGY) != PSKeys.SIMPLE
+                or output[PSKeys.CHUNK_SIZE] == 0
+                or output[PSKeys.TYPE] in {PSKeys.TABLE, PSKeys.LINE_ITEM}
+                or VariableReplacementService.is_variables_present(prompt_text)
+                or any(f"%{name}%" in prompt_text for name in variable_names)
+            ):
+                continue
+            embedding_id = output[PSKeys.EMBEDDING]
+            queries.setdefault(embedding_id, {})[output[PSKeys.NAME]] = prompt_text
+
+        query_embeddings: dict[str, tuple[str, list[float]]] = {}
+        for embedding_id, prompt_queries in queries.items():
+            try:
+                embedding = Embedding(
+                    tool=util,
+                    adapter_instance_id=embedding_id,
+                    usage_kwargs=usage_kwargs.copy(),
+                )
+                vectors = RetrievalService._embed_queries(
+                    embedding._embedding_instance, list(prompt_queries.values())
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Unable to precompute query embeddings using {embedding_id}, "
+                    f"queries will be embedded during retrieval: {e}"
+                )
+                continue
+            for (prompt_name, query), vector in zip(
+                prompt_queries.items(), vectors, strict=True
+            ):
+                query_embeddings[prompt_name] = (query, vector)
+        return query_embeddings
+
+    @staticmethod
+    def _embed_queries(
+        embedding_instance: BaseEmbedding, queries: list[str]
+    ) -> list[list[float]]:
+        """Embeds queries concurrently.
+
+        Queries go through the query embedding API, as during retrieval, since
+        some models embed queries differently from texts (e.g. by task type or
+        instruction prefixes).
+        """
+
+        async def embed_concurrently() -> list[list[float]]:
+            return await asyncio.gather(
+                *(embedding_instance.aget_query_embedding(q) for q in queries)
+            )
+
+        return asyncio.run(embed_concurrently())
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any
+
+import fakeredis
+import pytest
+from llama_index.core import MockEmbedding
+from llama_index.core.callbacks import CallbackManager, CBEventType, EventPayload
+from llama_index.core.callbacks.base_handler import BaseCallbackHandler
+
+from unstract.prompt_service.core.cached_embedding import CachedEmbedding
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+
+EMBED_DIM = 8
+
+
+class UsageHandler(BaseCallbackHandler):
+    """Counts embedded chunks like the SDK's usage handler."""
+
+    def __init__(self) -> None:
+        super().__init__(event_starts_to_ignore=[], event_ends_to_ignore=[])
+        self.embedded_chunks = 0
+
+    def on_event_start(self, *args: Any, **kwargs: Any) -> str:
+        return ""
+
+    def on_event_end(
+        self,
+        event_type: CBEventType,
+        payload: dict[str, Any] | None = None,
+        event_id: str = "",
+        **kwargs: Any,
+    ) -> None:
+        if event_type == CBEventType.EMBEDDING and payload:
+            self.embedded_chunks += len(payload[EventPayload.CHUNKS])
+
+    def start_trace(self, trace_id: str | None = None) -> None:
+        pass
+
+    def end_trace(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def redis_client(mocker):
+    redis_client = fakeredis.FakeRedis()
+    mocker.patch.object(RedisUtils, "_client", redis_client)
+    mocker.patch.object(CachedEmbedding, "TTL_IN_SECOND", 60)
+    return redis_client
+
+
+@pytest.fixture
+def usage_handler():
+    return UsageHandler()
+
+
+@pytest.fixture
+def embedding(redis_client, usage_handler):
+    model = MockEmbedding(embed_dim=EMBED_DIM)
+    # Set by the SDK on the adapter's model to record usage
+    model.callback_manager = CallbackManager([usage_handler])
+    return CachedEmbedding.wrap(model, adapter_instance_id="embedding")
+
+
+def test_usage_is_recorded_for_missed_chunks_only(embedding, usage_handler):
+    embedding.get_text_embedding_batch(["one", "two"])
+    assert usage_handler.embedded_chunks == 2
+
+    embedding.get_text_embedding_batch(["one", "two", "three"])
+    assert usage_handler.embedded_chunks == 3
+
+    embedding.get_text_embedding_batch(["three", "one"])
+    assert usage_handler.embedded_chunks == 3
+
+
+async def embed_async(embedding: CachedEmbedding, texts: list[str]) -> list:
+    return await embedding.aget_text_embedding_batch(texts)
+
+
+def test_async_usage_is_recorded_for_missed_chunks_only(embedding, usage_handler):
+    asyncio.run(embed_async(embedding, ["one", "two"]))
+    asyncio.run(embed_async(embedding, ["two", "three"]))
+
+    assert usage_handler.embedded_chunks == 3
+
+
+def test_cached_vectors_are_float32(embedding, redis_client):
+    vectors = embedding.get_text_embedding_batch(["one", "two"])
+
+    keys = redis_client.keys(f"{CachedEmbedding.KEY_PREFIX}:*")
+    assert len(keys) == 2
+    assert all(len(redis_client.get(key)) == 4 * EMBED_DIM for key in keys)
+    assert embedding.get_text_embedding_batch(["two", "one"]) == [vectors[1], vectors[0]]
+
+
+def test_cache_is_opt_in(mocker):
+    mocker.patch.object(CachedEmbedding, "TTL_IN_SECOND", 0)
+    model = MockEmbedding(embed_dim=EMBED_DIM)
+
+    assert CachedEmbedding.wrap(model, adapter_instance_id="embedding") is model
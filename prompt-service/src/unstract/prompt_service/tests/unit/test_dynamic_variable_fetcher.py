@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from unstract.prompt_service.exceptions import APIError
+from unstract.prompt_service.helpers import dynamic_variable_fetcher
+from unstract.prompt_service.helpers.dynamic_variable_fetcher import (
+    DynamicVariableFetcher,
+)
+
+URL = "http://dynamic-variable/resolve"
+OTHER_URL = "http://other-variable/resolve"
+
+
+@pytest.fixture(autouse=True)
+def fetcher(mocker):
+    mocker.patch.object(DynamicVariableFetcher, "CACHE_TTL_IN_SECOND", 60)
+    mocker.patch.object(DynamicVariableFetcher, "CACHE_TTLS", {})
+    mocker.patch.object(DynamicVariableFetcher, "_cache", OrderedDict())
+    mocker.patch.object(DynamicVariableFetcher, "_in_flight", {})
+    mocker.patch.object(DynamicVariableFetcher, "_session", None)
+
+
+@pytest.fixture
+def make_http_request(mocker):
+    return mocker.patch.object(
+        dynamic_variable_fetcher,
+        "make_http_request",
+        side_effect=lambda url, data, **kwargs: f"{url}:{data}",
+    )
+
+
+@pytest.fixture
+def monotonic(mocker):
+    monotonic = mocker.patch.object(dynamic_variable_fetcher.time, "monotonic")
+    monotonic.return_value = 1000.0
+    return monotonic
+
+
+def test_response_is_cached_within_ttl(make_http_request, monotonic):
+    assert DynamicVariableFetcher.fetch(url=URL, data="a") == f"{URL}:a"
+
+    monotonic.return_value = 1000.0 + 59
+    assert DynamicVariableFetcher.fetch(url=URL, data="a") == f"{URL}:a"
+
+    assert make_http_request.call_count == 1
+    # Keyed by the request body as well
+    DynamicVariableFetcher.fetch(url=URL, data="b")
+    assert make_http_request.call_count == 2
+
+
+def test_response_expires_after_ttl(make_http_request, monotonic):
+    DynamicVariableFetcher.fetch(url=URL, data="a")
+
+    monotonic.return_value = 1000.0 + 61
+    DynamicVariableFetcher.fetch(url=URL, data="a")
+
+    assert make_http_request.call_count == 2
+
+
+def test_caching_is_disabled_by_default(mocker, make_http_request):
+    mocker.patch.object(DynamicVariableFetcher, "CACHE_TTL_IN_SECOND", 0)
+
+    DynamicVariableFetcher.fetch(url=URL, data="a")
+    DynamicVariableFetcher.fetch(url=URL, data="a")
+
+    assert make_http_request.call_count == 2
+    assert not DynamicVariableFetcher._cache
+
+
+def test_ttl_override_per_url(mocker, monkeypatch, make_http_request, monotonic):
+    monkeypatch.setenv("DYNAMIC_VARIABLE_CACHE_TTLS", f'{{"{OTHER_URL}": 600}}')
+    mocker.patch.object(
+        DynamicVariableFetcher,
+        "CACHE_TTLS",
+        dynamic_variable_fetcher._get_ttl_overrides(),
+    )
+    DynamicVariableFetcher.fetch(url=URL, data="a")
+    DynamicVariableFetcher.fetch(url=OTHER_URL, data="a")
+
+    monotonic.return_value = 1000.0 + 300
+    DynamicVariableFetcher.fetch(url=URL, data="a")
+    DynamicVariableFetcher.fetch(url=OTHER_URL, data="a")
+
+    assert [c.kwargs["url"] for c in make_http_request.call_args_list] == [
+        URL,
+        OTHER_URL,
+        URL,
+    ]
+
+
+def test_invalid_ttl_overrides_are_ignored(monkeypatch):
+    monkeypatch.setenv("DYNAMIC_VARIABLE_CACHE_TTLS", '{"url": "never"}')
+
+    assert dynamic_variable_fetcher._get_ttl_overrides() == {}
+
+
+def test_concurrent_identical_fetches_share_one_request(mocker, make_http_request):
+    # Not cached, so only the in-flight request can be shared
+    mocker.patch.object(DynamicVariableFetcher, "CACHE_TTL_IN_SECOND", 0)
+    waiting = mocker.spy(dynamic_variable_fetcher.logger, "info")
+    release = threading.Event()
+
+    def request(url, data, **kwargs):
+        assert release.wait(timeout=5)
+        return "value"
+
+    make_http_request.side_effect = request
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(DynamicVariableFetcher.fetch, url=URL, data="a")
+            for _ in range(4)
+        ]
+        # Released once the other lookups wait on the first request
+        deadline = time.monotonic() + 5
+        while waiting.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+
+    assert [future.result() for future in futures] == ["value"] * 4
+    assert make_http_request.call_count == 1
+    assert not DynamicVariableFetcher._in_flight
+
+
+def test_failures_are_not_cached(make_http_request):
+    make_http_request.side_effect = [APIError("Variable is down"), "value"]
+
+    with pytest.raises(APIError):
+        DynamicVariableFetcher.fetch(url=URL, data="a")
+
+    assert not DynamicVariableFetcher._cache
+    assert not DynamicVariableFetcher._in_flight
+    assert DynamicVariableFetcher.fetch(url=URL, data="a") == "value"
+    assert make_http_request.call_count == 2
+
+
+def test_cache_is_bounded(mocker, make_http_request):
+    mocker.patch.object(DynamicVariableFetcher, "CACHE_MAX_ENTRIES", 2)
+
+    for data in ("a", "b", "c"):
+        DynamicVariableFetcher.fetch(url=URL, data=data)
+    DynamicVariableFetcher.fetch(url=URL, data="a")
+
+    assert make_http_request.call_count == 4
+    assert len(DynamicVariableFetcher._cache) == 2
@@ -0,0 +1,108 @@
+from collections import OrderedDict
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from unstract.prompt_service.constants import ExecutionSource
+from unstract.prompt_service.helpers.extracted_text_cache import ExtractedTextCache
+
+IDE = ExecutionSource.IDE.value
+TOOL = ExecutionSource.TOOL.value
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+@pytest.fixture(autouse=True)
+def texts(mocker):
+    mocker.patch.object(ExtractedTextCache, "MAX_CHARS", 0)
+    mocker.patch.object(ExtractedTextCache, "_size", 0)
+    return mocker.patch.object(ExtractedTextCache, "_texts", OrderedDict())
+
+
+@pytest.fixture
+def fs():
+    """Storage holding the extracted text of each document."""
+    fs = MagicMock()
+    fs.files = {"doc-1.txt": "a" * 10, "doc-2.txt": "b" * 10, "doc-3.txt": "c" * 10}
+    fs.read.side_effect = lambda path, mode, encoding: fs.files[path]
+    fs.modification_time.return_value = "2026-01-01T00:00:00"
+    return fs
+
+
+def read(fs, file_path, execution_source=IDE):
+    return ExtractedTextCache.read(
+        fs=fs, file_path=file_path, execution_source=execution_source
+    )
+
+
+def read_paths(fs):
+    return [c.kwargs["path"] for c in fs.read.call_args_list]
+
+
+def test_text_is_read_once_per_request(app, fs):
+    with app.app_context():
+        for _ in range(3):
+            assert read(fs, "doc-1.txt") == "a" * 10
+        read(fs, "doc-2.txt")
+        read(fs, "doc-1.txt", execution_source=TOOL)
+    with app.app_context():
+        read(fs, "doc-1.txt")
+
+    # Not shared across requests unless the LRU is enabled
+    assert read_paths(fs) == ["doc-1.txt", "doc-2.txt", "doc-1.txt", "doc-1.txt"]
+    fs.modification_time.assert_not_called()
+
+
+def test_text_is_shared_across_requests(mocker, app, fs):
+    mocker.patch.object(ExtractedTextCache, "MAX_CHARS", 100)
+
+    for _ in range(2):
+        with app.app_context():
+            read(fs, "doc-1.txt")
+            read(fs, "doc-2.txt")
+
+    assert read_paths(fs) == ["doc-1.txt", "doc-2.txt"]
+
+
+def test_modified_text_is_read_again(mocker, app, fs):
+    mocker.patch.object(ExtractedTextCache, "MAX_CHARS", 100)
+    with app.app_context():
+        read(fs, "doc-1.txt")
+
+    fs.files["doc-1.txt"] = "re-extracted"
+    fs.modification_time.return_value = "2026-01-02T00:00:00"
+    with app.app_context():
+        assert read(fs, "doc-1.txt") == "re-extracted"
+
+    assert read_paths(fs) == ["doc-1.txt", "doc-1.txt"]
+
+
+def test_least_recently_used_text_is_evicted(mocker, app, fs, texts):
+    mocker.patch.object(ExtractedTextCache, "MAX_CHARS", 25)
+    with app.app_context():
+        read(fs, "doc-1.txt")
+        read(fs, "doc-2.txt")
+    with app.app_context():
+        # Makes doc-2.txt the least recently used
+        read(fs, "doc-1.txt")
+        read(fs, "doc-3.txt")
+
+    assert [key[1] for key in texts] == ["doc-1.txt", "doc-3.txt"]
+    assert ExtractedTextCache._size == 20
+    with app.app_context():
+        read(fs, "doc-2.txt")
+    assert read_paths(fs) == ["doc-1.txt", "doc-2.txt", "doc-3.txt", "doc-2.txt"]
+
+
+def test_text_larger_than_cache_is_not_shared(mocker, app, fs, texts):
+    mocker.patch.object(ExtractedTextCache, "MAX_CHARS", 5)
+
+    with app.app_context():
+        read(fs, "doc-1.txt")
+
+    assert not texts
+    assert ExtractedTextCache._size == 0
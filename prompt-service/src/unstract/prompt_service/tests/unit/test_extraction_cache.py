@@ -0,0 +1,151 @@
+import json
+
+import fakeredis
+import pytest
+
+from unstract.prompt_service.constants import ExecutionSource
+from unstract.prompt_service.helpers.extraction_cache import (
+    CachedExtraction,
+    ExtractionCache,
+)
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+from unstract.sdk.file_storage import FileStorage, FileStorageProvider
+
+IDE = ExecutionSource.IDE.value
+TOOL = ExecutionSource.TOOL.value
+
+
+@pytest.fixture(autouse=True)
+def redis_client(mocker):
+    redis_client = fakeredis.FakeRedis()
+    mocker.patch.object(RedisUtils, "_client", redis_client)
+    return redis_client
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(mocker, tmp_path):
+    mocker.patch.object(ExtractionCache, "MAX_BYTES", 1024)
+    mocker.patch.object(ExtractionCache, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def fs():
+    return FileStorage(FileStorageProvider.LOCAL)
+
+
+def get_key(file_hash: str = "file-hash", execution_source: str = IDE) -> str:
+    return ExtractionCache.get_key(
+        file_hash=file_hash,
+        x2text_instance_id="x2text",
+        adapter_settings={"mode": "form"},
+        enable_highlight=True,
+        execution_source=execution_source,
+    )
+
+
+def entry_size(extraction: CachedExtraction) -> int:
+    return (
+        len(extraction.extracted_text.encode("utf-8"))
+        + len(json.dumps({"whisper_hash": extraction.whisper_hash}))
+        + len((extraction.line_metadata or "").encode("utf-8"))
+    )
+
+
+def test_hit(fs):
+    cache = ExtractionCache(fs=fs, execution_source=IDE)
+    extraction = CachedExtraction(
+        extracted_text="text", whisper_hash="hash", line_metadata='{"lines": []}'
+    )
+
+    cache.put(get_key(), extraction)
+
+    assert cache.get(get_key()) == extraction
+
+
+def test_miss(fs, cache_dir):
+    cache = ExtractionCache(fs=fs, execution_source=IDE)
+    cache.put(get_key(), CachedExtraction(extracted_text="text"))
+
+    assert cache.get(get_key(file_hash="other-hash")) is None
+
+    # Entries removed from the storage are dropped from the index
+    for path in (cache_dir / IDE).iterdir():
+        path.unlink()
+    assert cache.get(get_key()) is None
+    assert cache.get(get_key()) is None
+
+
+def test_disabled(mocker, fs, cache_dir):
+    mocker.patch.object(ExtractionCache, "MAX_BYTES", 0)
+    cache = ExtractionCache(fs=fs, execution_source=IDE)
+
+    cache.put(get_key(), CachedExtraction(extracted_text="text"))
+
+    assert cache.get(get_key()) is None
+    assert not cache_dir.exists()
+
+
+def test_execution_sources_do_not_share_entries(fs, cache_dir, redis_client):
+    ide_cache = ExtractionCache(fs=fs, execution_source=IDE)
+    tool_cache = ExtractionCache(fs=fs, execution_source=TOOL)
+    extraction = CachedExtraction(extracted_text="text")
+
+    assert get_key(execution_source=IDE) != get_key(execution_source=TOOL)
+    ide_cache.put(get_key(execution_source=IDE), extraction)
+
+    assert tool_cache.get(get_key(execution_source=IDE)) is None
+    assert tool_cache.get(get_key(execution_source=TOOL)) is None
+    assert (cache_dir / IDE).is_dir()
+    assert not (cache_dir / TOOL).exists()
+    assert redis_client.zcard(ide_cache.lru_key) == 1
+    assert redis_client.zcard(tool_cache.lru_key) == 0
+    assert redis_client.get(tool_cache.total_bytes_key) is None
+
+
+def test_least_recently_used_entries_are_evicted(fs, cache_dir, redis_client):
+    cache = ExtractionCache(fs=fs, execution_source=TOOL)
+    extractions = {
+        get_key(file_hash=f"file-{index}", execution_source=TOOL): CachedExtraction(
+            extracted_text=str(index) * 400, line_metadata="{}"
+        )
+        for index in range(3)
+    }
+    first, second, third = extractions
+    cache.put(first, extractions[first])
+    cache.put(second, extractions[second])
+    # Reading the first entry makes the second one least recently used
+    assert cache.get(first)
+
+    cache.put(third, extractions[third])
+
+    assert cache.get(second) is None
+    assert not list(cache_dir.glob(f"{TOOL}/{second}*"))
+    assert cache.get(first) == extractions[first]
+    assert cache.get(third) == extractions[third]
+    assert int(redis_client.get(cache.total_bytes_key)) == entry_size(
+        extractions[first]
+    ) + entry_size(extractions[third])
+    assert set(redis_client.hkeys(cache.sizes_key)) == {
+        first.encode("utf-8"),
+        third.encode("utf-8"),
+    }
+
+
+def test_rewritten_entry_is_counted_once(fs, redis_client):
+    cache = ExtractionCache(fs=fs, execution_source=IDE)
+    cache.put(get_key(), CachedExtraction(extracted_text="short"))
+    extraction = CachedExtraction(extracted_text="longer text")
+
+    cache.put(get_key(), extraction)
+
+    assert int(redis_client.get(cache.total_bytes_key)) == entry_size(extraction)
+
+
+def test_entry_larger_than_cache_is_skipped(fs, redis_client):
+    cache = ExtractionCache(fs=fs, execution_source=IDE)
+
+    cache.put(get_key(), CachedExtraction(extracted_text="x" * 2048))
+
+    assert cache.get(get_key()) is None
+    assert redis_client.get(cache.total_bytes_key) is None
@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from unstract.prompt_service.constants import ExecutionSource
+from unstract.prompt_service.helpers.extraction_cache import ExtractionCache
+from unstract.prompt_service.services import extraction
+from unstract.prompt_service.services.extraction import ExtractionService
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+from unstract.sdk.adapters.x2text.llm_whisperer_v2.src import LLMWhispererV2
+from unstract.sdk.file_storage import FileStorage, FileStorageProvider
+
+LINE_METADATA = json.dumps({"line_metadata": [[1, 0, 10, 100]]})
+
+
+@pytest.fixture(autouse=True)
+def extraction_cache(mocker, tmp_path):
+    mocker.patch.object(RedisUtils, "_client", fakeredis.FakeRedis())
+    mocker.patch.object(ExtractionCache, "MAX_BYTES", 1024**2)
+    mocker.patch.object(ExtractionCache, "CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def x2text(mocker, tmp_path):
+    mocker.patch.object(extraction, "PromptServiceBaseTool")
+    mocker.patch.object(
+        extraction.FileUtils,
+        "get_fs_instance",
+        return_value=FileStorage(FileStorageProvider.LOCAL),
+    )
+    x2text = mocker.patch.object(extraction, "X2Text").return_value
+    x2text.x2text_instance = mocker.MagicMock(spec=LLMWhispererV2)
+    x2text.x2text_instance.config = {"mode": "high_quality"}
+
+    def process(input_file_path, output_file_path, fs, **kwargs):
+        # Writes the extracted text and its line metadata like LLMWhisperer
+        output_path = Path(output_file_path)
+        output_path.write_text("extracted text")
+        line_metadata_path = ExtractionService.get_line_metadata_path(output_path)
+        line_metadata_path.parent.mkdir(exist_ok=True)
+        line_metadata_path.write_text(LINE_METADATA)
+        return SimpleNamespace(
+            extracted_text="extracted text",
+            extraction_metadata=SimpleNamespace(whisper_hash="whisper-hash"),
+        )
+
+    x2text.process.side_effect = process
+    return x2text
+
+
+def extract(tmp_path: Path, run_dir: str, enable_highlight: bool = True) -> str:
+    input_file = tmp_path / "document.pdf"
+    input_file.write_bytes(b"%PDF document")
+    output_dir = tmp_path / run_dir
+    output_dir.mkdir(exist_ok=True)
+    return ExtractionService.perform_extraction(
+        x2text_instance_id="x2text",
+        file_path=str(input_file),
+        run_id="run",
+        platform_key="key",
+        output_file_path=str(output_dir / "document.txt"),
+        enable_highlight=enable_highlight,
+        execution_source=ExecutionSource.IDE.value,
+    )
+
+
+def test_cached_extraction_restores_line_metadata(tmp_path, x2text):
+    assert extract(tmp_path, "first-run") == "extracted text"
+    assert extract(tmp_path, "second-run") == "extracted text"
+
+    assert x2text.process.call_count == 1
+    assert (tmp_path / "second-run" / "document.txt").read_text() == "extracted text"
+    restored = ExtractionService.get_line_metadata_path(
+        tmp_path / "second-run" / "document.txt"
+    )
+    assert restored.read_text() == LINE_METADATA
+
+
+def test_extraction_without_line_metadata_is_not_cached(tmp_path, x2text):
+    def process_without_line_metadata(output_file_path, **kwargs):
+        Path(output_file_path).write_text("extracted text")
+        return SimpleNamespace(
+            extracted_text="extracted text",
+            extraction_metadata=SimpleNamespace(whisper_hash="whisper-hash"),
+        )
+
+    x2text.process.side_effect = process_without_line_metadata
+    extract(tmp_path, "first-run")
+    extract(tmp_path, "second-run")
+
+    assert x2text.process.call_count == 2
+
+
+def test_highlight_setting_is_part_of_the_key(tmp_path, x2text):
+    extract(tmp_path, "first-run", enable_highlight=False)
+    extract(tmp_path, "second-run", enable_highlight=True)
+
+    assert x2text.process.call_count == 2
@@ -0,0 +1,103 @@
+import pytest
+from flask import Flask
+
+from unstract.prompt_service.constants import ExecutionSource
+from unstract.prompt_service.helpers.highlight_data_cache import HighlightDataCache
+from unstract.prompt_service.utils import file_utils
+from unstract.prompt_service.utils.file_utils import FileUtils
+
+IDE = ExecutionSource.IDE.value
+TOOL = ExecutionSource.TOOL.value
+
+
+class HighlightData:
+    """Stands in for the highlight data plugin, reading metadata when created."""
+
+    instances: list["HighlightData"] = []
+
+    def __init__(self, file_path, fs_instance):
+        self.file_path = file_path
+        self.fs_instance = fs_instance
+        self.metadata = fs_instance.read(path=f"{file_path}.metadata", mode="r")
+        self.instances.append(self)
+
+    def run(self, response, **kwargs):
+        return response
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+@pytest.fixture
+def get_storage(mocker):
+    return mocker.patch.object(
+        file_utils.EnvHelper,
+        "get_storage",
+        side_effect=lambda storage_type, env_name: mocker.MagicMock(),
+    )
+
+
+@pytest.fixture
+def highlight_data_plugin():
+    HighlightData.instances = []
+    return {"entrypoint_cls": HighlightData}
+
+
+def get_highlight_data(highlight_data_plugin, file_path, execution_source=IDE):
+    return HighlightDataCache.get_highlight_data(
+        highlight_data_plugin=highlight_data_plugin,
+        file_path=file_path,
+        execution_source=execution_source,
+    )
+
+
+def test_fs_instance_is_created_once_per_request(app, get_storage):
+    with app.app_context():
+        fs_instance = FileUtils.get_fs_instance(IDE)
+        assert FileUtils.get_fs_instance(IDE) is fs_instance
+        assert FileUtils.get_fs_instance(TOOL) is not fs_instance
+    with app.app_context():
+        assert FileUtils.get_fs_instance(IDE) is not fs_instance
+
+    assert get_storage.call_count == 3
+
+
+def test_fs_instance_of_invalid_source(app, get_storage):
+    with app.app_context(), pytest.raises(ValueError):
+        FileUtils.get_fs_instance("")
+
+
+def test_highlight_metadata_is_read_once_per_document(
+    app, get_storage, highlight_data_plugin
+):
+    with app.app_context():
+        for _ in range(3):
+            get_highlight_data(highlight_data_plugin, "doc-1.txt")
+        get_highlight_data(highlight_data_plugin, "doc-2.txt")
+
+    # Each prompt gets its own plugin instance
+    first, second, third, other = HighlightData.instances
+    assert len({id(first), id(second), id(third)}) == 3
+    assert first.fs_instance is second.fs_instance is third.fs_instance
+    assert other.fs_instance is not first.fs_instance
+    storage = first.fs_instance._fs
+    assert [c.kwargs["path"] for c in storage.read.call_args_list] == [
+        "doc-1.txt.metadata",
+        "doc-2.txt.metadata",
+    ]
+    assert first.metadata == third.metadata
+
+
+def test_highlight_metadata_is_read_again_in_next_request(
+    app, get_storage, highlight_data_plugin
+):
+    with app.app_context():
+        get_highlight_data(highlight_data_plugin, "doc-1.txt")
+    with app.app_context():
+        get_highlight_data(highlight_data_plugin, "doc-1.txt")
+
+    first, second = HighlightData.instances
+    assert first.fs_instance is not second.fs_instance
+    assert second.fs_instance._fs.read.call_count == 1
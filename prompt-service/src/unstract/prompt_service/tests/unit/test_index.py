@@ -0,0 +1,197 @@
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+from llama_index.core import Document, MockEmbedding
+from llama_index.core.constants import DEFAULT_EMBED_BATCH_SIZE
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import NodeRelationship
+from pydantic import Field
+
+from unstract.prompt_service.core import index_v2
+from unstract.prompt_service.core.cached_embedding import CachedEmbedding
+from unstract.prompt_service.core.index_v2 import Index
+from unstract.prompt_service.dto import (
+    ChunkingConfig,
+    InstanceIdentifiers,
+    ProcessingOptions,
+)
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+
+DOC_ID = "doc-id"
+CHUNK_SIZE = 64
+CHUNK_OVERLAP = 8
+
+
+class RecordingEmbedding(MockEmbedding):
+    """Records the texts it embedded."""
+
+    embedded: list[str] = Field(default_factory=list)
+
+    def _get_text_embedding(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        return super()._get_text_embedding(text)
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+@pytest.fixture
+def index(mocker):
+    mocker.patch.object(index_v2.time, "sleep")
+    return Index(
+        tool=MagicMock(),
+        instance_identifiers=InstanceIdentifiers(
+            embedding_instance_id="embedding",
+            vector_db_instance_id="vector-db",
+            x2text_instance_id="x2text",
+            llm_instance_id="llm",
+            tool_id="tool",
+        ),
+        chunking_config=ChunkingConfig(
+            chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+        ),
+        processing_options=ProcessingOptions(),
+    )
+
+
+@pytest.fixture
+def cached_embedding(mocker):
+    mocker.patch.object(RedisUtils, "_client", fakeredis.FakeRedis())
+    mocker.patch.object(CachedEmbedding, "TTL_IN_SECOND", 60)
+    return CachedEmbedding.wrap(RecordingEmbedding(embed_dim=4), "embedding")
+
+
+def embedding_of(embedding_instance) -> MagicMock:
+    embedding = MagicMock()
+    embedding._embedding_instance = embedding_instance
+    return embedding
+
+
+def test_default_embedding_batches_are_raised(index, cached_embedding):
+    index._configure_embedding_batches(embedding_of(cached_embedding))
+
+    for embedding_instance in (cached_embedding, cached_embedding.embedding):
+        assert embedding_instance.embed_batch_size == Index.EMBEDDING_BATCH_SIZE
+        assert embedding_instance.num_workers == Index.EMBEDDING_MAX_CONCURRENCY
+
+
+def test_adapter_embedding_batches_are_kept(index):
+    embedding_instance = MockEmbedding(embed_dim=4, embed_batch_size=16, num_workers=1)
+    assert embedding_instance.embed_batch_size != DEFAULT_EMBED_BATCH_SIZE
+
+    index._configure_embedding_batches(embedding_of(embedding_instance))
+
+    assert embedding_instance.embed_batch_size == 16
+    assert embedding_instance.num_workers == 1
+
+
+def test_rate_limited_indexing_reembeds_document(index, cached_embedding):
+    text = " ".join(f"Sentence number {i} of the document." for i in range(40))
+    documents = [Document(text=text, doc_id=DOC_ID)]
+    chunks = [
+        node.get_content()
+        for node in SentenceSplitter(
+            chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+        ).get_nodes_from_documents(documents)
+    ]
+    calls = []
+
+    def index_document(documents, chunk_size, chunk_overlap, **kwargs):
+        nodes = SentenceSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        ).get_nodes_from_documents(documents)
+        cached_embedding.get_text_embedding_batch([n.get_content() for n in nodes])
+        calls.append("index_document")
+        if calls.count("index_document") == 1:
+            # Rate limited by the vector DB after part of the nodes were written
+            raise RateLimitError("Too many requests")
+
+    vector_db = MagicMock()
+    vector_db.index_document.side_effect = index_document
+    vector_db.delete.side_effect = lambda ref_doc_id: calls.append("delete")
+
+    index._trigger_indexing(vector_db, documents, DOC_ID)
+
+    # The partial attempt is dropped and the whole document indexed again
+    assert calls == ["index_document", "delete", "index_document"]
+    vector_db.delete.assert_called_once_with(ref_doc_id=DOC_ID)
+    # Chunks embedded by the failed attempt are served from the cache
+    assert len(chunks) > 1
+    assert cached_embedding.embedding.embedded == chunks
+
+
+def document_text() -> str:
+    paragraphs = []
+    for paragraph in range(60):
+        sentences = [
+            f"Clause {paragraph}.{sentence} covers item {sentence * 7 % 13} of the "
+            f"agreement{', as amended' * (sentence % 3)}."
+            for sentence in range(paragraph % 9 + 3)
+        ]
+        paragraphs.append(" ".join(sentences))
+    return "\n\n".join(paragraphs)
+
+
+@pytest.mark.parametrize("window_size", [1000, 3777, 10000])
+def test_windows_are_split_like_whole_document(index, window_size):
+    text = document_text()
+    document = index._prepare_documents(
+        DOC_ID, [{"section": "full", "text_contents": text}]
+    )[0]
+    expected = SentenceSplitter.from_defaults(
+        chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP
+    ).get_nodes_from_documents([document])
+
+    batches = list(
+        index._iter_node_batches(DOC_ID, Index.iter_text_windows(text, window_size))
+    )
+    nodes = [node for batch in batches for node in batch]
+
+    assert len(text) > window_size * 2
+    assert len(batches) > 1
+    assert [(n.get_content(), n.start_char_idx, n.end_char_idx) for n in nodes] == [
+        (n.get_content(), n.start_char_idx, n.end_char_idx) for n in expected
+    ]
+    for node in nodes:
+        assert text[node.start_char_idx : node.end_char_idx] == node.get_content()
+    for previous_node, node in zip(nodes, nodes[1:], strict=False):
+        assert previous_node.relationships[NodeRelationship.NEXT].node_id == (
+            node.node_id
+        )
+        assert node.relationships[NodeRelationship.PREVIOUS].node_id == (
+            previous_node.node_id
+        )
+
+
+def test_rate_limited_insert_drops_partial_batch(index):
+    nodes = next(
+        index._iter_node_batches(DOC_ID, Index.iter_text_windows(document_text(), 5000))
+    )
+    vector_store_index = MagicMock()
+    vector_store_index.insert_nodes.side_effect = [RateLimitError("429"), None]
+
+    index._insert_nodes(vector_store_index, nodes)
+
+    vector_store_index.delete_nodes.assert_called_once_with(
+        [node.node_id for node in nodes]
+    )
+    assert [name for name, *_ in vector_store_index.mock_calls] == [
+        "insert_nodes",
+        "delete_nodes",
+        "insert_nodes",
+    ]
+
+
+def test_rate_limited_insert_without_node_deletion(index):
+    nodes = next(
+        index._iter_node_batches(DOC_ID, Index.iter_text_windows(document_text(), 5000))
+    )
+    vector_store_index = MagicMock()
+    vector_store_index.insert_nodes.side_effect = [RateLimitError("429"), None]
+    vector_store_index.delete_nodes.side_effect = NotImplementedError
+
+    index._insert_nodes(vector_store_index, nodes)
+
+    assert vector_store_index.insert_nodes.call_count == 2
@@ -0,0 +1,114 @@
+import hashlib
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from llama_index.core import VectorStoreIndex
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.schema import TextNode
+
+from unstract.prompt_service.constants import PromptServiceConstants as PSKeys
+from unstract.prompt_service.core.retrievers.simple import SimpleRetriever
+from unstract.prompt_service.services import retrieval
+from unstract.prompt_service.services.retrieval import RetrievalService
+
+PROMPT = "What is the invoice number?"
+DOC_ID = "doc-id"
+
+
+class AsymmetricEmbedding(BaseEmbedding):
+    """Embeds queries with an instruction prefix, unlike texts."""
+
+    @staticmethod
+    def _embed(text: str) -> list[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [byte / 255 for byte in digest[:8]]
+
+    def _get_query_embedding(self, query: str) -> list[float]:
+        return self._embed(f"query: {query}")
+
+    async def _aget_query_embedding(self, query: str) -> list[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> list[float]:
+        return self._embed(text)
+
+
+@pytest.fixture
+def embed_model():
+    return AsymmetricEmbedding()
+
+
+@pytest.fixture
+def vector_db(embed_model):
+    nodes = [
+        TextNode(text=text, metadata={"doc_id": DOC_ID})
+        for text in ("Invoice number: 42", "Total: 100 USD", "Due date: tomorrow")
+    ]
+    vector_db = MagicMock()
+    vector_db.get_vector_store_index.return_value = VectorStoreIndex(
+        nodes=nodes, embed_model=embed_model
+    )
+    return vector_db
+
+
+def prompt(name: str, text: str) -> dict:
+    return {
+        PSKeys.NAME: name,
+        PSKeys.PROMPT: text,
+        PSKeys.RETRIEVAL_STRATEGY: PSKeys.SIMPLE,
+        PSKeys.CHUNK_SIZE: 512,
+        PSKeys.TYPE: "text",
+        PSKeys.EMBEDDING: "embedding-id",
+    }
+
+
+def precompute(mocker, embed_model, prompts: list[dict]) -> dict:
+    embedding = mocker.patch.object(retrieval, "Embedding").return_value
+    embedding._embedding_instance = embed_model
+    return RetrievalService.precompute_query_embeddings(
+        prompts=prompts,
+        variable_names=[output[PSKeys.NAME] for output in prompts],
+        util=MagicMock(),
+        usage_kwargs={},
+    )
+
+
+def test_precomputed_query_embeddings_match_retrieval(mocker, embed_model):
+    prompts = [prompt("invoice_number", PROMPT), prompt("total", "What is the total?")]
+
+    query_embeddings = precompute(mocker, embed_model, prompts)
+
+    for output in prompts:
+        query, vector = query_embeddings[output[PSKeys.NAME]]
+        assert query == output[PSKeys.PROMPT]
+        # As embedded by the vector index retriever when none is given
+        assert vector == embed_model.get_agg_embedding_from_queries([query])
+        assert vector != embed_model.get_text_embedding(query)
+
+
+def test_prompts_referencing_answers_are_skipped(mocker, embed_model):
+    prompts = [
+        prompt("invoice_number", PROMPT),
+        prompt("total", "Sum of %invoice_number%"),
+    ]
+
+    assert set(precompute(mocker, embed_model, prompts)) == {"invoice_number"}
+
+
+def test_retrieval_with_precomputed_query_embedding(mocker, embed_model, vector_db):
+    _, vector = precompute(mocker, embed_model, [prompt("invoice_number", PROMPT)])[
+        "invoice_number"
+    ]
+
+    def retrieve(query_embedding: list[float] | None) -> set[str]:
+        return SimpleRetriever(
+            vector_db=vector_db,
+            prompt=PROMPT,
+            doc_id=DOC_ID,
+            top_k=2,
+            query_embedding=query_embedding,
+        ).retrieve()
+
+    with Flask(__name__).app_context():
+        assert retrieve(vector) == retrieve(None)
@@ -0,0 +1,148 @@
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from unstract.prompt_service.helpers import vector_db_pool
+from unstract.prompt_service.helpers.vector_db_pool import VectorDBPool
+from unstract.prompt_service.utils.redis_utils import RedisUtils
+
+ADAPTER_ID = "vector-db"
+GENERATION_KEY = f"{VectorDBPool.GENERATION_KEY_PREFIX}:{ADAPTER_ID}"
+
+
+@pytest.fixture
+def redis_client(mocker):
+    redis_client = fakeredis.FakeRedis()
+    mocker.patch.object(RedisUtils, "_client", redis_client)
+    return redis_client
+
+
+@pytest.fixture
+def vector_db_class(mocker, redis_client):
+    mocker.patch.object(VectorDBPool, "MAX_IDLE_PER_KEY", 2)
+    mocker.patch.object(VectorDBPool, "IDLE_TIMEOUT_IN_SECOND", 300)
+    mocker.patch.object(VectorDBPool, "_idle", defaultdict(list))
+    mocker.patch.object(
+        vector_db_pool.DBUtils,
+        "get_organization_from_bearer_token",
+        side_effect=lambda platform_key: (1, f"org-of-{platform_key}"),
+    )
+    # A new mock client per instantiation
+    return mocker.patch.object(
+        vector_db_pool, "VectorDB", side_effect=lambda **kwargs: MagicMock()
+    )
+
+
+def embedding(length: int = 4) -> MagicMock:
+    embedding = MagicMock()
+    embedding._length = length
+    return embedding
+
+
+def acquire(tool=None, platform_key="platform-key", embedding_=None):
+    return VectorDBPool.acquire(
+        tool=tool or MagicMock(),
+        platform_key=platform_key,
+        adapter_instance_id=ADAPTER_ID,
+        embedding=embedding_ or embedding(),
+    )
+
+
+def test_released_client_is_reused_with_next_request(vector_db_class):
+    vector_db = acquire()
+    VectorDBPool.release(vector_db)
+    tool, next_embedding = MagicMock(), embedding()
+
+    reused = acquire(tool=tool, embedding_=next_embedding)
+
+    assert reused is vector_db
+    assert vector_db_class.call_count == 1
+    # Bound to the tool and embedding of the borrowing request
+    assert reused._tool is tool
+    assert reused._embedding_instance is next_embedding._embedding_instance
+
+
+def test_borrowed_client_is_not_shared(vector_db_class):
+    first = acquire()
+    second = acquire()
+
+    assert first is not second
+    assert vector_db_class.call_count == 2
+
+
+def test_client_released_after_error_is_closed(vector_db_class):
+    vector_db = acquire()
+
+    VectorDBPool.release(vector_db, discard=True)
+
+    vector_db.close.assert_called_once()
+    assert acquire() is not vector_db
+
+
+def test_clients_beyond_max_idle_are_closed(vector_db_class):
+    vector_dbs = [acquire() for _ in range(3)]
+
+    for vector_db in vector_dbs:
+        VectorDBPool.release(vector_db)
+
+    assert [vector_db.close.called for vector_db in vector_dbs] == [
+        False,
+        False,
+        True,
+    ]
+
+
+def test_idle_client_is_evicted(mocker, vector_db_class):
+    monotonic = mocker.patch.object(vector_db_pool.time, "monotonic")
+    monotonic.return_value = 1000.0
+    vector_db = acquire()
+    VectorDBPool.release(vector_db)
+
+    monotonic.return_value = 1000.0 + VectorDBPool.IDLE_TIMEOUT_IN_SECOND + 1
+    new_vector_db = acquire()
+
+    assert new_vector_db is not vector_db
+    vector_db.close.assert_called_once()
+    assert not VectorDBPool._idle
+
+
+def test_edited_adapter_gets_new_client(vector_db_class, redis_client):
+    vector_db = acquire()
+    VectorDBPool.release(vector_db)
+
+    # The backend bumps the generation when the adapter is edited
+    redis_client.incr(GENERATION_KEY)
+
+    assert acquire() is not vector_db
+
+
+def test_clients_are_pooled_per_organization_and_dimension(vector_db_class):
+    vector_db = acquire()
+    VectorDBPool.release(vector_db)
+
+    assert acquire(platform_key="other-platform-key") is not vector_db
+    assert acquire(embedding_=embedding(length=8)) is not vector_db
+    assert acquire() is vector_db
+
+
+def test_unreadable_generation_is_not_pooled(vector_db_class, redis_client, mocker):
+    mocker.patch.object(redis_client, "get", side_effect=ConnectionError("Redis is down"))
+    vector_db = acquire()
+
+    VectorDBPool.release(vector_db)
+
+    vector_db.close.assert_called_once()
+    assert not VectorDBPool._idle
+
+
+def test_disabled_pool(mocker, vector_db_class):
+    mocker.patch.object(VectorDBPool, "MAX_IDLE_PER_KEY", 0)
+    vector_db = acquire()
+
+    VectorDBPool.release(vector_db)
+
+    vector_db.close.assert_called_once()
+    vector_db_pool.DBUtils.get_organization_from_bearer_token.assert_not_called()
+    assert acquire() is not vector_db
@@ -1,11 +1,23 @@
+import logging
+import os
 from typing import Any
 
+from unstract.core.platform_key_cache import PlatformKeyCache, PlatformKeyDetails
 from unstract.prompt_service.constants import DBTableV2
 from unstract.prompt_service.extensions import db, db_context
 from unstract.prompt_service.utils.env_loader import get_env_or_die
+from unstract.prompt_service.utils.redis_utils import RedisUtils
 
 DB_SCHEMA = get_env_or_die("DB_SCHEMA", "unstract")
 
+logger = logging.getLogger(__name__)
+
+platform_key_cache = PlatformKeyCache(
+    get_redis_client=RedisUtils.get_client,
+    ttl_in_second=int(os.environ.get("PLATFORM_KEY_CACHE_TTL_IN_SECOND", 60)),
+    max_entries=int(os.environ.get("PLATFORM_KEY_CACHE_MAX_ENTRIES", 1000)),
+)
+
 
 class DBUtils:
     @classmethod
@@ -18,20 +30,48 @@ class DBUtils:
         Returns:
             tuple[int, str]: organization uid and organization identifier
         """
-        platform_key_table = f'"{DB_SCHEMA}".{DBTableV2.PLATFORM_KEY}'
-        organization_table = f'"{DB_SCHEMA}".{DBTableV2.ORGANIZATION}'
-
-        organization_uid: int | None = cls.execute_query(
-            f"SELECT organization_id FROM {platform_key_table} WHERE key=%s", (token,)
-        )
-        if organization_uid is None:
+        details = cls.get_platform_key_details(token)
+        if not details:
             return None, None
+        return details.organization_uid, details.organization_identifier
+
+    @classmethod
+    def get_platform_key_details(cls, token: str) -> PlatformKeyDetails | None:
+        """Retrieve the organization of an active platform key.
+
+        Validated keys are served from `platform_key_cache` and looked up in the
+        database otherwise.
 
-        organization_identifier: str | None = cls.execute_query(
-            f"SELECT organization_id FROM {organization_table} WHERE id=%s",
-            (organization_uid,),
-        )
-        return organization_uid, organization_identifier
+        Args:
+            token (str): The bearer token (platform key).
+
+        Returns:
+            PlatformKeyDetails | None: Details of the key, None if the key does
+                not exist or is inactive
+        """
+        details = platform_key_cache.get(token)
+        if details:
+            return details
+        query = f"""
+            SELECT pk.is_active, pk.organization_id, o.organization_id
+            FROM "{DB_SCHEMA}".{DBTableV2.PLATFORM_KEY} pk
+            LEFT JOIN "{DB_SCHEMA}".{DBTableV2.ORGANIZATION} o
+            ON o.id = pk.organization_id
+            WHERE pk.key=%s
+        """
+        with db_context():
+            cursor = db.execute_sql(query, (token,))
+            result_row = cursor.fetchone()
+            cursor.close()
+        if not result_row:
+            logger.error("Authentication failed. bearer token not found")
+            return None
+        is_active, organization_uid, organization_identifier = result_row
+        if not is_active:
+            logger.error("Token is not active. Activate before using it.")
+            platform_key_cache.invalidate(token)
+            return None
+        return platform_key_cache.put(token, organization_uid, organization_identifier)
 
     @classmethod
     def execute_query(cls, query: str, params: tuple = ()) -> Any:
@@ -1,3 +1,5 @@
+from flask import g, has_app_context
+
 from unstract.prompt_service.constants import ExecutionSource, FileStorageKeys
 from unstract.sdk.file_storage import FileStorage
 from unstract.sdk.file_storage.constants import StorageType
@@ -9,6 +11,8 @@ class FileUtils:
     def get_fs_instance(execution_source: str) -> FileStorage:
         """Returns a FileStorage instance based on the execution source.
 
+        The instance is created once per request and shared by its callers.
+
         Args:
             execution_source (str): The source from which the execution is triggered.
 
@@ -18,6 +22,17 @@ class FileUtils:
         Raises:
             ValueError: If the execution source is invalid.
         """
+        fs_instances: dict[str, FileStorage] = (
+            g.setdefault("fs_instances", {}) if has_app_context() else {}
+        )
+        if execution_source not in fs_instances:
+            fs_instances[execution_source] = FileUtils._create_fs_instance(
+                execution_source
+            )
+        return fs_instances[execution_source]
+
+    @staticmethod
+    def _create_fs_instance(execution_source: str) -> FileStorage:
         if execution_source == ExecutionSource.IDE.value:
             return EnvHelper.get_storage(
                 storage_type=StorageType.PERMANENT,
@@ -0,0 +1,23 @@
+import os
+
+import redis
+
+
+class RedisUtils:
+    _client: redis.Redis | None = None
+
+    @classmethod
+    def get_client(cls) -> redis.Redis:
+        """Returns a Redis client shared by the process.
+
+        Returns:
+            redis.Redis: Client configured from the `REDIS_*` env variables
+        """
+        if cls._client is None:
+            cls._client = redis.Redis(
+                host=os.environ.get("REDIS_HOST"),
+                port=int(os.environ.get("REDIS_PORT", 6379)),
+                username=os.environ.get("REDIS_USER"),
+                password=os.environ.get("REDIS_PASSWORD"),
+            )
+        return cls._client
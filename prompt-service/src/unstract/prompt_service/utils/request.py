@@ -22,15 +22,23 @@ def make_http_request(
     data: dict[str, Any] | None = None,
     headers: dict[str, Any] | None = None,
     params: dict[str, Any] | None = None,
+    session: pyrequests.Session | None = None,
+    timeout: float | None = None,
 ) -> str:
-    """Generic helper function to help make a HTTP request."""
+    """Generic helper function to help make a HTTP request.
+
+    A `session` can be passed to reuse its pooled connections.
+    """
+    client = session or pyrequests
     try:
         if verb == HTTPMethod.GET:
-            response = pyrequests.get(url, params=params, headers=headers)
+            response = client.get(url, params=params, headers=headers, timeout=timeout)
         elif verb == HTTPMethod.POST:
-            response = pyrequests.post(url, json=data, params=params, headers=headers)
+            response = client.post(
+                url, json=data, params=params, headers=headers, timeout=timeout
+            )
         elif verb == HTTPMethod.DELETE:
-            response = pyrequests.delete(url, params=params, headers=headers)
+            response = client.delete(url, params=params, headers=headers, timeout=timeout)
         else:
             raise ValueError("Invalid HTTP verb. Supported verbs: GET, POST, DELETE")
 
@@ -0,0 +1,121 @@
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from unstract.runner.clients.interface import ContainerClientInterface
+from unstract.runner.constants import Env
+from unstract.runner.utils import Utils
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NodeCapacity:
+    max_containers: int | None
+    running: int
+    pending: int
+
+    @property
+    def available(self) -> int | None:
+        if self.max_containers is None:
+            return None
+        return max(self.max_containers - self.running - self.pending, 0)
+
+    @property
+    def accepting(self) -> bool:
+        return self.available is None or self.available > 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "available": self.available,
+            "accepting": self.accepting,
+        }
+
+
+class AdmissionController:
+    """Limits the tool containers running at once on this node.
+
+    The limit is the smallest of `RUNNER_MAX_CONTAINERS` and what fits into
+    `RUNNER_MAX_MEMORY_MB` / `RUNNER_MAX_CPUS` given the expected size of a
+    tool container (`TOOL_CONTAINER_MEMORY_MB` / `TOOL_CONTAINER_CPUS`).
+    Running containers are counted from the container engine, so containers
+    started by other runner processes on the node count as well. Containers
+    admitted by this process but not yet visible there are tracked as pending.
+    """
+
+    _lock = threading.Lock()
+    _pending: set[str] = set()
+
+    def __init__(self, client: ContainerClientInterface) -> None:
+        self.client = client
+        self.max_containers = self.get_max_containers()
+
+    @staticmethod
+    def get_max_containers() -> int | None:
+        """Returns the container limit of the node, None if unlimited."""
+        limits: list[int] = []
+        max_containers = Utils.str_to_int(os.getenv(Env.RUNNER_MAX_CONTAINERS), 0)
+        if max_containers > 0:
+            limits.append(max_containers)
+
+        max_memory = Utils.str_to_float(os.getenv(Env.RUNNER_MAX_MEMORY_MB), 0)
+        container_memory = Utils.str_to_float(os.getenv(Env.TOOL_CONTAINER_MEMORY_MB), 0)
+        if max_memory > 0 and container_memory > 0:
+            limits.append(int(max_memory // container_memory))
+
+        max_cpus = Utils.str_to_float(os.getenv(Env.RUNNER_MAX_CPUS), 0)
+        container_cpus = Utils.str_to_float(os.getenv(Env.TOOL_CONTAINER_CPUS), 0)
+        if max_cpus > 0 and container_cpus > 0:
+            limits.append(int(max_cpus // container_cpus))
+
+        return min(limits) if limits else None
+
+    def _get_running_containers(self) -> set[str]:
+        # Clients that cannot list containers only limit by pending containers
+        return set(self.client.list_running_tool_containers() or [])
+
+    def get_capacity(self) -> NodeCapacity:
+        running = self._get_running_containers()
+        with AdmissionController._lock:
+            # Pending containers that already started are counted as running
+            pending = AdmissionController._pending - running
+        return NodeCapacity(
+            max_containers=self.max_containers,
+            running=len(running),
+            pending=len(pending),
+        )
+
+    def acquire(self, container_name: str, timeout: int = 0) -> bool:
+        """Reserve a slot for a container, waiting up to `timeout` seconds.
+
+        Args:
+            container_name (str): Name of the container to be started
+            timeout (int): Seconds to queue for a free slot, 0 to not wait
+
+        Returns:
+            bool: True if the container may be started
+        """
+        if self.max_containers is None:
+            return True
+        deadline = time.monotonic() + timeout
+        while True:
+            running = self._get_running_containers()
+            with AdmissionController._lock:
+                if len(running | AdmissionController._pending) < self.max_containers:
+                    AdmissionController._pending.add(container_name)
+                    return True
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"Node at capacity of {self.max_containers} containers, "
+                    f"rejecting container '{container_name}'"
+                )
+                return False
+            time.sleep(1)
+
+    def release(self, container_name: str) -> None:
+        with AdmissionController._lock:
+            AdmissionController._pending.discard(container_name)
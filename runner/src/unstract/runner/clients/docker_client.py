@@ -1,6 +1,8 @@
 import logging
 import os
 import pprint
+import threading
+import time
 from collections.abc import Iterator
 from typing import Any
 
@@ -13,7 +15,7 @@ from unstract.runner.clients.interface import (
     ContainerClientInterface,
     ContainerInterface,
 )
-from unstract.runner.constants import Env
+from unstract.runner.constants import Env, Label
 from unstract.runner.utils import Utils
 
 
@@ -60,6 +62,13 @@ class DockerContainer(ContainerInterface):
 
 
 class Client(ContainerClientInterface):
+    # Process-wide state, shared by the per-request clients so that the Docker
+    # daemon connection pool, registry login and image lookups are reused.
+    _docker_client: DockerClient | None = None
+    _lock = threading.Lock()
+    _login_expires_at: float = 0.0
+    _image_expiry: dict[str, float] = {}
+
     def __init__(
         self,
         image_name: str,
@@ -76,13 +85,37 @@ class Client(ContainerClientInterface):
         self.sidecar_enabled = sidecar_enabled
         self.volume_name: str | None = None
 
-        # Create a Docker client that communicates with
-        #   the Docker daemon in the host environment
-        self.client: DockerClient = DockerClient.from_env()
+        # Docker client that communicates with the Docker daemon
+        #   in the host environment, shared across requests
+        self.client: DockerClient = self.get_docker_client()
         self.__private_login()
 
-    def __private_login(self):
-        """Performs login for private registry if required."""
+    @classmethod
+    def get_docker_client(cls) -> DockerClient:
+        """Returns the process-wide Docker client, creating it on first use."""
+        if cls._docker_client is None:
+            with cls._lock:
+                if cls._docker_client is None:
+                    cls._docker_client = DockerClient.from_env()
+        return cls._docker_client
+
+    @classmethod
+    def reset_shared_state(cls) -> None:
+        """Drops the shared Docker client, registry login and image cache."""
+        with cls._lock:
+            cls._docker_client = None
+            cls._login_expires_at = 0.0
+            cls._image_expiry.clear()
+
+    def __private_login(self, force: bool = False):
+        """Performs login for private registry if required.
+
+        The login is cached for the process and only performed again once it
+        expires, or when `force` is set after an authentication failure.
+
+        Args:
+            force (bool): Login even if the cached login has not expired.
+        """
         private_registry_credential_path = os.getenv(Env.PRIVATE_REGISTRY_CREDENTIAL_PATH)
         private_registry_username = os.getenv(Env.PRIVATE_REGISTRY_USERNAME)
         private_registry_url = os.getenv(Env.PRIVATE_REGISTRY_URL)
@@ -92,17 +125,27 @@ class Client(ContainerClientInterface):
             and private_registry_url
         ):
             return
+        if not force and time.monotonic() < Client._login_expires_at:
+            return
         try:
             self.logger.info(
                 "Performing private docker login for %s.", private_registry_url
             )
             with open(private_registry_credential_path, encoding="utf-8") as file:
                 password = file.read()
-            self.client.login(
-                username=private_registry_username,
-                password=password,
-                registry=private_registry_url,
-            )
+            with Client._lock:
+                # Another request may have logged in while we waited
+                if not force and time.monotonic() < Client._login_expires_at:
+                    return
+                self.client.login(
+                    username=private_registry_username,
+                    password=password,
+                    registry=private_registry_url,
+                    reauth=force,
+                )
+                Client._login_expires_at = (
+                    time.monotonic() + Utils.get_registry_login_ttl()
+                )
         except FileNotFoundError as file_err:
             self.logger.error(
                 f"Service account key file is not mounted "
@@ -132,10 +175,13 @@ class Client(ContainerClientInterface):
         Returns:
             bool: True if the image exists, False otherwise.
         """
+        if time.monotonic() < Client._image_expiry.get(image_name_with_tag, 0.0):
+            return True
         try:
             # Attempt to get the image information
             self.client.images.get(image_name_with_tag)
             self.logger.info(f"Image '{image_name_with_tag}' found in the local system.")
+            self.__cache_image(image_name_with_tag)
             return True
         except ImageNotFound:  # type: ignore[attr-defined]
             self.logger.info(
@@ -146,6 +192,48 @@ class Client(ContainerClientInterface):
             self.logger.error(f"An API error occurred: {e}")
             return False
 
+    def __cache_image(self, image_name_with_tag: str) -> None:
+        """Remember that the image is available locally for a while."""
+        Client._image_expiry[image_name_with_tag] = (
+            time.monotonic() + Utils.get_image_cache_ttl()
+        )
+
+    def __pull_image(self, repository: str, image_tag: str) -> None:
+        """Pulls the image, logging in again once if the registry rejects us."""
+        try:
+            self.__stream_pull(repository=repository, image_tag=image_tag)
+        except APIError as e:
+            if e.status_code not in (401, 403):
+                raise
+            self.logger.warning(
+                f"Registry authentication failed while pulling {repository}: {e}. "
+                "Retrying after a fresh login."
+            )
+            self.__private_login(force=True)
+            self.__stream_pull(repository=repository, image_tag=image_tag)
+
+    def __stream_pull(self, repository: str, image_tag: str) -> None:
+        resp = self.client.api.pull(
+            repository=repository,
+            tag=image_tag,
+            stream=True,
+            decode=True,
+        )
+        counter = 0
+        for line in resp:
+            # The counter is used to print status on every 100th status
+            # Otherwise the output logs will be polluted.
+            if counter < 100:
+                counter += 1
+                continue
+            counter = 0
+            self.logger.info(
+                "CONTAINER PULL STATUS: %s - %s : %s",
+                line.get("status"),
+                line.get("id"),
+                line.get("progress"),
+            )
+
     def cleanup_volume(self) -> None:
         """Cleans up the shared volume after both containers are stopped."""
         try:
@@ -174,27 +262,9 @@ class Client(ContainerClientInterface):
             return image_name_with_tag
 
         self.logger.info("Pulling the container: %s", image_name_with_tag)
-        resp = self.client.api.pull(
-            repository=repository,
-            tag=image_tag,
-            stream=True,
-            decode=True,
-        )
-        counter = 0
-        for line in resp:
-            # The counter is used to print status on every 100th status
-            # Otherwise the output logs will be polluted.
-            if counter < 100:
-                counter += 1
-                continue
-            counter = 0
-            self.logger.info(
-                "CONTAINER PULL STATUS: %s - %s : %s",
-                line.get("status"),
-                line.get("id"),
-                line.get("progress"),
-            )
+        self.__pull_image(repository=repository, image_tag=image_tag)
         self.logger.info("Finished pulling the container: %s", image_name_with_tag)
+        self.__cache_image(image_name_with_tag)
 
         return image_name_with_tag
 
@@ -277,6 +347,7 @@ class Client(ContainerClientInterface):
             )
         except ImageNotFound:
             self.logger.error(f"Image {self.image_name}:{self.image_tag} not found")
+            Client._image_expiry.pop(container_config.get("image"), None)
             raise
 
     def run_container_with_sidecar(
@@ -310,6 +381,8 @@ class Client(ContainerClientInterface):
             )
         except ImageNotFound:
             self.logger.error(f"Image {self.image_name}:{self.image_tag} not found")
+            Client._image_expiry.pop(container_config.get("image"), None)
+            Client._image_expiry.pop(sidecar_config.get("image"), None)
             raise
 
     def wait_for_container_stop(
@@ -352,6 +425,17 @@ class Client(ContainerClientInterface):
             )
             return status
 
+    def list_running_tool_containers(self) -> list[str] | None:
+        """List the names of the running containers labelled as tool containers."""
+        try:
+            containers = self.client.containers.list(
+                filters={"label": Label.TOOL_CONTAINER}
+            )
+        except APIError as e:
+            self.logger.error(f"Failed to list running tool containers: {e}")
+            return None
+        return [container.name for container in containers]
+
     def remove_container_by_name(
         self, container_name: str, with_sidecar: bool = False, force: bool = True
     ) -> None:
@@ -128,6 +128,15 @@ class ContainerClientInterface(ABC):
         """Get the status of the container."""
         pass
 
+    def list_running_tool_containers(self) -> list[str] | None:
+        """List the names of the tool containers running on this node.
+
+        Returns:
+            Optional[list[str]]: Container names, None if the client
+                cannot list them.
+        """
+        return None
+
     @abstractmethod
     def remove_container_by_name(
         self, container_name: str, with_sidecar: bool = False, force: bool = True
@@ -12,6 +12,14 @@ from .docker_client import Client, DockerContainer
 DOCKER_MODULE = "unstract.runner.clients.docker_client"
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_client_state():
+    # The Docker client, registry login and image cache are process-wide
+    Client.reset_shared_state()
+    yield
+    Client.reset_shared_state()
+
+
 @pytest.fixture
 def docker_container():
     container = MagicMock()
@@ -107,6 +115,7 @@ def test_get_image(docker_client, mocker):
     mock_images.get.assert_called_with("test-image:latest")  # Ensure get is called
 
     # Case 2: Image does not exist
+    Client.reset_shared_state()  # Forget that the image was found above
     mock_images.get.side_effect = ImageNotFound(
         "Image not found"
     )  # Mock that image doesn't exist
@@ -121,6 +130,37 @@ def test_get_image(docker_client, mocker):
     )
 
 
+def test_get_image_is_cached(docker_client, mocker):
+    """Test that an image found locally is not looked up again."""
+    mock_images = mocker.MagicMock()
+    docker_client.client.images = mock_images
+
+    assert docker_client.get_image() == "test-image:latest"
+    assert docker_client.get_image() == "test-image:latest"
+    mock_images.get.assert_called_once_with("test-image:latest")
+
+
+def test_docker_client_is_shared(mocker):
+    """Test that clients reuse one Docker client and registry login."""
+    mock_from_env = mocker.patch(f"{DOCKER_MODULE}.DockerClient.from_env")
+    mocker.patch.dict(
+        os.environ,
+        {
+            Env.PRIVATE_REGISTRY_CREDENTIAL_PATH: __file__,
+            Env.PRIVATE_REGISTRY_USERNAME: "user",
+            Env.PRIVATE_REGISTRY_URL: "registry.example.com",
+        },
+    )
+    logger = logging.getLogger("test-logger")
+
+    first = Client("test-image", "latest", logger)
+    second = Client("other-image", "latest", logger)
+
+    mock_from_env.assert_called_once()
+    assert first.client is second.client
+    mock_from_env.return_value.login.assert_called_once()
+
+
 def test_get_container_run_config(docker_client, mocker):
     """Test the get_container_run_config method."""
     command = ["echo", "hello"]
@@ -234,6 +274,7 @@ def test_get_image_for_sidecar(docker_client_with_sidecar, mocker):
     mock_images.get.assert_called_once_with("test-sidecar-image:latest")
 
     # Case 2: Image does not exist
+    Client.reset_shared_state()  # Forget that the image was found above
     mock_images.get.side_effect = ImageNotFound("Image not found")
     mock_pull = mocker.patch.object(docker_client_with_sidecar.client.api, "pull")
     mock_pull.return_value = iter([{"status": "pulling"}])
@@ -23,6 +23,8 @@ class Env:
     PRIVATE_REGISTRY_CREDENTIAL_PATH = "PRIVATE_REGISTRY_CREDENTIAL_PATH"
     PRIVATE_REGISTRY_USERNAME = "PRIVATE_REGISTRY_USERNAME"
     PRIVATE_REGISTRY_URL = "PRIVATE_REGISTRY_URL"
+    PRIVATE_REGISTRY_LOGIN_TTL_IN_SECOND = "PRIVATE_REGISTRY_LOGIN_TTL_IN_SECOND"
+    IMAGE_EXISTS_CACHE_TTL_IN_SECOND = "IMAGE_EXISTS_CACHE_TTL_IN_SECOND"
     LOG_LEVEL = "LOG_LEVEL"
     REMOVE_CONTAINER_ON_EXIT = "REMOVE_CONTAINER_ON_EXIT"
     WORKFLOW_EXECUTION_DIR_PREFIX = "WORKFLOW_EXECUTION_DIR_PREFIX"
@@ -42,3 +44,15 @@ class Env:
     CELERY_BROKER_BASE_URL = "CELERY_BROKER_BASE_URL"
     CELERY_BROKER_USER = "CELERY_BROKER_USER"
     CELERY_BROKER_PASS = "CELERY_BROKER_PASS"
+    RUNNER_MAX_CONTAINERS = "RUNNER_MAX_CONTAINERS"
+    RUNNER_MAX_MEMORY_MB = "RUNNER_MAX_MEMORY_MB"
+    RUNNER_MAX_CPUS = "RUNNER_MAX_CPUS"
+    TOOL_CONTAINER_MEMORY_MB = "TOOL_CONTAINER_MEMORY_MB"
+    TOOL_CONTAINER_CPUS = "TOOL_CONTAINER_CPUS"
+    RUNNER_ADMISSION_QUEUE_TIMEOUT_SECONDS = "RUNNER_ADMISSION_QUEUE_TIMEOUT_SECONDS"
+    RUNNER_ADMISSION_RETRY_AFTER_SECONDS = "RUNNER_ADMISSION_RETRY_AFTER_SECONDS"
+
+
+class Label:
+    # Marks containers started by the runner, used to count them per node
+    TOOL_CONTAINER = "unstract.runner.tool-container"
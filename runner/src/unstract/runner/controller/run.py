@@ -1,14 +1,31 @@
 from typing import Any
 
-from flask import Blueprint, abort, request
+from flask import Blueprint, Response, abort, jsonify, request
 from flask import current_app as app
 
+from unstract.runner.admission import AdmissionController
 from unstract.runner.runner import UnstractRunner
+from unstract.runner.utils import Utils
 
 # Define a Blueprint with a root URL path
 run_bp = Blueprint("run", __name__)
 
 
+def _at_capacity_response(container_name: str) -> Response:
+    """429 asking the caller to retry once containers on the node finish."""
+    response = jsonify(
+        {
+            "type": "RESULT",
+            "result": None,
+            "error": f"Runner at capacity, unable to start '{container_name}'",
+            "status": "ERROR",
+        }
+    )
+    response.status_code = 429
+    response.headers["Retry-After"] = str(Utils.get_admission_retry_after())
+    return response
+
+
 # Run container
 @run_bp.route("container/run", methods=["POST"])
 def run_container() -> Any | None:
@@ -25,16 +42,59 @@ def run_container() -> Any | None:
     messaging_channel = data["messaging_channel"]
 
     runner = UnstractRunner(image_name, image_tag, app)
-    result = runner.run_container(
-        container_name=container_name,
-        organization_id=organization_id,
-        workflow_id=workflow_id,
-        execution_id=execution_id,
-        file_execution_id=file_execution_id,
-        settings=settings,
-        envs=envs,
-        messaging_channel=messaging_channel,
-    )
+    admission = AdmissionController(runner.client)
+    if not admission.acquire(container_name, Utils.get_admission_queue_timeout()):
+        return _at_capacity_response(container_name)
+    try:
+        result = runner.run_container(
+            container_name=container_name,
+            organization_id=organization_id,
+            workflow_id=workflow_id,
+            execution_id=execution_id,
+            file_execution_id=file_execution_id,
+            settings=settings,
+            envs=envs,
+            messaging_channel=messaging_channel,
+        )
+    finally:
+        admission.release(container_name)
+    return result
+
+
+# Run a single container over a batch of files
+@run_bp.route("container/run-batch", methods=["POST"])
+def run_container_batch() -> Any | None:
+    data = request.get_json()
+    image_name = data["image_name"]
+    image_tag = data["image_tag"]
+    organization_id = data["organization_id"]
+    workflow_id = data["workflow_id"]
+    execution_id = data["execution_id"]
+    file_execution_ids = data["file_execution_ids"]
+    container_name = data["container_name"]
+    settings = data["settings"]
+    envs = data["envs"]
+    messaging_channel = data["messaging_channel"]
+    if not file_execution_ids:
+        abort(400, description="'file_execution_ids' must not be empty")
+
+    runner = UnstractRunner(image_name, image_tag, app)
+    admission = AdmissionController(runner.client)
+    if not admission.acquire(container_name, Utils.get_admission_queue_timeout()):
+        return _at_capacity_response(container_name)
+    try:
+        result = runner.run_container_batch(
+            container_name=container_name,
+            organization_id=organization_id,
+            workflow_id=workflow_id,
+            execution_id=execution_id,
+            file_execution_ids=file_execution_ids,
+            settings=settings,
+            envs=envs,
+            messaging_channel=messaging_channel,
+        )
+    finally:
+        admission.release(container_name)
     return result
 
 
@@ -49,6 +109,13 @@ def run_status() -> Any | None:
     return {"status": status}
 
 
+@run_bp.route("container/capacity", methods=["GET"])
+def capacity() -> Any | None:
+    """Reports how many more tool containers this node accepts."""
+    runner = UnstractRunner(None, None, app)
+    return AdmissionController(runner.client).get_capacity().to_dict()
+
+
 @run_bp.route("container/remove", methods=["POST"])
 def remove_container() -> Any | None:
     data = request.get_json()
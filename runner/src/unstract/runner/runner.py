@@ -1,6 +1,7 @@
 import ast
 import json
 import os
+import shlex
 from datetime import UTC, datetime
 from typing import Any
 
@@ -25,7 +26,7 @@ from unstract.runner.clients.interface import (
     ContainerClientInterface,
     ContainerInterface,
 )
-from unstract.runner.constants import Env, LogLevel, LogType, ToolKey
+from unstract.runner.constants import Env, Label, LogLevel, LogType, ToolKey
 from unstract.runner.exception import ToolRunException
 from unstract.runner.utils import Utils
 
@@ -68,6 +69,136 @@ class UnstractRunner:
                 container_name=container_name,
             )
 
+    def stream_batch_logs(
+        self,
+        container: ContainerInterface,
+        tool_instance_id: str,
+        execution_id: str,
+        organization_id: str,
+        file_execution_ids: list[str],
+        container_name: str,
+        channel: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Stream logs of a batched tool run and collect per-file results.
+
+        Lines between a file's start and end markers are tagged with that
+        file's `file_execution_id`. A tool error only fails the file it was
+        raised for, the container moves on to the next file in the batch.
+
+        Returns:
+            dict[str, dict[str, Any]]: Status and error keyed by file_execution_id
+        """
+        file_results: dict[str, dict[str, Any]] = {}
+        file_errors: dict[str, str] = {}
+        current_file_execution_id: str | None = None
+        for line in container.logs(follow=True):
+            if line.startswith(LogFieldName.FILE_RUN_START_MARKER):
+                if current_file_execution_id:
+                    # The previous file never reached its end marker
+                    file_results[current_file_execution_id] = (
+                        self._record_batch_file_status(
+                            execution_id=execution_id,
+                            file_execution_id=current_file_execution_id,
+                            tool_instance_id=tool_instance_id,
+                            organization_id=organization_id,
+                            error=file_errors.get(
+                                current_file_execution_id,
+                                "Tool did not complete for this file",
+                            ),
+                        )
+                    )
+                current_file_execution_id = line.split()[1]
+                continue
+            if line.startswith(LogFieldName.FILE_RUN_END_MARKER):
+                file_execution_id, exit_code = self._parse_file_run_end_marker(line)
+                error = file_errors.get(file_execution_id)
+                if not error and exit_code != 0:
+                    error = f"Tool exited with code {exit_code}"
+                file_results[file_execution_id] = self._record_batch_file_status(
+                    execution_id=execution_id,
+                    file_execution_id=file_execution_id,
+                    tool_instance_id=tool_instance_id,
+                    organization_id=organization_id,
+                    error=error,
+                )
+                current_file_execution_id = None
+                continue
+            if not current_file_execution_id:
+                self.logger.debug(f"[{container_name}] {line}")
+                continue
+            try:
+                self.process_log_message(
+                    log_message=line,
+                    tool_instance_id=tool_instance_id,
+                    channel=channel,
+                    execution_id=execution_id,
+                    organization_id=organization_id,
+                    file_execution_id=current_file_execution_id,
+                    container_name=container_name,
+                )
+            except ToolRunException as te:
+                self.logger.error(
+                    f"Execution ID: {execution_id}, docker container: "
+                    f"{container_name} - file execution "
+                    f"{current_file_execution_id} failed: {te.message}"
+                )
+                file_errors[current_file_execution_id] = str(te.message)
+
+        # Files the container never got to, e.g. when it was killed mid-batch
+        for file_execution_id in file_execution_ids:
+            if file_execution_id not in file_results:
+                file_results[file_execution_id] = self._record_batch_file_status(
+                    execution_id=execution_id,
+                    file_execution_id=file_execution_id,
+                    tool_instance_id=tool_instance_id,
+                    organization_id=organization_id,
+                    error=file_errors.get(
+                        file_execution_id, "Tool did not complete for this file"
+                    ),
+                )
+        return file_results
+
+    def _parse_file_run_end_marker(self, line: str) -> tuple[str, int]:
+        """Parse `<FILE_RUN_END_MARKER> <file_execution_id> with exit code <n>`."""
+        parts = line.split()
+        try:
+            exit_code = int(parts[-1])
+        except ValueError:
+            exit_code = 1
+        return parts[1], exit_code
+
+    def _record_batch_file_status(
+        self,
+        execution_id: str,
+        file_execution_id: str,
+        tool_instance_id: str,
+        organization_id: str,
+        error: str | None = None,
+    ) -> dict[str, Any]:
+        """Report a batched file's outcome to the tool execution tracker."""
+        status = ToolExecutionStatus.FAILED if error else ToolExecutionStatus.SUCCESS
+        try:
+            ToolExecutionTracker().update_status(
+                ToolExecutionData(
+                    execution_id=execution_id,
+                    file_execution_id=file_execution_id,
+                    tool_instance_id=tool_instance_id,
+                    organization_id=organization_id,
+                    status=status,
+                    error=error,
+                )
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Execution ID: {execution_id}, file execution {file_execution_id} "
+                f"- failed to update tool execution status: {e}",
+                exc_info=True,
+            )
+        return {
+            "status": "ERROR" if error else "SUCCESS",
+            "error": error,
+        }
+
     def get_valid_log_message(self, log_message: str) -> dict[str, Any] | None:
         """Get a valid log message from the log message.
 
@@ -320,6 +451,50 @@ class UnstractRunner:
         shell_script = f"{mkdir_cmd} && {run_tool_fn}; {execute_cmd}"
         return shell_script
 
+    def _get_batch_container_command(
+        self,
+        shared_log_dir: str,
+        shared_log_file: str,
+        settings: dict[str, Any],
+        execution_data_dirs: dict[str, str],
+    ) -> str:
+        """Returns the container command to run the tool on a batch of files.
+
+        Each file runs in turn with its own `EXECUTION_DATA_DIR`, wrapped in
+        start and end markers so that logs and results can be attributed to
+        the file's `file_execution_id`.
+        """
+        settings_json = json.dumps(settings).replace("'", "\\'")
+        tool_cmd = (
+            f'{Env.EXECUTION_DATA_DIR}="$2" opentelemetry-instrument python main.py '
+            f"--command RUN --settings '{settings_json}' --log-level DEBUG"
+        )
+        run_file_fn = (
+            "run_file() { "
+            f'echo "{LogFieldName.FILE_RUN_START_MARKER} $1"; '
+            f"{tool_cmd}; "
+            "exit_code=$?; "
+            f'echo "{LogFieldName.FILE_RUN_END_MARKER} $1 with exit code $exit_code"; '
+            "}"
+        )
+        run_files = "; ".join(
+            f"run_file {shlex.quote(file_execution_id)} {shlex.quote(data_dir)}"
+            for file_execution_id, data_dir in execution_data_dirs.items()
+        )
+
+        if not self.sidecar_enabled:
+            return f"{run_file_fn}; {run_files}"
+
+        mkdir_cmd = f"mkdir -p {shared_log_dir}"
+        run_batch_fn = (
+            "run_batch() { "
+            f"{run_files}; "
+            f'echo "{LogFieldName.TOOL_TERMINATION_MARKER} with exit code 0"; '
+            "}"
+        )
+        execute_cmd = f"run_batch > {shared_log_file} 2>&1"
+        return f"{mkdir_cmd} && {run_file_fn}; {run_batch_fn}; {execute_cmd}"
+
     def _handle_tool_execution_status(
         self, execution_id: str, file_execution_id: str, container_name: str
     ):
@@ -368,6 +543,58 @@ class UnstractRunner:
             # Delete the status from cache since it is no longer needed
             tool_execution_tracker.delete_status(tool_execution_data)
 
+    def _get_execution_data_dir(
+        self,
+        organization_id: str,
+        workflow_id: str,
+        execution_id: str,
+        file_execution_id: str,
+    ) -> str:
+        """Returns the execution data directory of a file execution."""
+        return os.path.join(
+            os.getenv(Env.WORKFLOW_EXECUTION_DIR_PREFIX, ""),
+            organization_id,
+            workflow_id,
+            execution_id,
+            file_execution_id,
+        )
+
+    def _mark_tool_execution_in_progress(
+        self, execution_id: str, file_execution_id: str, container_name: str
+    ) -> None:
+        """Moves the file execution to the tool execution stage."""
+        file_execution_tracker = FileExecutionStatusTracker()
+        file_execution_tracker.update_stage_status(
+            execution_id=execution_id,
+            file_execution_id=file_execution_id,
+            stage_status=FileExecutionStageData(
+                stage=FileExecutionStage(FileExecutionStage.TOOL_EXECUTION),
+                status=FileExecutionStageStatus(FileExecutionStageStatus.IN_PROGRESS),
+            ),
+        )
+        file_execution_tracker.update_tool_container_name(
+            execution_id=execution_id,
+            file_execution_id=file_execution_id,
+            tool_container_name=container_name,
+        )
+
+    def _add_container_labels(self, container_config: dict[str, Any]) -> None:
+        """Add labels to container for logging with Loki.
+
+        The tool container label is always added, it lets admission control
+        count the tool containers running on the node.
+        """
+        labels: list[str] | dict[str, str] = []
+        try:
+            labels = ast.literal_eval(os.getenv(Env.TOOL_CONTAINER_LABELS, "[]"))
+        except Exception as e:
+            self.logger.info(f"Invalid labels for logging: {e}")
+        if isinstance(labels, dict):
+            labels = {**labels, Label.TOOL_CONTAINER: ""}
+        else:
+            labels = [*labels, Label.TOOL_CONTAINER]
+        container_config["labels"] = labels
+
     def get_container_status(
         self,
         container_name: str,
@@ -405,12 +632,11 @@ class UnstractRunner:
         Returns:
             Optional[Any]: _description_
         """
-        envs[Env.EXECUTION_DATA_DIR] = os.path.join(
-            os.getenv(Env.WORKFLOW_EXECUTION_DIR_PREFIX, ""),
-            organization_id,
-            workflow_id,
-            execution_id,
-            file_execution_id,
+        envs[Env.EXECUTION_DATA_DIR] = self._get_execution_data_dir(
+            organization_id=organization_id,
+            workflow_id=workflow_id,
+            execution_id=execution_id,
+            file_execution_id=file_execution_id,
         )
         envs[Env.WORKFLOW_EXECUTION_FILE_STORAGE_CREDENTIALS] = os.getenv(
             Env.WORKFLOW_EXECUTION_FILE_STORAGE_CREDENTIALS, "{}"
@@ -428,19 +654,10 @@ class UnstractRunner:
         )
 
         # Update Execution Tracker status
-        file_execution_tracker = FileExecutionStatusTracker()
-        file_execution_tracker.update_stage_status(
+        self._mark_tool_execution_in_progress(
             execution_id=execution_id,
             file_execution_id=file_execution_id,
-            stage_status=FileExecutionStageData(
-                stage=FileExecutionStage(FileExecutionStage.TOOL_EXECUTION),
-                status=FileExecutionStageStatus(FileExecutionStageStatus.IN_PROGRESS),
-            ),
-        )
-        file_execution_tracker.update_tool_container_name(
-            execution_id=execution_id,
-            file_execution_id=file_execution_id,
-            tool_container_name=container_name,
+            container_name=container_name,
         )
 
         container_config = self.client.get_container_run_config(
@@ -469,13 +686,7 @@ class UnstractRunner:
                 tool_instance_id=tool_instance_id,
             )
 
-        # Add labels to container for logging with Loki.
-        # This only required for observability.
-        try:
-            labels = ast.literal_eval(os.getenv(Env.TOOL_CONTAINER_LABELS, "[]"))
-            container_config["labels"] = labels
-        except Exception as e:
-            self.logger.info(f"Invalid labels for logging: {e}")
+        self._add_container_labels(container_config)
 
         # Run the Docker container
         container = None
@@ -538,3 +749,136 @@ class UnstractRunner:
         if sidecar:
             sidecar.cleanup(client=self.client)
         return result
+
+    def run_container_batch(
+        self,
+        organization_id: str,
+        workflow_id: str,
+        execution_id: str,
+        file_execution_ids: list[str],
+        settings: dict[str, Any],
+        envs: dict[str, Any],
+        container_name: str,
+        messaging_channel: str | None = None,
+    ) -> Any | None:
+        """RUN a single container that processes a batch of files in sequence.
+
+        Spreads the container start-up cost over every file of the batch.
+        Each file keeps its own execution data directory and reports its
+        status to the file and tool execution trackers.
+
+        Args:
+            workflow_id (str): projectId
+            file_execution_ids (list[str]): Files to run the tool on, in order
+            settings (dict[str, Any]): Tool settings
+            envs (dict[str, Any]): Tool env
+            messaging_channel (Optional[str], optional): socket io channel
+
+        Returns:
+            Optional[Any]: Batch result, with per-file results under `files`
+                when the logs are streamed by the runner
+        """
+        execution_data_dirs = {
+            file_execution_id: self._get_execution_data_dir(
+                organization_id=organization_id,
+                workflow_id=workflow_id,
+                execution_id=execution_id,
+                file_execution_id=file_execution_id,
+            )
+            for file_execution_id in file_execution_ids
+        }
+        # Batches are identified by their first file for volume / sidecar naming
+        batch_file_execution_id = file_execution_ids[0]
+        envs[Env.WORKFLOW_EXECUTION_FILE_STORAGE_CREDENTIALS] = os.getenv(
+            Env.WORKFLOW_EXECUTION_FILE_STORAGE_CREDENTIALS, "{}"
+        )
+
+        additional_env = self._parse_additional_envs()
+        tool_instance_id = str(settings.get(ToolKey.TOOL_INSTANCE_ID))
+        shared_log_dir = "/shared/logs"  # Mount directory, not file
+        shared_log_file = os.path.join(shared_log_dir, "logs.txt")
+        container_command = self._get_batch_container_command(
+            shared_log_dir=shared_log_dir,
+            shared_log_file=shared_log_file,
+            settings=settings,
+            execution_data_dirs=execution_data_dirs,
+        )
+
+        for file_execution_id in file_execution_ids:
+            self._mark_tool_execution_in_progress(
+                execution_id=execution_id,
+                file_execution_id=file_execution_id,
+                container_name=container_name,
+            )
+
+        container_config = self.client.get_container_run_config(
+            command=["/bin/sh", "-c", container_command],
+            file_execution_id=batch_file_execution_id,
+            shared_log_dir=shared_log_dir,
+            container_name=container_name,
+            envs={**envs, **additional_env},
+            organization_id=organization_id,
+            workflow_id=workflow_id,
+            execution_id=execution_id,
+            messaging_channel=messaging_channel,
+            tool_instance_id=tool_instance_id,
+        )
+
+        sidecar_config: dict[str, Any] | None = None
+        if self.sidecar_enabled:
+            sidecar_config = self._get_sidecar_container_config(
+                container_name=container_name,
+                shared_log_dir=shared_log_dir,
+                shared_log_file=shared_log_file,
+                file_execution_id=batch_file_execution_id,
+                execution_id=execution_id,
+                organization_id=organization_id,
+                messaging_channel=messaging_channel,
+                tool_instance_id=tool_instance_id,
+            )
+
+        self._add_container_labels(container_config)
+
+        container = None
+        result: dict[str, Any] = {"type": "RESULT", "result": None, "status": "RUNNING"}
+        try:
+            self.logger.info(
+                f"Execution ID: {execution_id}, running docker container: "
+                f"{container_name} for a batch of {len(file_execution_ids)} files"
+            )
+            if sidecar_config:
+                self.client.run_container_with_sidecar(container_config, sidecar_config)
+            else:
+                container = self.client.run_container(container_config)
+                file_results = self.stream_batch_logs(
+                    container=container,
+                    tool_instance_id=tool_instance_id,
+                    channel=messaging_channel,
+                    execution_id=execution_id,
+                    organization_id=organization_id,
+                    file_execution_ids=file_execution_ids,
+                    container_name=container_name,
+                )
+                self.logger.info(
+                    f"Execution ID: {execution_id}, docker "
+                    f"container: {container_name} ran successfully"
+                )
+                result = {
+                    "type": "RESULT",
+                    "result": None,
+                    "status": "SUCCESS",
+                    "files": file_results,
+                }
+        except Exception as e:
+            self.logger.error(
+                f"Failed to run docker container: {e}", stack_info=True, exc_info=True
+            )
+            result = {
+                "type": "RESULT",
+                "result": None,
+                "error": str(e),
+                "status": "ERROR",
+            }
+        if container:
+            container.cleanup(client=self.client)
+        return result
@@ -0,0 +1,72 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from unstract.runner.admission import AdmissionController
+from unstract.runner.constants import Env
+
+
+@pytest.fixture(autouse=True)
+def clear_pending():
+    AdmissionController._pending.clear()
+    yield
+    AdmissionController._pending.clear()
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.list_running_tool_containers.return_value = ["running-1"]
+    return client
+
+
+def test_max_containers_uses_smallest_limit(mocker):
+    mocker.patch.dict(
+        os.environ,
+        {
+            Env.RUNNER_MAX_CONTAINERS: "10",
+            Env.RUNNER_MAX_MEMORY_MB: "4096",
+            Env.TOOL_CONTAINER_MEMORY_MB: "1024",
+            Env.RUNNER_MAX_CPUS: "8",
+            Env.TOOL_CONTAINER_CPUS: "0.5",
+        },
+    )
+    assert AdmissionController.get_max_containers() == 4
+
+
+def test_unlimited_without_limits(mocker, client):
+    mocker.patch.dict(os.environ, {Env.RUNNER_MAX_CONTAINERS: "0"})
+    admission = AdmissionController(client)
+
+    assert admission.acquire("tool-1")
+    assert admission.get_capacity().accepting
+
+
+def test_acquire_counts_running_and_pending(mocker, client):
+    mocker.patch.dict(os.environ, {Env.RUNNER_MAX_CONTAINERS: "3"})
+    admission = AdmissionController(client)
+
+    assert admission.acquire("tool-1")
+    assert admission.acquire("tool-2")
+    assert not admission.acquire("tool-3")
+    assert admission.get_capacity().to_dict() == {
+        "max_containers": 3,
+        "running": 1,
+        "pending": 2,
+        "available": 0,
+        "accepting": False,
+    }
+
+    admission.release("tool-1")
+    assert admission.acquire("tool-3")
+
+
+def test_started_pending_container_is_not_counted_twice(mocker, client):
+    mocker.patch.dict(os.environ, {Env.RUNNER_MAX_CONTAINERS: "2"})
+    admission = AdmissionController(client)
+
+    assert admission.acquire("tool-1")
+    client.list_running_tool_containers.return_value = ["running-1", "tool-1"]
+    capacity = admission.get_capacity()
+    assert (capacity.running, capacity.pending) == (2, 0)
@@ -0,0 +1,188 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+
+from unstract.core.constants import LogFieldName
+from unstract.core.tool_execution_status import ToolExecutionStatus
+from unstract.runner.runner import UnstractRunner
+
+RUNNER_MODULE = "unstract.runner.runner"
+
+
+@pytest.fixture
+def runner(mocker):
+    mocker.patch(f"{RUNNER_MODULE}.client_class")
+    return UnstractRunner("test-image", "latest", Flask(__name__))
+
+
+@pytest.fixture
+def tool_execution_tracker(mocker):
+    return mocker.patch(f"{RUNNER_MODULE}.ToolExecutionTracker").return_value
+
+
+@pytest.fixture
+def log_publisher(mocker):
+    return mocker.patch(f"{RUNNER_MODULE}.LogPublisher")
+
+
+def start(file_execution_id: str) -> str:
+    return f"{LogFieldName.FILE_RUN_START_MARKER} {file_execution_id}"
+
+
+def end(file_execution_id: str, exit_code: int = 0) -> str:
+    return (
+        f"{LogFieldName.FILE_RUN_END_MARKER} {file_execution_id} "
+        f"with exit code {exit_code}"
+    )
+
+
+def log(message: str, level: str = "INFO") -> str:
+    return json.dumps({"type": "LOG", "level": level, "log": message})
+
+
+def stream(runner: UnstractRunner, lines: list[str], file_execution_ids: list[str]):
+    container = MagicMock()
+    container.logs.return_value = lines
+    return runner.stream_batch_logs(
+        container=container,
+        tool_instance_id="tool-instance",
+        execution_id="execution",
+        organization_id="org",
+        file_execution_ids=file_execution_ids,
+        container_name="container",
+        channel="channel",
+    )
+
+
+def recorded_statuses(tool_execution_tracker) -> dict[str, ToolExecutionStatus]:
+    return {
+        call.args[0].file_execution_id: call.args[0].status
+        for call in tool_execution_tracker.update_status.call_args_list
+    }
+
+
+def test_batch_logs_split_per_file(runner, tool_execution_tracker, log_publisher):
+    lines = [
+        "container start-up output",
+        start("file-1"),
+        log("reading file-1"),
+        log("extraction failed", level="ERROR"),
+        end("file-1", exit_code=1),
+        start("file-2"),
+        log("reading file-2"),
+        end("file-2"),
+    ]
+
+    results = stream(runner, lines, ["file-1", "file-2"])
+
+    assert results == {
+        "file-1": {"status": "ERROR", "error": "extraction failed"},
+        "file-2": {"status": "SUCCESS", "error": None},
+    }
+    assert recorded_statuses(tool_execution_tracker) == {
+        "file-1": ToolExecutionStatus.FAILED,
+        "file-2": ToolExecutionStatus.SUCCESS,
+    }
+    published = [
+        (call.args[1]["log"], call.args[1][LogFieldName.FILE_EXECUTION_ID])
+        for call in log_publisher.publish.call_args_list
+    ]
+    assert published == [("reading file-1", "file-1"), ("reading file-2", "file-2")]
+
+
+def test_batch_logs_exit_code_without_error_log(runner, tool_execution_tracker):
+    results = stream(runner, [start("file-1"), end("file-1", exit_code=2)], ["file-1"])
+
+    assert results == {"file-1": {"status": "ERROR", "error": "Tool exited with code 2"}}
+
+
+def test_batch_logs_file_without_end_marker(runner, tool_execution_tracker):
+    lines = [
+        start("file-1"),
+        log("reading file-1"),
+        start("file-2"),
+        end("file-2"),
+    ]
+
+    results = stream(runner, lines, ["file-1", "file-2"])
+
+    assert results == {
+        "file-1": {"status": "ERROR", "error": "Tool did not complete for this file"},
+        "file-2": {"status": "SUCCESS", "error": None},
+    }
+    assert recorded_statuses(tool_execution_tracker) == {
+        "file-1": ToolExecutionStatus.FAILED,
+        "file-2": ToolExecutionStatus.SUCCESS,
+    }
+
+
+def test_batch_logs_files_never_started(runner, tool_execution_tracker):
+    # The container was killed after the first file
+    lines = [start("file-1"), end("file-1")]
+
+    results = stream(runner, lines, ["file-1", "file-2", "file-3"])
+
+    assert results["file-1"] == {"status": "SUCCESS", "error": None}
+    for file_execution_id in ("file-2", "file-3"):
+        assert results[file_execution_id] == {
+            "status": "ERROR",
+            "error": "Tool did not complete for this file",
+        }
+    assert recorded_statuses(tool_execution_tracker)["file-3"] == (
+        ToolExecutionStatus.FAILED
+    )
+
+
+@pytest.fixture
+def api_client(mocker):
+    from unstract.runner.controller.run import run_bp
+
+    mocker.patch("unstract.runner.controller.run.AdmissionController")
+    app = Flask(__name__)
+    app.register_blueprint(run_bp, url_prefix="/v1/api")
+    return app.test_client()
+
+
+def batch_request(file_execution_ids: list[str]) -> dict:
+    return {
+        "image_name": "test-image",
+        "image_tag": "latest",
+        "organization_id": "org",
+        "workflow_id": "workflow",
+        "execution_id": "execution",
+        "file_execution_ids": file_execution_ids,
+        "container_name": "container",
+        "settings": {},
+        "envs": {},
+        "messaging_channel": "channel",
+    }
+
+
+def test_run_batch_endpoint(mocker, api_client):
+    runner_class = mocker.patch("unstract.runner.controller.run.UnstractRunner")
+    runner_class.return_value.run_container_batch.return_value = {
+        "type": "RESULT",
+        "result": None,
+        "status": "SUCCESS",
+        "files": {"file-1": {"status": "SUCCESS", "error": None}},
+    }
+
+    response = api_client.post(
+        "/v1/api/container/run-batch", json=batch_request(["file-1"])
+    )
+
+    assert response.status_code == 200
+    assert response.json["files"] == {"file-1": {"status": "SUCCESS", "error": None}}
+    run_kwargs = runner_class.return_value.run_container_batch.call_args.kwargs
+    assert run_kwargs["file_execution_ids"] == ["file-1"]
+
+
+def test_run_batch_endpoint_rejects_empty_batch(mocker, api_client):
+    runner_class = mocker.patch("unstract.runner.controller.run.UnstractRunner")
+
+    response = api_client.post("/v1/api/container/run-batch", json=batch_request([]))
+
+    assert response.status_code == 400
+    runner_class.assert_not_called()
@@ -50,6 +50,26 @@ class Utils:
             logger.warning(f"Invalid integer value '{value}'; using default: {default}")
             return default
 
+    @staticmethod
+    def str_to_float(value: str | None, default: float) -> float:
+        """Safely convert a string to a float, returning a default if conversion fails.
+
+        Args:
+            value (Optional[str]): The string to convert.
+            default (float): The fallback value if conversion fails.
+
+        Returns:
+            float: Parsed float or the default value.
+        """
+        if not value:
+            return default
+
+        try:
+            return float(value)
+        except ValueError:
+            logger.warning(f"Invalid float value '{value}'; using default: {default}")
+            return default
+
     @staticmethod
     def get_log_level() -> LogLevel:
         """Get log level from environment variable.
@@ -115,3 +135,43 @@ class Utils:
             str: Sidecar container name
         """
         return f"{container_name}-sidecar"
+
+    @staticmethod
+    def get_registry_login_ttl() -> int:
+        """Seconds a private registry login is reused before logging in again.
+
+        Returns:
+            int: TTL in seconds, defaulting to 3600 if not set or invalid.
+        """
+        raw_ttl = os.getenv(Env.PRIVATE_REGISTRY_LOGIN_TTL_IN_SECOND)
+        return Utils.str_to_int(raw_ttl, default=3600)
+
+    @staticmethod
+    def get_image_cache_ttl() -> int:
+        """Seconds an image found locally is assumed present without checking.
+
+        Returns:
+            int: TTL in seconds, defaulting to 300 if not set or invalid.
+        """
+        raw_ttl = os.getenv(Env.IMAGE_EXISTS_CACHE_TTL_IN_SECOND)
+        return Utils.str_to_int(raw_ttl, default=300)
+
+    @staticmethod
+    def get_admission_queue_timeout() -> int:
+        """Seconds a run request waits for a free container slot.
+
+        Returns:
+            int: Timeout in seconds, defaulting to 0 (reject right away).
+        """
+        raw_timeout = os.getenv(Env.RUNNER_ADMISSION_QUEUE_TIMEOUT_SECONDS)
+        return Utils.str_to_int(raw_timeout, default=0)
+
+    @staticmethod
+    def get_admission_retry_after() -> int:
+        """Seconds callers are asked to wait before retrying a rejected run.
+
+        Returns:
+            int: Retry-After in seconds, defaulting to 10.
+        """
+        raw_retry_after = os.getenv(Env.RUNNER_ADMISSION_RETRY_AFTER_SECONDS)
+        return Utils.str_to_int(raw_retry_after, default=10)
@@ -7,9 +7,10 @@ completion signals.
 import json
 import logging
 import os
+import signal
 import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import IO, Any
 
 from unstract.core.constants import LogFieldName
 from unstract.core.pubsub_helper import LogPublisher
@@ -22,6 +23,7 @@ from unstract.core.utilities import redact_sensitive_string
 
 from .constants import Env, LogLevel, LogType
 from .dto import LogLineDTO
+from .watcher import LogFileWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +64,13 @@ class LogProcessor:
         self.file_execution_id = file_execution_id
         self.messaging_channel = messaging_channel
         self.container_name = container_name
+        # Whether the current file already reported SUCCESS / FAILED
+        self.file_status_reported = False
+        # Whether a file of a batched run was started and has not ended yet
+        self.file_run_active = False
+        # Logs read in a burst are published together, see flush_logs()
+        self.pending_logs: list[dict[str, Any]] = []
+        self.watcher = LogFileWatcher(os.path.dirname(self.log_path))
         self.tool_execution_tracker = ToolExecutionTracker()
         self._update_tool_execution_status(status=ToolExecutionStatus.RUNNING)
 
@@ -96,7 +105,7 @@ class LogProcessor:
         while not os.path.exists(self.log_path):
             if time.time() - start_time > timeout:
                 return False
-            time.sleep(0.1)
+            self.watcher.wait()
         return True
 
     def process_log_line(self, line: str) -> LogLineDTO:
@@ -108,8 +117,17 @@ class LogProcessor:
         Returns:
             Optional[Dict]: Parsed JSON if line is a completion signal
         """
+        # Batched runs delimit each file, switch the file logs are tagged with
+        if line.startswith(LogFieldName.FILE_RUN_START_MARKER):
+            self.start_file_run(line.split()[1])
+            return LogLineDTO()
+        if line.startswith(LogFieldName.FILE_RUN_END_MARKER):
+            self.end_file_run(line)
+            return LogLineDTO()
+
         # Stream log to Redis
         if LogFieldName.TOOL_TERMINATION_MARKER in line:
+            self._fail_unfinished_file_run()
             logger.info(
                 "Tool container terminated with status "
                 f"{LogFieldName.TOOL_TERMINATION_MARKER}"
@@ -134,6 +152,7 @@ class LogProcessor:
             if log_level == LogLevel.ERROR:
                 logger.error(f"{log_dict.get('log')}")
                 log_process_status.error = log_dict.get("log")
+                self.file_status_reported = True
                 self._update_tool_execution_status(
                     status=ToolExecutionStatus.FAILED, error=log_dict.get("log")
                 )
@@ -141,6 +160,7 @@ class LogProcessor:
                 logger.info(f"{log_dict.get('log')}")
         elif log_type == LogType.RESULT:
             logger.info(f"Tool '{self.container_name}' completed running")
+            self.file_status_reported = True
             self._update_tool_execution_status(status=ToolExecutionStatus.SUCCESS)
             return LogLineDTO(with_result=True)
         elif log_type == LogType.UPDATE:
@@ -151,10 +171,57 @@ class LogProcessor:
         log_dict[LogFieldName.ORGANIZATION_ID] = self.organization_id
         log_dict[LogFieldName.TIMESTAMP] = self.get_log_timestamp(log_dict)
         log_dict[LogFieldName.FILE_EXECUTION_ID] = self.file_execution_id
-        # Publish to channel of socket io
-        LogPublisher.publish(self.messaging_channel, log_dict)
+        # Queued for the channel of socket io, published by flush_logs()
+        self.pending_logs.append(log_dict)
         return log_process_status
 
+    def flush_logs(self) -> None:
+        """Publish the queued log messages in one batch."""
+        if not self.pending_logs:
+            return
+        pending_logs, self.pending_logs = self.pending_logs, []
+        LogPublisher.publish_batch(self.messaging_channel, pending_logs)
+
+    def start_file_run(self, file_execution_id: str) -> None:
+        """Start attributing logs and status to a file of a batched run.
+
+        Args:
+            file_execution_id (str): File execution ID announced by the tool
+        """
+        self._fail_unfinished_file_run()
+        logger.info(f"Processing file execution '{file_execution_id}'")
+        self.file_execution_id = file_execution_id
+        self.file_status_reported = False
+        self.file_run_active = True
+        self._update_tool_execution_status(status=ToolExecutionStatus.RUNNING)
+
+    def end_file_run(self, line: str) -> None:
+        """Fail the current file if the tool exited without reporting a status.
+
+        Args:
+            line (str): `<FILE_RUN_END_MARKER> <file_execution_id> with exit code <n>`
+        """
+        try:
+            exit_code = int(line.split()[-1])
+        except ValueError:
+            exit_code = 1
+        if exit_code != 0 and not self.file_status_reported:
+            self._update_tool_execution_status(
+                status=ToolExecutionStatus.FAILED,
+                error=f"Tool exited with code {exit_code}",
+            )
+        self.file_status_reported = True
+        self.file_run_active = False
+
+    def _fail_unfinished_file_run(self) -> None:
+        """Fail a file of a batched run that never reached its end marker."""
+        if self.file_run_active and not self.file_status_reported:
+            self._update_tool_execution_status(
+                status=ToolExecutionStatus.FAILED,
+                error="Tool did not complete for this file",
+            )
+        self.file_run_active = False
+
     def get_log_timestamp(self, log_dict: dict[str, Any]) -> float:
         """Obtains the timestamp from the log dictionary.
 
@@ -212,37 +279,101 @@ class LogProcessor:
 
     def monitor_logs(self) -> None:
         """Main loop to monitor log file for new content and completion signals.
-        Uses file polling with position tracking to efficiently read new lines.
+        Reads every line available in a burst, publishes them together and
+        then waits for the tool to write again.
         """
         logger.info("Starting log monitoring...")
-        if not self.wait_for_log_file():
-            raise TimeoutError("Log file was not created within timeout period")
-
-        # Monitor the file for new content
-        with open(self.log_path) as f:
-            while True:
-                # Remember current position
-                where = f.tell()
-                line = f.readline()
-
-                if not line:
+        self.watcher.start()
+        try:
+            if not self.wait_for_log_file():
+                raise TimeoutError("Log file was not created within timeout period")
+
+            # Monitor the file for new content
+            f = open(self.log_path)
+            try:
+                while True:
+                    is_terminated = self.process_available_lines(f)
+                    self.flush_logs()
+                    if is_terminated:
+                        logger.info("Completion signal received")
+                        break
                     # No new data, check if tool container is done
                     if os.path.exists(
                         os.path.join(os.path.dirname(self.log_path), "completed")
                     ):
                         break
+                    f, moved = self.follow_log_file(f)
+                    if not moved:
+                        self.watcher.wait()
+            finally:
+                f.close()
+        finally:
+            self.flush_logs()
+            self.watcher.close()
+        self._signal_completion()
+
+    def process_available_lines(self, f: IO[str]) -> bool:
+        """Process every complete line written since the last read.
+
+        Args:
+            f: Log file opened for reading, positioned after the last line read
+
+        Returns:
+            bool: True if the tool termination marker was read
+        """
+        while True:
+            # Remember current position
+            where = f.tell()
+            line = f.readline()
+            if not line:
+                return False
+            if not line.endswith("\n"):
+                # The tool is still writing this line, read it once complete
+                f.seek(where)
+                return False
+            if self.process_log_line(line).is_terminated:
+                return True
+
+    def follow_log_file(self, f: IO[str]) -> tuple[IO[str], bool]:
+        """Keep reading the log file if it was rotated or truncated.
+
+        Only call once `f` was read to its end, so that no line of a rotated
+        file is lost.
 
-                    # Sleep briefly to avoid CPU spinning
-                    time.sleep(0.1)
-                    # Go back to where we were
-                    f.seek(where)
-                    continue
+        Args:
+            f: Log file opened for reading
 
-                # Process the log line
-                log_line = self.process_log_line(line)
-                if log_line.is_terminated:
-                    logger.info("Completion signal received")
-                    break
+        Returns:
+            tuple[IO[str], bool]: File to read from next and whether it was
+                reopened or rewound
+        """
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            # Rotated away, the new file is not created yet
+            return f, False
+        if stat.st_ino != os.fstat(f.fileno()).st_ino:
+            logger.info(f"Log file '{self.log_path}' was replaced, reopening it")
+            f.close()
+            return open(self.log_path), True
+        if stat.st_size < f.tell():
+            logger.info(f"Log file '{self.log_path}' was truncated, rewinding it")
+            f.seek(0)
+            return f, True
+        return f, False
+
+    def _signal_completion(self) -> None:
+        """Notify the waiting worker that the tool has finished running."""
+        try:
+            self.tool_execution_tracker.signal_completion(
+                ToolExecutionData(
+                    execution_id=self.execution_id,
+                    file_execution_id=self.file_execution_id,
+                )
+            )
+        except Exception as e:
+            # The worker falls back to polling the container status
+            logger.error(f"Failed to signal tool completion: {e}", exc_info=True)
 
 
 def main():
@@ -317,6 +448,12 @@ def main():
         file_execution_id=file_execution_id,
         container_name=container_name,
     )
+
+    def handle_termination(signum, frame):
+        # Unwinds monitor_logs() so that queued logs are flushed before exiting
+        raise SystemExit(f"Received signal {signum}")
+
+    signal.signal(signal.SIGTERM, handle_termination)
     processor.monitor_logs()
 
 
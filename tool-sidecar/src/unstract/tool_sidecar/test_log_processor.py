@@ -0,0 +1,229 @@
+import json
+import os
+import threading
+
+import pytest
+
+from unstract.core.constants import LogFieldName
+from unstract.core.tool_execution_status import ToolExecutionStatus
+from unstract.tool_sidecar.log_processor import LogProcessor
+
+LOG_PROCESSOR_MODULE = "unstract.tool_sidecar.log_processor"
+
+
+@pytest.fixture
+def tool_execution_tracker(mocker):
+    return mocker.patch(f"{LOG_PROCESSOR_MODULE}.ToolExecutionTracker").return_value
+
+
+@pytest.fixture
+def processor(mocker, tmp_path, tool_execution_tracker):
+    mocker.patch(f"{LOG_PROCESSOR_MODULE}.LogFileWatcher")
+    processor = LogProcessor(
+        log_path=str(tmp_path / "logs.txt"),
+        redis_host="localhost",
+        redis_port="6379",
+        redis_user="",
+        redis_password="",
+        tool_instance_id="tool-instance",
+        execution_id="execution",
+        organization_id="org",
+        file_execution_id="batch",
+        messaging_channel="channel",
+        container_name="container",
+    )
+    tool_execution_tracker.update_status.reset_mock()
+    return processor
+
+
+def start(file_execution_id: str) -> str:
+    return f"{LogFieldName.FILE_RUN_START_MARKER} {file_execution_id}\n"
+
+
+def end(file_execution_id: str, exit_code: int = 0) -> str:
+    return (
+        f"{LogFieldName.FILE_RUN_END_MARKER} {file_execution_id} "
+        f"with exit code {exit_code}\n"
+    )
+
+
+def log(message: str, level: str = "INFO") -> str:
+    return json.dumps({"type": "LOG", "level": level, "log": message}) + "\n"
+
+
+def result() -> str:
+    return json.dumps({"type": "RESULT", "result": "done"}) + "\n"
+
+
+def recorded_statuses(tool_execution_tracker) -> list[tuple[str, str, str | None]]:
+    return [
+        (data.file_execution_id, data.status, data.error)
+        for data in (
+            call.kwargs["tool_execution_data"]
+            for call in tool_execution_tracker.update_status.call_args_list
+        )
+    ]
+
+
+def process(processor: LogProcessor, lines: list[str]) -> None:
+    for line in lines:
+        processor.process_log_line(line)
+
+
+def processed_logs(processor: LogProcessor) -> list[str]:
+    return [log_dict["log"] for log_dict in processor.pending_logs]
+
+
+@pytest.fixture
+def log_file(processor):
+    open(processor.log_path, "w").close()
+    with open(processor.log_path) as f:
+        yield f
+
+
+def append(path: str, text: str) -> None:
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def test_partial_line_is_read_once_complete(processor, log_file):
+    line = log("written in two parts")
+    append(processor.log_path, line[:10])
+
+    assert not processor.process_available_lines(log_file)
+    assert processed_logs(processor) == []
+
+    append(processor.log_path, line[10:])
+    processor.process_available_lines(log_file)
+    assert processed_logs(processor) == ["written in two parts"]
+
+
+def test_truncated_log_file_is_read_from_start(processor, log_file):
+    append(processor.log_path, log("first") + log("second"))
+    processor.process_available_lines(log_file)
+
+    with open(processor.log_path, "w") as f:
+        f.write(log("after truncation"))
+    log_file, moved = processor.follow_log_file(log_file)
+    processor.process_available_lines(log_file)
+
+    assert moved
+    assert processed_logs(processor) == ["first", "second", "after truncation"]
+
+
+def test_rotated_log_file_is_reopened(processor, log_file):
+    append(processor.log_path, log("before rotation"))
+    processor.process_available_lines(log_file)
+    os.rename(processor.log_path, f"{processor.log_path}.1")
+
+    # Not recreated yet, keep reading the rotated file
+    assert processor.follow_log_file(log_file) == (log_file, False)
+
+    append(processor.log_path, log("after rotation"))
+    new_log_file, moved = processor.follow_log_file(log_file)
+    processor.process_available_lines(new_log_file)
+    new_log_file.close()
+
+    assert moved
+    assert log_file.closed
+    assert processed_logs(processor) == ["before rotation", "after rotation"]
+
+
+def test_unchanged_log_file_is_kept(processor, log_file):
+    append(processor.log_path, log("only"))
+    processor.process_available_lines(log_file)
+
+    assert processor.follow_log_file(log_file) == (log_file, False)
+
+
+def test_monitor_logs_until_termination(mocker, processor, tool_execution_tracker):
+    publish_batch = mocker.patch(f"{LOG_PROCESSOR_MODULE}.LogPublisher.publish_batch")
+    lines = [log("one"), log("two"), f"{LogFieldName.TOOL_TERMINATION_MARKER}\n"]
+    writes = iter(lines)
+
+    def write_next_line():
+        line = next(writes, None)
+        if line is not None:
+            append(processor.log_path, line)
+
+    # Each wait for changes lets the tool write one more line
+    processor.watcher.wait.side_effect = write_next_line
+    open(processor.log_path, "w").close()
+
+    monitor = threading.Thread(target=processor.monitor_logs)
+    monitor.start()
+    monitor.join(timeout=5)
+
+    assert not monitor.is_alive()
+    published = [
+        log_dict["log"]
+        for call in publish_batch.call_args_list
+        for log_dict in call.args[1]
+    ]
+    assert published == ["one", "two"]
+    tool_execution_tracker.signal_completion.assert_called_once()
+    processor.watcher.close.assert_called_once()
+
+
+def test_file_runs_report_their_own_status(processor, tool_execution_tracker):
+    process(
+        processor,
+        [
+            start("file-1"),
+            result(),
+            end("file-1"),
+            start("file-2"),
+            log("extraction failed", level="ERROR"),
+            end("file-2", exit_code=1),
+        ],
+    )
+
+    assert recorded_statuses(tool_execution_tracker) == [
+        ("file-1", ToolExecutionStatus.RUNNING, None),
+        ("file-1", ToolExecutionStatus.SUCCESS, None),
+        ("file-2", ToolExecutionStatus.RUNNING, None),
+        ("file-2", ToolExecutionStatus.FAILED, "extraction failed"),
+    ]
+
+
+def test_file_run_exit_code_without_status(processor, tool_execution_tracker):
+    process(processor, [start("file-1"), end("file-1", exit_code=137)])
+
+    assert recorded_statuses(tool_execution_tracker)[-1] == (
+        "file-1",
+        ToolExecutionStatus.FAILED,
+        "Tool exited with code 137",
+    )
+
+
+def test_file_run_without_end_marker(processor, tool_execution_tracker):
+    process(processor, [start("file-1"), log("reading"), start("file-2"), result()])
+    processor.process_log_line(f"{LogFieldName.TOOL_TERMINATION_MARKER}\n")
+
+    assert recorded_statuses(tool_execution_tracker) == [
+        ("file-1", ToolExecutionStatus.RUNNING, None),
+        ("file-1", ToolExecutionStatus.FAILED, "Tool did not complete for this file"),
+        ("file-2", ToolExecutionStatus.RUNNING, None),
+        ("file-2", ToolExecutionStatus.SUCCESS, None),
+    ]
+
+
+def test_last_file_run_without_end_marker(processor, tool_execution_tracker):
+    process(processor, [start("file-1"), log("reading")])
+    status = processor.process_log_line(f"{LogFieldName.TOOL_TERMINATION_MARKER}\n")
+
+    assert status.is_terminated
+    assert recorded_statuses(tool_execution_tracker)[-1] == (
+        "file-1",
+        ToolExecutionStatus.FAILED,
+        "Tool did not complete for this file",
+    )
+
+
+def test_logs_are_tagged_with_current_file(processor):
+    process(processor, [start("file-1"), log("one"), start("file-2"), log("two")])
+
+    assert [
+        (log_dict["log"], log_dict[LogFieldName.FILE_EXECUTION_ID])
+        for log_dict in processor.pending_logs
+    ] == [("one", "file-1"), ("two", "file-2")]
@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from unstract.tool_sidecar import watcher as watcher_module
+from unstract.tool_sidecar.watcher import LogFileWatcher
+
+requires_inotify = pytest.mark.skipif(
+    watcher_module.INotify is None, reason="inotify is not available"
+)
+
+
+@pytest.fixture
+def log_watcher(tmp_path):
+    log_watcher = LogFileWatcher(str(tmp_path), event_timeout=5.0)
+    yield log_watcher
+    log_watcher.close()
+
+
+@requires_inotify
+def test_wait_wakes_up_on_write(tmp_path, log_watcher):
+    log_watcher.start()
+    assert log_watcher.is_event_driven
+
+    writer = threading.Timer(0.1, (tmp_path / "logs.txt").write_text, ["line\n"])
+    started_at = time.monotonic()
+    writer.start()
+    log_watcher.wait()
+    writer.join()
+
+    assert time.monotonic() - started_at < log_watcher.event_timeout
+
+
+@requires_inotify
+def test_wait_times_out_without_changes(tmp_path):
+    log_watcher = LogFileWatcher(str(tmp_path), event_timeout=0.1)
+    log_watcher.start()
+
+    started_at = time.monotonic()
+    log_watcher.wait()
+
+    assert time.monotonic() - started_at >= 0.1
+    log_watcher.close()
+    assert not log_watcher.is_event_driven
+
+
+def test_polls_without_inotify(mocker, log_watcher):
+    mocker.patch.object(watcher_module, "INotify", None)
+    sleep = mocker.patch.object(watcher_module.time, "sleep")
+
+    log_watcher.wait()
+
+    assert not log_watcher.is_event_driven
+    sleep.assert_called_once_with(log_watcher.poll_interval)
+
+
+def test_polls_when_inotify_fails(mocker, log_watcher):
+    # e.g. the inotify watch limit of the host is exhausted
+    mocker.patch.object(
+        watcher_module, "INotify", side_effect=OSError("No space left on device")
+    )
+    sleep = mocker.patch.object(watcher_module.time, "sleep")
+
+    log_watcher.wait()
+
+    assert not log_watcher.is_event_driven
+    sleep.assert_called_once_with(log_watcher.poll_interval)
+
+
+def test_polls_until_log_dir_exists(mocker, tmp_path):
+    inotify = mocker.patch.object(watcher_module, "INotify")
+    mocker.patch.object(watcher_module, "flags")
+    sleep = mocker.patch.object(watcher_module.time, "sleep")
+    log_dir = tmp_path / "logs"
+    log_watcher = LogFileWatcher(str(log_dir))
+
+    log_watcher.wait()
+    assert not log_watcher.is_event_driven
+    sleep.assert_called_once()
+
+    log_dir.mkdir()
+    log_watcher.wait()
+    assert log_watcher.is_event_driven
+    inotify.return_value.add_watch.assert_called_once()
+    inotify.return_value.read.assert_called_once_with(timeout=1000)
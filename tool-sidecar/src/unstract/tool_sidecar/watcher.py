@@ -0,0 +1,73 @@
+"""Waits for changes to the tool's log directory.
+
+Uses inotify when available so that an idle sidecar sleeps until the tool
+writes, and falls back to short sleeps otherwise (non-Linux hosts, missing
+package or exhausted inotify watches).
+"""
+
+import logging
+import os
+import time
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # pragma: no cover - depends on the platform
+    INotify = None
+    flags = None
+
+logger = logging.getLogger(__name__)
+
+
+class LogFileWatcher:
+    def __init__(
+        self,
+        log_dir: str,
+        poll_interval: float = 0.1,
+        event_timeout: float = 1.0,
+    ) -> None:
+        """Initialize the watcher for a log directory.
+
+        Args:
+            log_dir: Directory holding the log file and the `completed` marker
+            poll_interval: Sleep between checks when inotify is unavailable
+            event_timeout: Longest wait for an inotify event, as a safety net
+                for file systems that do not report every change
+        """
+        self.log_dir = log_dir
+        self.poll_interval = poll_interval
+        self.event_timeout = event_timeout
+        self._inotify = None
+        self._watch_descriptor: int | None = None
+
+    @property
+    def is_event_driven(self) -> bool:
+        return self._inotify is not None
+
+    def start(self) -> None:
+        """Start watching, call before the first read to not miss changes."""
+        if self._inotify or not INotify or not os.path.isdir(self.log_dir):
+            return
+        try:
+            inotify = INotify()
+            self._watch_descriptor = inotify.add_watch(
+                self.log_dir,
+                flags.MODIFY | flags.CREATE | flags.CLOSE_WRITE | flags.MOVED_TO,
+            )
+            self._inotify = inotify
+            logger.info(f"Watching '{self.log_dir}' for changes with inotify")
+        except OSError as e:
+            logger.warning(f"inotify unavailable, polling '{self.log_dir}': {e}")
+
+    def wait(self) -> None:
+        """Block until the log directory changes or the wait times out."""
+        self.start()
+        if not self._inotify:
+            time.sleep(self.poll_interval)
+            return
+        # Events are only a wake-up call, callers re-read the file themselves
+        self._inotify.read(timeout=int(self.event_timeout * 1000))
+
+    def close(self) -> None:
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
@@ -1,6 +1,7 @@
 class SettingsKeys:
     TOOL_INSTANCE_ID = "tool_instance_id"
     PROMPT_REGISTRY_ID = "prompt_registry_id"
+    VERSION = "version"
     PROMPT_HOST = "PROMPT_HOST"
     PROMPT_PORT = "PROMPT_PORT"
     TOOL_METADATA = "tool_metadata"
@@ -79,6 +80,11 @@ class SettingsKeys:
     INDEXING = "indexing"
     EXECUTION_ID = "execution_id"
     IS_DIRECTORY_MODE = "is_directory_mode"
+    MAX_CONCURRENT_INDEXING = "MAX_CONCURRENT_INDEXING"
+    SUMMARY_CACHE_DIR = "SUMMARY_CACHE_DIR"
+    SUMMARY_CACHE_TTL = "SUMMARY_CACHE_TTL_IN_SECOND"
+    SUMMARY_CACHE_MAX_ENTRIES = "SUMMARY_CACHE_MAX_ENTRIES"
+    SUMMARY_CACHE_EVICTION_INTERVAL = "SUMMARY_CACHE_EVICTION_INTERVAL"
 
 
 class IndexingConstants:
@@ -0,0 +1,129 @@
+import logging
+from pathlib import Path
+from typing import Any
+
+import requests
+from constants import SettingsKeys  # type: ignore [attr-defined]
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from unstract.sdk.constants import ToolEnv
+from unstract.sdk.tool.base import BaseTool
+
+logger = logging.getLogger(__name__)
+
+PLATFORM_RETRY_COUNT = 3
+PLATFORM_RETRY_BACKOFF_FACTOR = 1
+PLATFORM_REQUEST_TIMEOUT = 60
+
+
+def get_retry_session() -> requests.Session:
+    """Returns a session retrying idempotent requests on transient errors.
+
+    Mirrors `unstract.core.network.get_retry_session`, which is not installed
+    in tool images.
+    """
+    retry_strategy = Retry(
+        total=PLATFORM_RETRY_COUNT,
+        backoff_factor=PLATFORM_RETRY_BACKOFF_FACTOR,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry_strategy)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class ExportedToolCache:
+    """Caches exported prompt studio tools for the process and execution.
+
+    Exported tools are kept in memory and in the execution directory so that
+    every file of an execution can reuse them. Cached copies are revalidated
+    with a conditional request against the platform service, which only
+    returns the tool when its version (ETag) changed.
+    """
+
+    _exported_tools: dict[str, dict[str, Any]] = {}
+
+    def __init__(
+        self,
+        tool: BaseTool,
+        execution_dir: Path,
+        session: requests.Session | None = None,
+    ) -> None:
+        self.tool = tool
+        self.execution_dir = execution_dir
+        self.session = session or get_retry_session()
+
+    def _get_cache_path(self, prompt_registry_id: str) -> Path:
+        return self.execution_dir / f"exported_tool_{prompt_registry_id}.json"
+
+    def _load(self, prompt_registry_id: str) -> dict[str, Any] | None:
+        exported_tool = self._exported_tools.get(prompt_registry_id)
+        if exported_tool:
+            return exported_tool
+        cache_path = self._get_cache_path(prompt_registry_id)
+        try:
+            if self.tool.workflow_filestorage.exists(cache_path):
+                exported_tool = self.tool.workflow_filestorage.json_load(path=cache_path)
+                if isinstance(exported_tool, dict):
+                    return exported_tool
+                logger.warning(f"Ignoring malformed cached exported tool '{cache_path}'")
+        except Exception as e:
+            logger.warning(f"Unable to read cached exported tool '{cache_path}': {e}")
+        return None
+
+    def _store(self, prompt_registry_id: str, exported_tool: dict[str, Any]) -> None:
+        self._exported_tools[prompt_registry_id] = exported_tool
+        cache_path = self._get_cache_path(prompt_registry_id)
+        try:
+            self.tool.workflow_filestorage.json_dump(path=cache_path, data=exported_tool)
+        except Exception as e:
+            logger.warning(f"Unable to cache exported tool at '{cache_path}': {e}")
+
+    def get_prompt_studio_tool(self, prompt_registry_id: str) -> dict[str, Any]:
+        """Returns the exported prompt studio tool.
+
+        Args:
+            prompt_registry_id (str): UUID of the exported tool.
+
+        Returns:
+            dict[str, Any]: Exported tool as returned by the platform service.
+        """
+        cached_tool = self._load(prompt_registry_id)
+        cached_version = cached_tool.get(SettingsKeys.VERSION) if cached_tool else None
+        platform_host = self.tool.get_env_or_die(ToolEnv.PLATFORM_HOST)
+        platform_port = self.tool.get_env_or_die(ToolEnv.PLATFORM_PORT)
+        platform_api_key = self.tool.get_env_or_die(ToolEnv.PLATFORM_API_KEY)
+        headers = {
+            "Authorization": f"Bearer {platform_api_key}",
+            "X-Request-ID": self.tool.file_execution_id,
+        }
+        if cached_version:
+            headers["If-None-Match"] = f'"{cached_version}"'
+        response = self.session.get(
+            f"{platform_host}:{platform_port}/custom_tool_instance",
+            params={SettingsKeys.PROMPT_REGISTRY_ID: prompt_registry_id},
+            headers=headers,
+            timeout=PLATFORM_REQUEST_TIMEOUT,
+        )
+        if response.status_code == 304 and cached_tool:
+            logger.info(f"Cached exported tool '{prompt_registry_id}' is up to date")
+            self._exported_tools[prompt_registry_id] = cached_tool
+            return cached_tool
+        if not response.ok:
+            try:
+                error = response.json().get("error", response.reason)
+            except ValueError:
+                error = response.text or response.reason
+            raise requests.HTTPError(
+                f"Error from platform service: {error}", response=response
+            )
+        exported_tool: dict[str, Any] = response.json()
+        if not exported_tool.get(SettingsKeys.VERSION) and response.headers.get("ETag"):
+            exported_tool[SettingsKeys.VERSION] = response.headers["ETag"].strip('"')
+        self._store(prompt_registry_id, exported_tool)
+        return exported_tool
@@ -1,5 +1,6 @@
 import datetime
 import logging
+import os
 from typing import Any
 
 from constants import IndexingConstants as IKeys
@@ -96,6 +97,15 @@ class StructureToolHelper:
         )
         return responder.index(payload=payload)
 
+    @staticmethod
+    def get_max_concurrent_indexing() -> int:
+        """Returns how many indexing requests may run at once for a file."""
+        try:
+            max_workers = int(os.environ.get(SettingsKeys.MAX_CONCURRENT_INDEXING, 4))
+            return max(1, max_workers)
+        except ValueError:
+            return 4
+
     @staticmethod
     def elapsed_time(start_time) -> float:
         """Returns the elapsed time since the process was started."""
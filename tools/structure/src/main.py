@@ -1,17 +1,20 @@
 import datetime
+import hashlib
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from constants import SettingsKeys  # type: ignore [attr-defined]
+from exported_tool_cache import ExportedToolCache
 from helpers import StructureToolHelper as STHelper
+from summary_cache import SummaryCache
 from utils import json_to_markdown
 
 from unstract.sdk.constants import LogState, MetadataKey, ToolEnv, UsageKwargs
-from unstract.sdk.platform import PlatformHelper
 from unstract.sdk.prompt import PromptTool
 from unstract.sdk.tool.base import BaseTool
 from unstract.sdk.tool.entrypoint import ToolEntrypoint
@@ -57,13 +60,11 @@ class StructureTool(BaseTool):
             f"Fetching prompt studio exported tool with UUID '{prompt_registry_id}'"
         )
         try:
-            platform_helper: PlatformHelper = PlatformHelper(
-                tool=self,
-                platform_port=self.get_env_or_die(ToolEnv.PLATFORM_PORT),
-                platform_host=self.get_env_or_die(ToolEnv.PLATFORM_HOST),
-                request_id=self.file_execution_id,
+            file_execution_dir = Path(self.get_env_or_die(ToolEnv.EXECUTION_DATA_DIR))
+            exported_tool_cache = ExportedToolCache(
+                tool=self, execution_dir=file_execution_dir.parent
             )
-            exported_tool = platform_helper.get_prompt_studio_tool(
+            exported_tool = exported_tool_cache.get_prompt_studio_tool(
                 prompt_registry_id=prompt_registry_id
             )
             tool_metadata = exported_tool[SettingsKeys.TOOL_METADATA]
@@ -146,64 +147,22 @@ class StructureTool(BaseTool):
                 responder=responder,
                 outputs=outputs,
                 usage_kwargs=usage_kwargs,
+                file_hash=file_hash,
             )
             payload[SettingsKeys.FILE_HASH] = summarize_file_hash
             payload[SettingsKeys.FILE_PATH] = summarize_file_path
         elif not is_single_pass_enabled:
-            # Track seen parameter combinations to avoid duplicate indexing
-            seen_params = set()
-
-            for output in outputs:
-                # Get current parameter combination
-                chunk_size = output[SettingsKeys.CHUNK_SIZE]
-                chunk_overlap = output[SettingsKeys.CHUNK_OVERLAP]
-                vector_db = tool_settings[SettingsKeys.VECTOR_DB]
-                embedding = tool_settings[SettingsKeys.EMBEDDING]
-                x2text = tool_settings[SettingsKeys.X2TEXT_ADAPTER]
-
-                # Create a unique key for this parameter combination
-                param_key = (
-                    f"chunk_size={chunk_size}_"
-                    f"chunk_overlap={chunk_overlap}_"
-                    f"vector_db={vector_db}_"
-                    f"embedding={embedding}_"
-                    f"x2text={x2text}"
-                )
-
-                # Only process if we haven't seen this combination yet and chunk_size is not zero
-                if chunk_size != 0 and param_key not in seen_params:
-                    seen_params.add(param_key)
-
-                    indexing_start_time = datetime.datetime.now()
-                    self.stream_log(
-                        f"Indexing document with: chunk_size={chunk_size}, "
-                        f"chunk_overlap={chunk_overlap}, vector_db={vector_db}, "
-                        f"embedding={embedding}, x2text={x2text}"
-                    )
-
-                    STHelper.dynamic_indexing(
-                        tool_settings=tool_settings,
-                        run_id=self.file_execution_id,
-                        file_path=tool_data_dir / SettingsKeys.EXTRACT,
-                        tool=self,
-                        execution_run_data_folder=str(execution_run_data_folder),
-                        chunk_overlap=chunk_overlap,
-                        reindex=True,
-                        usage_kwargs=usage_kwargs,
-                        enable_highlight=is_highlight_enabled,
-                        chunk_size=chunk_size,
-                        tool_id=tool_metadata[SettingsKeys.TOOL_ID],
-                        file_hash=file_hash,
-                        extracted_text=extracted_text,
-                    )
-
-                    index_metrics[output[SettingsKeys.NAME]] = {
-                        SettingsKeys.INDEXING: {
-                            "time_taken(s)": STHelper.elapsed_time(
-                                start_time=indexing_start_time
-                            )
-                        }
-                    }
+            index_metrics = self._index_documents(
+                tool_settings=tool_settings,
+                outputs=outputs,
+                tool_data_dir=tool_data_dir,
+                execution_run_data_folder=execution_run_data_folder,
+                usage_kwargs=usage_kwargs,
+                is_highlight_enabled=is_highlight_enabled,
+                tool_id=tool_metadata[SettingsKeys.TOOL_ID],
+                file_hash=file_hash,
+                extracted_text=extracted_text,
+            )
 
         if is_single_pass_enabled:
             self.stream_log("Fetching response for single pass extraction...")
@@ -260,6 +219,107 @@ class StructureTool(BaseTool):
             self.stream_error_and_exit(f"Error encoding JSON: {e}")
         self.write_tool_result(data=structured_output)
 
+    def _index_documents(
+        self,
+        tool_settings: dict[str, Any],
+        outputs: list[dict[str, Any]],
+        tool_data_dir: Path,
+        execution_run_data_folder: Path,
+        usage_kwargs: dict[Any, Any],
+        is_highlight_enabled: bool,
+        tool_id: str,
+        file_hash: str | None,
+        extracted_text: str,
+    ) -> dict[str, Any]:
+        """Indexes the document once per unique indexing parameter combination.
+
+        Combinations are indexed concurrently, up to `MAX_CONCURRENT_INDEXING`
+        at a time.
+
+        Returns:
+            dict[str, Any]: Indexing metrics keyed by the name of the first
+                output using each combination, in the order of the outputs.
+        """
+        vector_db = tool_settings[SettingsKeys.VECTOR_DB]
+        embedding = tool_settings[SettingsKeys.EMBEDDING]
+        x2text = tool_settings[SettingsKeys.X2TEXT_ADAPTER]
+
+        # Track seen parameter combinations to avoid duplicate indexing,
+        # mapping each combination to the first output that uses it
+        index_params: dict[str, tuple[str, int, int]] = {}
+        for output in outputs:
+            chunk_size = output[SettingsKeys.CHUNK_SIZE]
+            chunk_overlap = output[SettingsKeys.CHUNK_OVERLAP]
+
+            # Create a unique key for this parameter combination
+            param_key = (
+                f"chunk_size={chunk_size}_"
+                f"chunk_overlap={chunk_overlap}_"
+                f"vector_db={vector_db}_"
+                f"embedding={embedding}_"
+                f"x2text={x2text}"
+            )
+
+            # Only process if we haven't seen this combination yet and chunk_size is not zero
+            if chunk_size != 0 and param_key not in index_params:
+                index_params[param_key] = (
+                    output[SettingsKeys.NAME],
+                    chunk_size,
+                    chunk_overlap,
+                )
+
+        def index(chunk_size: int, chunk_overlap: int) -> float:
+            indexing_start_time = datetime.datetime.now()
+            STHelper.dynamic_indexing(
+                tool_settings=tool_settings,
+                run_id=self.file_execution_id,
+                file_path=tool_data_dir / SettingsKeys.EXTRACT,
+                tool=self,
+                execution_run_data_folder=str(execution_run_data_folder),
+                chunk_overlap=chunk_overlap,
+                reindex=True,
+                usage_kwargs=usage_kwargs,
+                enable_highlight=is_highlight_enabled,
+                chunk_size=chunk_size,
+                tool_id=tool_id,
+                file_hash=file_hash,
+                extracted_text=extracted_text,
+            )
+            return STHelper.elapsed_time(start_time=indexing_start_time)
+
+        if not index_params:
+            return {}
+        max_workers = min(len(index_params), STHelper.get_max_concurrent_indexing())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for param_key, (_, chunk_size, chunk_overlap) in index_params.items():
+                # Logged here rather than from the workers, which would
+                # interleave the log lines written to stdout
+                self.stream_log(
+                    f"Indexing document with: chunk_size={chunk_size}, "
+                    f"chunk_overlap={chunk_overlap}, vector_db={vector_db}, "
+                    f"embedding={embedding}, x2text={x2text}"
+                )
+                futures[param_key] = executor.submit(index, chunk_size, chunk_overlap)
+
+        index_metrics = {}
+        failed_outputs = []
+        for param_key, (output_name, _, _) in index_params.items():
+            try:
+                time_taken = futures[param_key].result()
+            except Exception as e:
+                logger.error(f"Error indexing for output '{output_name}': {e}")
+                failed_outputs.append(f"'{output_name}': {e}")
+                continue
+            index_metrics[output_name] = {
+                SettingsKeys.INDEXING: {"time_taken(s)": time_taken}
+            }
+        if failed_outputs:
+            self.stream_error_and_exit(
+                f"Error indexing document for output(s) {', '.join(failed_outputs)}"
+            )
+        return index_metrics
+
     def _merge_metrics(self, metrics1: dict, metrics2: dict) -> dict:
         """Intelligently merge two metrics dictionaries.
 
@@ -302,15 +362,21 @@ class StructureTool(BaseTool):
         responder: PromptTool,
         outputs: dict[str, Any],
         usage_kwargs: dict[Any, Any] = {},
+        file_hash: str | None = None,
     ) -> tuple[str, str]:
         """Summarizes the context of the file.
 
+        Summaries are looked up in a content addressed cache shared across
+        executions before calling the LLM.
+
         Args:
             tool_settings (dict[str, Any]): Settings for the tool.
             tool_data_dir (Path): Directory where tool data is stored.
             responder (PromptTool): Instance of a tool used to generate the summary.
             outputs (dict[str, Any]): Dictionary containing prompt details.
             usage_kwargs (dict[Any, Any]): Used to capture usage metrics.
+            file_hash (str | None): Hash of the source file, used to key the
+                summary cache. Falls back to the hash of the extracted text.
 
         Returns:
             tuple[str, str]: Tuple containing the path to the summarized file and its hash.
@@ -343,16 +409,31 @@ class StructureTool(BaseTool):
                 output[SettingsKeys.X2TEXT_ADAPTER] = x2text_instance_id
                 output[SettingsKeys.CHUNK_SIZE] = 0
                 output[SettingsKeys.CHUNK_OVERLAP] = 0
-            self.stream_log("Summarized context not found, summarizing...")
-            payload = {
-                SettingsKeys.RUN_ID: run_id,
-                SettingsKeys.LLM_ADAPTER_INSTANCE_ID: llm_adapter_instance_id,
-                SettingsKeys.SUMMARIZE_PROMPT: summarize_prompt,
-                SettingsKeys.CONTEXT: context,
-                SettingsKeys.PROMPT_KEYS: prompt_keys,
-            }
-            structure_output = responder.summarize(payload=payload)
-            summarized_context = structure_output.get(SettingsKeys.DATA, "")
+            summary_cache = SummaryCache.from_env(
+                fs=self.workflow_filestorage, tool_data_dir=tool_data_dir
+            )
+            cache_key = SummaryCache.get_key(
+                file_hash=file_hash or hashlib.sha256(context.encode()).hexdigest(),
+                llm_adapter_instance_id=llm_adapter_instance_id,
+                x2text_instance_id=x2text_instance_id,
+                summarize_prompt=summarize_prompt,
+                prompt_keys=prompt_keys,
+            )
+            summarized_context = summary_cache.get(cache_key)
+            if summarized_context:
+                self.stream_log("Reusing cached summary of the document")
+            else:
+                self.stream_log("Summarized context not found, summarizing...")
+                payload = {
+                    SettingsKeys.RUN_ID: run_id,
+                    SettingsKeys.LLM_ADAPTER_INSTANCE_ID: llm_adapter_instance_id,
+                    SettingsKeys.SUMMARIZE_PROMPT: summarize_prompt,
+                    SettingsKeys.CONTEXT: context,
+                    SettingsKeys.PROMPT_KEYS: prompt_keys,
+                }
+                structure_output = responder.summarize(payload=payload)
+                summarized_context = structure_output.get(SettingsKeys.DATA, "")
+                summary_cache.put(cache_key, summarized_context)
             self.stream_log(f"Writing summarized context to '{summarize_file_path}'")
             self.workflow_filestorage.write(
                 path=summarize_file_path, mode="w", data=summarized_context
@@ -0,0 +1,166 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import zlib
+from datetime import UTC
+from pathlib import Path
+from typing import Any
+
+from constants import SettingsKeys  # type: ignore [attr-defined]
+
+from unstract.sdk.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_CACHE_DIR_NAME = "summary_cache"
+DEFAULT_SUMMARY_CACHE_TTL = 7 * 24 * 60 * 60
+DEFAULT_SUMMARY_CACHE_MAX_ENTRIES = 1000
+DEFAULT_SUMMARY_CACHE_EVICTION_INTERVAL = 50
+
+
+class SummaryCache:
+    """Content addressed cache of summaries shared across executions.
+
+    Entries are stored as files on the workflow file storage, named after a
+    hash of the document and the settings that influence its summary. Entries
+    older than the TTL are treated as misses and the oldest entries are
+    evicted once the cache grows beyond its maximum size.
+
+    Listing the cache directory is costly on remote storages, so only about
+    one in `eviction_interval` writes checks the size of the cache. Which
+    writes do is derived from the key, which spreads the checks over the
+    executions sharing the cache without any coordination between them. The
+    cache may hence briefly hold a few more entries than `max_entries`.
+    """
+
+    def __init__(
+        self,
+        fs: FileStorage,
+        cache_dir: Path,
+        ttl: int = DEFAULT_SUMMARY_CACHE_TTL,
+        max_entries: int = DEFAULT_SUMMARY_CACHE_MAX_ENTRIES,
+        eviction_interval: int = DEFAULT_SUMMARY_CACHE_EVICTION_INTERVAL,
+    ) -> None:
+        self.fs = fs
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.eviction_interval = max(eviction_interval, 1)
+
+    @classmethod
+    def from_env(cls, fs: FileStorage, tool_data_dir: Path) -> "SummaryCache":
+        """Creates the cache configured through the tool's environment.
+
+        By default the cache lives next to the organization's executions,
+        i.e. `<prefix>/<org_id>/summary_cache`, so that it is shared by every
+        workflow and API deployment of the organization but never across
+        organizations.
+
+        Args:
+            fs (FileStorage): Workflow execution file storage.
+            tool_data_dir (Path): Execution data directory of the current file.
+
+        Returns:
+            SummaryCache: Configured cache instance.
+        """
+        cache_dir = os.environ.get(SettingsKeys.SUMMARY_CACHE_DIR)
+        if cache_dir:
+            cache_path = Path(cache_dir)
+        else:
+            # <prefix>/<org_id>/<workflow_id>/<execution_id>/<file_execution_id>
+            cache_path = tool_data_dir.parents[2] / SUMMARY_CACHE_DIR_NAME
+        return cls(
+            fs=fs,
+            cache_dir=cache_path,
+            ttl=_get_int_env(SettingsKeys.SUMMARY_CACHE_TTL, DEFAULT_SUMMARY_CACHE_TTL),
+            max_entries=_get_int_env(
+                SettingsKeys.SUMMARY_CACHE_MAX_ENTRIES,
+                DEFAULT_SUMMARY_CACHE_MAX_ENTRIES,
+            ),
+            eviction_interval=_get_int_env(
+                SettingsKeys.SUMMARY_CACHE_EVICTION_INTERVAL,
+                DEFAULT_SUMMARY_CACHE_EVICTION_INTERVAL,
+            ),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    @staticmethod
+    def get_key(file_hash: str, **settings: Any) -> str:
+        """Builds the cache key of a summary.
+
+        Args:
+            file_hash (str): Hash of the source document.
+            settings (Any): Settings that influence the summary such as the
+                summarize prompt, LLM adapter and prompt keys.
+
+        Returns:
+            str: Hex digest identifying the summary.
+        """
+        fingerprint = json.dumps(
+            {"file_hash": file_hash, **settings}, sort_keys=True, default=str
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Returns the cached summary for the key if present and fresh."""
+        if not self.enabled:
+            return None
+        path = self.cache_dir / key
+        try:
+            if not self.fs.exists(path):
+                return None
+            if self._is_expired(path):
+                logger.info(f"Summary cache entry '{key}' expired, removing it")
+                self.fs.rm(path)
+                return None
+            summary: str = self.fs.read(path=path, mode="r")
+        except Exception as e:
+            logger.warning(f"Unable to read summary cache entry '{key}': {e}")
+            return None
+        return summary or None
+
+    def put(self, key: str, summary: str) -> None:
+        """Stores the summary and evicts the oldest entries if needed.
+
+        Failures are logged and ignored since the cache is an optimization.
+        """
+        if not self.enabled or not summary:
+            return
+        try:
+            self.fs.mkdir(self.cache_dir, create_parents=True)
+            self.fs.write(path=self.cache_dir / key, mode="w", data=summary)
+            if self._should_evict(key):
+                self._evict()
+        except Exception as e:
+            logger.warning(f"Unable to write summary cache entry '{key}': {e}")
+
+    def _is_expired(self, path: Path) -> bool:
+        modified_at = self.fs.modification_time(path)
+        if modified_at.tzinfo is None:
+            modified_at = modified_at.replace(tzinfo=UTC)
+        age = datetime.datetime.now(UTC) - modified_at
+        return age.total_seconds() > self.ttl
+
+    def _should_evict(self, key: str) -> bool:
+        return zlib.crc32(key.encode("utf-8")) % self.eviction_interval == 0
+
+    def _evict(self) -> None:
+        entries = self.fs.ls(self.cache_dir)
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=self.fs.modification_time)
+        for entry in entries[: len(entries) - self.max_entries]:
+            logger.info(f"Evicting summary cache entry '{entry}'")
+            self.fs.rm(entry)
+
+
+def _get_int_env(env_key: str, default: int) -> int:
+    try:
+        return int(os.environ.get(env_key, default))
+    except ValueError:
+        return default
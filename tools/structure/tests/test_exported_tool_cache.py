@@ -0,0 +1,98 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from exported_tool_cache import ExportedToolCache
+
+from unstract.sdk.file_storage import FileStorage, FileStorageProvider
+
+PROMPT_REGISTRY_ID = "registry-id"
+ENV = {
+    "PLATFORM_SERVICE_HOST": "http://platform",
+    "PLATFORM_SERVICE_PORT": "3001",
+    "PLATFORM_SERVICE_API_KEY": "api-key",
+}
+
+
+@pytest.fixture(autouse=True)
+def exported_tools(mocker):
+    return mocker.patch.object(ExportedToolCache, "_exported_tools", {})
+
+
+@pytest.fixture
+def tool():
+    tool = MagicMock()
+    tool.workflow_filestorage = FileStorage(FileStorageProvider.LOCAL)
+    tool.get_env_or_die.side_effect = ENV.__getitem__
+    tool.file_execution_id = "file-execution"
+    return tool
+
+
+@pytest.fixture
+def session():
+    return MagicMock(spec=requests.Session)
+
+
+def make_response(status_code: int, body: dict | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode("utf-8") if body else b""
+    if body and body.get("version"):
+        response.headers["ETag"] = f'"{body["version"]}"'
+    return response
+
+
+def exported_tool(version: str) -> dict:
+    return {"tool_metadata": {"name": "Invoices", "outputs": []}, "version": version}
+
+
+def test_cached_tool_is_revalidated(tmp_path, tool, session, exported_tools):
+    session.get.side_effect = [make_response(200, exported_tool("v1"))]
+    cache = ExportedToolCache(tool=tool, execution_dir=tmp_path, session=session)
+    assert cache.get_prompt_studio_tool(PROMPT_REGISTRY_ID) == exported_tool("v1")
+    assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+
+    # Another file of the execution, in a new process
+    exported_tools.clear()
+    session.get.side_effect = [make_response(304)]
+    cache = ExportedToolCache(tool=tool, execution_dir=tmp_path, session=session)
+
+    assert cache.get_prompt_studio_tool(PROMPT_REGISTRY_ID) == exported_tool("v1")
+    assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_changed_tool_replaces_cached_copy(tmp_path, tool, session):
+    session.get.side_effect = [
+        make_response(200, exported_tool("v1")),
+        make_response(200, exported_tool("v2")),
+        make_response(304),
+    ]
+    cache = ExportedToolCache(tool=tool, execution_dir=tmp_path, session=session)
+
+    cache.get_prompt_studio_tool(PROMPT_REGISTRY_ID)
+    assert cache.get_prompt_studio_tool(PROMPT_REGISTRY_ID) == exported_tool("v2")
+    assert cache.get_prompt_studio_tool(PROMPT_REGISTRY_ID) == exported_tool("v2")
+    assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"v2"'
+
+
+@pytest.mark.parametrize("content", ["{not json", "[]"])
+def test_corrupted_cache_file_is_refetched(tmp_path, tool, session, content):
+    (tmp_path / f"exported_tool_{PROMPT_REGISTRY_ID}.json").write_text(content)
+    session.get.side_effect = [make_response(200, exported_tool("v1"))]
+    cache = ExportedToolCache(tool=tool, execution_dir=tmp_path, session=session)
+
+    assert cache.get_prompt_studio_tool(PROMPT_REGISTRY_ID) == exported_tool("v1")
+    assert "If-None-Match" not in session.get.call_args.kwargs["headers"]
+    cached = json.loads(
+        (tmp_path / f"exported_tool_{PROMPT_REGISTRY_ID}.json").read_text()
+    )
+    assert cached == exported_tool("v1")
+
+
+def test_platform_error(tmp_path, tool, session):
+    session.get.side_effect = [make_response(404, {"error": "Tool not found"})]
+    cache = ExportedToolCache(tool=tool, execution_dir=tmp_path, session=session)
+
+    with pytest.raises(requests.HTTPError, match="Tool not found"):
+        cache.get_prompt_studio_tool(PROMPT_REGISTRY_ID)
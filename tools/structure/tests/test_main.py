@@ -0,0 +1,155 @@
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from constants import SettingsKeys
+from main import STHelper, StructureTool
+
+TOOL_SETTINGS = {
+    SettingsKeys.VECTOR_DB: "vector-db",
+    SettingsKeys.EMBEDDING: "embedding",
+    SettingsKeys.X2TEXT_ADAPTER: "x2text",
+}
+
+
+@pytest.fixture
+def tool():
+    tool = MagicMock()
+    tool.file_execution_id = "file-execution"
+    return tool
+
+
+@pytest.fixture
+def max_concurrent_indexing(mocker):
+    return mocker.patch.object(STHelper, "get_max_concurrent_indexing", return_value=4)
+
+
+@pytest.fixture
+def dynamic_indexing(mocker, max_concurrent_indexing):
+    return mocker.patch.object(STHelper, "dynamic_indexing")
+
+
+def output(name: str, chunk_size: int, chunk_overlap: int = 0) -> dict:
+    return {
+        SettingsKeys.NAME: name,
+        SettingsKeys.CHUNK_SIZE: chunk_size,
+        SettingsKeys.CHUNK_OVERLAP: chunk_overlap,
+    }
+
+
+def index_documents(tool, outputs: list[dict]) -> dict:
+    return StructureTool._index_documents(
+        tool,
+        tool_settings=TOOL_SETTINGS,
+        outputs=outputs,
+        tool_data_dir=Path("data"),
+        execution_run_data_folder=Path("run"),
+        usage_kwargs={},
+        is_highlight_enabled=False,
+        tool_id="tool-id",
+        file_hash="file-hash",
+        extracted_text="text",
+    )
+
+
+def test_indexing_concurrency_is_bounded(tool, dynamic_indexing, max_concurrent_indexing):
+    max_concurrent_indexing.return_value = 2
+    lock = threading.Lock()
+    running, max_running = 0, 0
+
+    def index(**kwargs):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    dynamic_indexing.side_effect = index
+
+    index_documents(tool, [output(f"output-{i}", 100 * (i + 1)) for i in range(5)])
+
+    assert dynamic_indexing.call_count == 5
+    assert max_running == 2
+
+
+def test_metrics_follow_order_of_outputs(tool, dynamic_indexing):
+    last_indexed = threading.Event()
+
+    def index(chunk_size, **kwargs):
+        # The first combination finishes only after the last one
+        if chunk_size == 100:
+            assert last_indexed.wait(timeout=5)
+        elif chunk_size == 300:
+            last_indexed.set()
+
+    dynamic_indexing.side_effect = index
+
+    index_metrics = index_documents(
+        tool, [output("first", 100), output("second", 200), output("third", 300)]
+    )
+
+    assert list(index_metrics) == ["first", "second", "third"]
+    assert all(
+        "time_taken(s)" in metrics[SettingsKeys.INDEXING]
+        for metrics in index_metrics.values()
+    )
+    tool.stream_error_and_exit.assert_not_called()
+
+
+def test_failed_outputs_are_reported_together(tool, dynamic_indexing):
+    def index(chunk_size, **kwargs):
+        if chunk_size != 200:
+            raise RuntimeError(f"failed for {chunk_size}")
+
+    dynamic_indexing.side_effect = index
+
+    index_documents(
+        tool, [output("first", 100), output("second", 200), output("third", 300)]
+    )
+
+    # Every combination is indexed before the failures are reported
+    assert dynamic_indexing.call_count == 3
+    tool.stream_error_and_exit.assert_called_once_with(
+        "Error indexing document for output(s) 'first': failed for 100, "
+        "'third': failed for 300"
+    )
+
+
+def test_each_combination_is_indexed_once(tool, dynamic_indexing):
+    index_metrics = index_documents(
+        tool,
+        [
+            output("first", 100, 10),
+            output("same-as-first", 100, 10),
+            output("no-chunking", 0),
+            output("other-overlap", 100, 20),
+        ],
+    )
+
+    assert sorted(
+        (c.kwargs["chunk_size"], c.kwargs["chunk_overlap"])
+        for c in dynamic_indexing.call_args_list
+    ) == [(100, 10), (100, 20)]
+    assert list(index_metrics) == ["first", "other-overlap"]
+
+
+def test_indexing_is_logged_from_main_thread(tool, dynamic_indexing):
+    logging_threads = []
+    tool.stream_log.side_effect = lambda log: logging_threads.append(
+        threading.current_thread()
+    )
+
+    index_documents(tool, [output("first", 100), output("second", 200)])
+
+    assert logging_threads == [threading.main_thread()] * 2
+
+
+def test_no_indexing_without_chunking(tool, dynamic_indexing, max_concurrent_indexing):
+    assert index_documents(tool, [output("no-chunking", 0)]) == {}
+
+    dynamic_indexing.assert_not_called()
+    max_concurrent_indexing.assert_not_called()
@@ -0,0 +1,83 @@
+import datetime
+import os
+
+import pytest
+from summary_cache import SummaryCache
+
+from unstract.sdk.file_storage import FileStorage, FileStorageProvider
+
+
+@pytest.fixture
+def fs():
+    return FileStorage(FileStorageProvider.LOCAL)
+
+
+def make_cache(fs, tmp_path, **kwargs) -> SummaryCache:
+    return SummaryCache(fs=fs, cache_dir=tmp_path / "summary_cache", **kwargs)
+
+
+def age_entry(cache: SummaryCache, key: str, seconds: int) -> None:
+    path = cache.cache_dir / key
+    modified_at = datetime.datetime.now().timestamp() - seconds
+    os.utime(path, (modified_at, modified_at))
+
+
+def test_hit(fs, tmp_path):
+    cache = make_cache(fs, tmp_path)
+    key = SummaryCache.get_key("file-hash", llm="llm-1", prompt="summarize")
+
+    cache.put(key, "summary")
+
+    assert cache.get(key) == "summary"
+
+
+def test_miss_on_different_settings(fs, tmp_path):
+    cache = make_cache(fs, tmp_path)
+    cache.put(SummaryCache.get_key("file-hash", llm="llm-1"), "summary")
+
+    assert cache.get(SummaryCache.get_key("file-hash", llm="llm-2")) is None
+    assert cache.get(SummaryCache.get_key("other-hash", llm="llm-1")) is None
+
+
+def test_expired_entry_is_removed(fs, tmp_path):
+    cache = make_cache(fs, tmp_path, ttl=60)
+    key = SummaryCache.get_key("file-hash")
+    cache.put(key, "summary")
+    age_entry(cache, key, seconds=120)
+
+    assert cache.get(key) is None
+    assert not fs.exists(cache.cache_dir / key)
+
+
+def test_disabled_cache(fs, tmp_path):
+    cache = make_cache(fs, tmp_path, ttl=0)
+    key = SummaryCache.get_key("file-hash")
+    cache.put(key, "summary")
+
+    assert cache.get(key) is None
+    assert not fs.exists(cache.cache_dir)
+
+
+def test_oldest_entries_are_evicted(fs, tmp_path):
+    cache = make_cache(fs, tmp_path, max_entries=2, eviction_interval=1)
+    keys = [SummaryCache.get_key(f"file-{index}") for index in range(3)]
+    for age, key in zip((30, 20), keys[:2], strict=True):
+        cache.put(key, f"summary of {key}")
+        age_entry(cache, key, seconds=age)
+
+    cache.put(keys[2], "newest summary")
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == f"summary of {keys[1]}"
+    assert cache.get(keys[2]) == "newest summary"
+
+
+def test_cache_dir_is_listed_on_few_writes(mocker, fs, tmp_path):
+    cache = make_cache(fs, tmp_path, max_entries=1000, eviction_interval=10)
+    ls = mocker.spy(fs, "ls")
+
+    for index in range(200):
+        cache.put(SummaryCache.get_key(f"file-{index}"), "summary")
+
+    # About one in ten writes checks the size of the cache
+    assert 5 <= ls.call_count <= 40
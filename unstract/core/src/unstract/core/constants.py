@@ -7,6 +7,9 @@ class LogFieldName:
     EVENT_TIME = "event_time"
     FILE_EXECUTION_ID = "file_execution_id"
     TOOL_TERMINATION_MARKER = "TOOL_EXECUTION_COMPLETE"
+    # Markers delimiting each file's run within a batched tool container
+    FILE_RUN_START_MARKER = "TOOL_FILE_RUN_START"
+    FILE_RUN_END_MARKER = "TOOL_FILE_RUN_END"
 
 
 class LogEventArgument:
@@ -0,0 +1,106 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlatformKeyDetails:
+    organization_uid: int
+    organization_identifier: str
+    expires_at: float
+
+
+class PlatformKeyCache:
+    """Bounded in-process cache of validated platform keys.
+
+    Only active keys are cached, mapped to the organization they belong to.
+    Entries expire after `ttl_in_second` and the least recently used ones are
+    evicted beyond `max_entries`. The backend bumps `GENERATION_KEY` in Redis
+    whenever a platform key is refreshed, toggled or deleted, which clears the
+    cache of every process. A TTL of 0 disables the cache.
+
+    Args:
+        get_redis_client (Callable[[], redis.Redis]): Returns the client used
+            to read `GENERATION_KEY`, called on every lookup
+        ttl_in_second (int): Time an entry is served for
+        max_entries (int): Entries kept at most
+    """
+
+    GENERATION_KEY = "platform_key:generation"
+
+    def __init__(
+        self,
+        get_redis_client: Callable[[], redis.Redis],
+        ttl_in_second: int,
+        max_entries: int,
+    ) -> None:
+        self.get_redis_client = get_redis_client
+        self.ttl_in_second = ttl_in_second
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, PlatformKeyDetails] = OrderedDict()
+        self._generation: bytes | None = None
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self.ttl_in_second > 0 and self.max_entries > 0
+
+    def _sync_generation(self) -> bool:
+        """Clears the cache if platform keys changed since it was filled.
+
+        Returns:
+            bool: False if the generation could not be read, in which case the
+                cache must not be trusted
+        """
+        try:
+            generation = self.get_redis_client().get(self.GENERATION_KEY)
+        except Exception as e:
+            logger.warning(f"Unable to read platform key generation: {e}")
+            return False
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+        return True
+
+    def get(self, token: str) -> PlatformKeyDetails | None:
+        """Returns the cached details of an active platform key, if any."""
+        if not self.is_enabled() or not self._sync_generation():
+            return None
+        with self._lock:
+            details = self._entries.get(token)
+            if not details:
+                return None
+            if details.expires_at <= time.monotonic():
+                del self._entries[token]
+                return None
+            self._entries.move_to_end(token)
+            return details
+
+    def put(
+        self, token: str, organization_uid: int, organization_identifier: str
+    ) -> PlatformKeyDetails:
+        """Caches an active platform key along with its organization."""
+        details = PlatformKeyDetails(
+            organization_uid=organization_uid,
+            organization_identifier=organization_identifier,
+            expires_at=time.monotonic() + self.ttl_in_second,
+        )
+        if not self.is_enabled():
+            return details
+        with self._lock:
+            self._entries[token] = details
+            self._entries.move_to_end(token)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return details
+
+    def invalidate(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(token, None)
@@ -165,6 +165,75 @@ class LogPublisher:
             return False
         return True
 
+    @classmethod
+    def publish_batch(cls, channel_id: str, payloads: list[dict[str, Any]]) -> bool:
+        """Publish several messages to the queue over a single producer.
+
+        Unified notification logs of the batch are persisted in one pipeline.
+        """
+        if not payloads:
+            return True
+        try:
+            event = f"logs:{channel_id}"
+            headers = cls._get_task_header(LogProcessingTask.TASK_NAME)
+            with cls.kombu_conn.Producer(serializer="json") as producer:
+                for payload in payloads:
+                    task_message = cls._get_task_message(
+                        user_session_id=channel_id,
+                        event=event,
+                        message=payload,
+                    )
+                    producer.publish(
+                        body=task_message,
+                        exchange="",
+                        headers=headers,
+                        routing_key=LogProcessingTask.QUEUE_NAME,
+                        compression=None,
+                        retry=True,
+                    )
+            logging.debug(f"Published {len(payloads)} messages to '{channel_id}'")
+
+            # Persisting messages for unified notification
+            cls.store_batch_for_unified_notification(
+                event, [payload for payload in payloads if payload.get("type") == "LOG"]
+            )
+        except Exception as e:
+            logging.error(
+                f"Failed to publish {len(payloads)} messages to '{channel_id}'"
+                f": {e}\n{traceback.format_exc()}"
+            )
+            return False
+        return True
+
+    @classmethod
+    def store_batch_for_unified_notification(
+        cls, event: str, payloads: list[dict[str, Any]]
+    ) -> None:
+        """Persist several unified notification messages in one pipeline.
+
+        Args:
+            event (str): User session ID
+            payloads (list[dict[str, Any]]): Messages being sent
+        """
+        if not payloads:
+            return
+        try:
+            logs_expiration = os.environ.get(
+                "LOGS_EXPIRATION_TIME_IN_SECOND", "86400"
+            )  # Defaults to 1 day
+            with cls.r.pipeline(transaction=False) as pipe:
+                for payload in payloads:
+                    timestamp = payload.get("timestamp", round(time.time(), 6))
+                    pipe.setex(
+                        f"{event}:{timestamp}", logs_expiration, json.dumps(payload)
+                    )
+                pipe.execute()
+        except Exception as e:
+            logging.error(
+                f"Failed to store {len(payloads)} unified notification logs for "
+                f"'{event}': {e}\n{traceback.format_exc()}"
+            )
+
     @classmethod
     def store_for_unified_notification(cls, event: str, payload: dict[str, Any]) -> None:
         """Helps persist messages for unified notification.
@@ -139,6 +139,41 @@ class ToolExecutionTracker:
             pipe.expire(key, self.CACHE_TTL_IN_SECOND)
             pipe.execute()
 
+    def get_completion_key(self, tool_execution_data: ToolExecutionData) -> str:
+        return f"tool_execution_completed:{tool_execution_data.execution_id}:{tool_execution_data.file_execution_id}"
+
+    def signal_completion(self, tool_execution_data: ToolExecutionData) -> None:
+        """Signal waiters that the tool has finished running on the file.
+
+        The signal is kept in a list until consumed (or expired), so a waiter
+        that starts blocking after the tool finished still receives it.
+
+        Args:
+            tool_execution_data (ToolExecutionData): Tool execution to signal
+        """
+        tool_execution_data.validate()
+        key = self.get_completion_key(tool_execution_data)
+        with self.redis_client.pipeline() as pipe:
+            pipe.rpush(key, ToolExecutionField.STATUS)
+            pipe.expire(key, self.CACHE_TTL_IN_SECOND)
+            pipe.execute()
+
+    def wait_for_completion(
+        self, tool_execution_data: ToolExecutionData, timeout: int
+    ) -> bool:
+        """Block until the tool signals completion or the timeout elapses.
+
+        Args:
+            tool_execution_data (ToolExecutionData): Tool execution to wait for
+            timeout (int): Maximum time to block in seconds
+
+        Returns:
+            bool: True if the completion signal was received
+        """
+        tool_execution_data.validate()
+        key = self.get_completion_key(tool_execution_data)
+        return self.redis_client.blpop([key], timeout=timeout) is not None
+
     def get_status(
         self, tool_execution_data: ToolExecutionData
     ) -> ToolExecutionData | None:
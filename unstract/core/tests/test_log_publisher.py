@@ -0,0 +1,73 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from unstract.core.pubsub_helper import LogPublisher
+
+
+class LogPublisherBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        kombu_patcher = patch.object(LogPublisher, "kombu_conn")
+        redis_patcher = patch.object(LogPublisher, "r")
+        self.kombu_conn = kombu_patcher.start()
+        self.redis_client = redis_patcher.start()
+        self.addCleanup(kombu_patcher.stop)
+        self.addCleanup(redis_patcher.stop)
+        self.producer = self.kombu_conn.Producer.return_value.__enter__.return_value
+        self.pipe = self.redis_client.pipeline.return_value.__enter__.return_value
+        self.payloads = [
+            {"type": "LOG", "log": "one", "timestamp": 1.0},
+            {"type": "UPDATE", "state": "RUNNING", "timestamp": 2.0},
+            {"type": "LOG", "log": "two", "timestamp": 3.0},
+        ]
+
+    def test_batch_is_published_over_one_producer(self):
+        self.assertTrue(LogPublisher.publish_batch("channel", self.payloads))
+
+        self.kombu_conn.Producer.assert_called_once()
+        published = [
+            call.kwargs["body"]["kwargs"]["message"]
+            for call in self.producer.publish.call_args_list
+        ]
+        self.assertEqual(published, self.payloads)
+        for call in self.producer.publish.call_args_list:
+            self.assertEqual(call.kwargs["body"]["kwargs"]["event"], "logs:channel")
+
+    def test_only_logs_are_stored_for_unified_notification(self):
+        LogPublisher.publish_batch("channel", self.payloads)
+
+        self.redis_client.pipeline.assert_called_once_with(transaction=False)
+        stored = {
+            call.args[0]: json.loads(call.args[2])
+            for call in self.pipe.setex.call_args_list
+        }
+        self.assertEqual(
+            stored,
+            {
+                "logs:channel:1.0": self.payloads[0],
+                "logs:channel:3.0": self.payloads[2],
+            },
+        )
+        self.pipe.execute.assert_called_once()
+
+    def test_empty_batch_is_not_published(self):
+        self.assertTrue(LogPublisher.publish_batch("channel", []))
+
+        self.kombu_conn.Producer.assert_not_called()
+        self.redis_client.pipeline.assert_not_called()
+
+    def test_publish_failure(self):
+        self.producer.publish.side_effect = ConnectionError("broker unavailable")
+
+        self.assertFalse(LogPublisher.publish_batch("channel", self.payloads))
+        self.redis_client.pipeline.assert_not_called()
+
+    def test_store_failure_does_not_fail_publish(self):
+        self.pipe.execute.side_effect = ConnectionError("redis unavailable")
+
+        self.assertTrue(LogPublisher.publish_batch("channel", self.payloads))
+        self.assertEqual(self.producer.publish.call_count, len(self.payloads))
+
+
+if __name__ == "__main__":
+    unittest.main()
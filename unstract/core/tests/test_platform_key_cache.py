@@ -0,0 +1,114 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from unstract.core.platform_key_cache import PlatformKeyCache
+
+MONOTONIC = "unstract.core.platform_key_cache.time.monotonic"
+
+
+class PlatformKeyCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.redis_client = MagicMock()
+        self.redis_client.get.return_value = b"1"
+        self.cache = self.create_cache()
+
+    def create_cache(self, ttl_in_second=60, max_entries=100):
+        return PlatformKeyCache(
+            get_redis_client=lambda: self.redis_client,
+            ttl_in_second=ttl_in_second,
+            max_entries=max_entries,
+        )
+
+    @staticmethod
+    def validate(cache, token, organization_uid, organization_identifier):
+        # As the services do, a key is looked up before it is cached
+        if not cache.get(token):
+            cache.put(token, organization_uid, organization_identifier)
+
+    def test_cached_key_is_served(self):
+        self.assertIsNone(self.cache.get("key"))
+
+        self.cache.put("key", 1, "org")
+        details = self.cache.get("key")
+
+        self.assertEqual(
+            (details.organization_uid, details.organization_identifier), (1, "org")
+        )
+        self.redis_client.get.assert_called_with(PlatformKeyCache.GENERATION_KEY)
+
+    def test_generation_bump_clears_cache(self):
+        self.validate(self.cache, "key", 1, "org")
+        self.validate(self.cache, "other-key", 2, "other-org")
+
+        # The backend refreshed, toggled or deleted a key
+        self.redis_client.get.return_value = b"2"
+
+        self.assertIsNone(self.cache.get("key"))
+        self.assertIsNone(self.cache.get("other-key"))
+        # Keys cached after the bump are served until the next one
+        self.validate(self.cache, "key", 1, "org")
+        self.assertIsNotNone(self.cache.get("key"))
+
+    def test_first_generation_bump_clears_cache(self):
+        # No key has been changed yet when the cache is filled
+        self.redis_client.get.return_value = None
+        self.validate(self.cache, "key", 1, "org")
+
+        self.redis_client.get.return_value = b"1"
+
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_unreadable_generation_bypasses_cache(self):
+        self.validate(self.cache, "key", 1, "org")
+
+        self.redis_client.get.side_effect = ConnectionError("Redis is down")
+        self.assertIsNone(self.cache.get("key"))
+
+        # The entry is still valid once the generation can be read again
+        self.redis_client.get.side_effect = None
+        self.assertIsNotNone(self.cache.get("key"))
+
+    def test_entry_expires(self):
+        with patch(MONOTONIC, return_value=1000.0):
+            self.validate(self.cache, "key", 1, "org")
+        with patch(MONOTONIC, return_value=1059.0):
+            self.assertIsNotNone(self.cache.get("key"))
+        with patch(MONOTONIC, return_value=1060.0):
+            self.assertIsNone(self.cache.get("key"))
+
+    def test_least_recently_used_key_is_evicted(self):
+        cache = self.create_cache(max_entries=2)
+        self.validate(cache, "key-1", 1, "org-1")
+        self.validate(cache, "key-2", 2, "org-2")
+        cache.get("key-1")
+
+        self.validate(cache, "key-3", 3, "org-3")
+
+        self.assertIsNotNone(cache.get("key-1"))
+        self.assertIsNone(cache.get("key-2"))
+        self.assertIsNotNone(cache.get("key-3"))
+
+    def test_invalidate(self):
+        self.validate(self.cache, "key", 1, "org")
+
+        self.cache.invalidate("key")
+
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_disabled_cache(self):
+        cache = self.create_cache(ttl_in_second=0)
+
+        details = cache.put("key", 1, "org")
+
+        self.assertEqual(details.organization_identifier, "org")
+        self.assertIsNone(cache.get("key"))
+        self.redis_client.get.assert_not_called()
+
+    def test_instances_do_not_share_entries(self):
+        self.validate(self.cache, "key", 1, "org")
+
+        self.assertIsNone(self.create_cache().get("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import patch
+
+from unstract.core.tool_execution_status import (
+    ToolExecutionData,
+    ToolExecutionTracker,
+)
+
+
+class ToolExecutionCompletionTestCase(unittest.TestCase):
+    def setUp(self):
+        with patch("unstract.core.tool_execution_status.redis.Redis") as redis_class:
+            self.tracker = ToolExecutionTracker()
+        self.redis_client = redis_class.return_value
+        self.tool_execution_data = ToolExecutionData(
+            execution_id="execution", file_execution_id="file-1"
+        )
+
+    def test_signal_is_kept_for_late_waiters(self):
+        self.tracker.signal_completion(self.tool_execution_data)
+
+        pipe = self.redis_client.pipeline.return_value.__enter__.return_value
+        key = self.tracker.get_completion_key(self.tool_execution_data)
+        pipe.rpush.assert_called_once()
+        self.assertEqual(pipe.rpush.call_args.args[0], key)
+        pipe.expire.assert_called_once_with(key, ToolExecutionTracker.CACHE_TTL_IN_SECOND)
+        pipe.execute.assert_called_once()
+
+    def test_wait_receives_signal(self):
+        key = self.tracker.get_completion_key(self.tool_execution_data)
+        self.redis_client.blpop.return_value = (key, "status")
+
+        self.assertTrue(
+            self.tracker.wait_for_completion(self.tool_execution_data, timeout=5)
+        )
+        self.redis_client.blpop.assert_called_once_with([key], timeout=5)
+
+    def test_wait_times_out(self):
+        self.redis_client.blpop.return_value = None
+
+        self.assertFalse(
+            self.tracker.wait_for_completion(self.tool_execution_data, timeout=5)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
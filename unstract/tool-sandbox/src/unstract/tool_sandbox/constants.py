@@ -1,6 +1,7 @@
 class UnstractRunner:
     BASE_API_ENDPOINT = "/v1/api"
     RUN_API_ENDPOINT = "/container/run"
+    RUN_BATCH_API_ENDPOINT = "/container/run-batch"
     SPEC_API_ENDPOINT = "/container/spec"
     PROPERTIES_API_ENDPOINT = "/container/properties"
     ICON_API_ENDPOINT = "/container/icon"
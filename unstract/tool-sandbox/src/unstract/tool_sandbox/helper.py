@@ -125,38 +125,23 @@ class ToolSandboxHelper:
                 execution_id=self.execution_id, file_execution_id=file_execution_id
             )
 
-        # Configurable polling values
-        max_wait_seconds = int(os.getenv("MAX_RUNNER_POLLING_WAIT_SECONDS", 60 * 60 * 3))
-        interval_seconds = int(os.getenv("RUNNER_POLLING_INTERVAL_SECONDS", 2))
-        start_time = datetime.now(UTC)
-        end_time = start_time + timedelta(seconds=max_wait_seconds)
-        response: RunnerContainerRunResponse | None = None
-
-        while datetime.now(UTC) < end_time:
-            status = self._check_tool_run_status(file_execution_data.tool_container_name)
-            elapsed = (datetime.now(UTC) - start_time).total_seconds()
-            logger.info(
-                f"Tool status {status} for execution_id: {self.execution_id} and file_execution_id: {file_execution_id} - elapsed: {elapsed:.2f}s"
+        max_wait_seconds = self._get_max_polling_wait_seconds()
+        if self._wait_for_tool_container(
+            container_name=file_execution_data.tool_container_name,
+            file_execution_id=file_execution_id,
+        ):
+            error = self._handle_tool_execution_status(
+                execution_id=self.execution_id,
+                file_execution_id=file_execution_id,
+                container_name=file_execution_data.tool_container_name,
             )
-            if status and status.get("status") in COMPLETED_FINAL_STATUSES:
-                error = self._handle_tool_execution_status(
-                    execution_id=self.execution_id,
-                    file_execution_id=file_execution_id,
-                    container_name=file_execution_data.tool_container_name,
-                )
-                if error:
-                    response = self._create_run_response(
-                        status=RunnerContainerRunStatus.ERROR,
-                        error=error,
-                    )
-                    break
-                response = self._create_run_response(
-                    status=RunnerContainerRunStatus.SUCCESS,
-                )
-                break
-            time.sleep(interval_seconds)
-
-        if not response:
+            response = self._create_run_response(
+                status=RunnerContainerRunStatus.ERROR
+                if error
+                else RunnerContainerRunStatus.SUCCESS,
+                error=error,
+            )
+        else:
             logger.error(
                 f"Tool {file_execution_data.tool_container_name} is not completed within {max_wait_seconds} seconds"
             )
@@ -172,6 +157,64 @@ class ToolSandboxHelper:
             )
         return response
 
+    def _get_max_polling_wait_seconds(self) -> int:
+        return int(os.getenv("MAX_RUNNER_POLLING_WAIT_SECONDS", 60 * 60 * 3))
+
+    def _wait_for_tool_container(
+        self, container_name: str, file_execution_id: str
+    ) -> bool:
+        """Wait until the tool container has finished running.
+
+        Blocks on the completion signal pushed by the tool sidecar, which ends
+        the wait as soon as the tool is done. The container status is checked
+        with the runner every polling interval without a signal, so that an
+        exited container is still noticed if the sidecar died before signalling.
+
+        Args:
+            container_name (str): Name of the tool container
+            file_execution_id (str): File execution whose completion is
+                signalled, the last file of the batch for batched runs
+
+        Returns:
+            bool: True if the container completed within the allowed time
+        """
+        # Configurable polling values
+        max_wait_seconds = self._get_max_polling_wait_seconds()
+        interval_seconds = int(os.getenv("RUNNER_POLLING_INTERVAL_SECONDS", 2))
+        start_time = datetime.now(UTC)
+        end_time = start_time + timedelta(seconds=max_wait_seconds)
+        tool_execution_tracker = ToolExecutionTracker()
+        tool_execution_data = ToolExecutionData(
+            execution_id=self.execution_id,
+            file_execution_id=file_execution_id,
+        )
+
+        while datetime.now(UTC) < end_time:
+            remaining = (end_time - datetime.now(UTC)).total_seconds()
+            timeout = max(1, min(interval_seconds, int(remaining)))
+            try:
+                if tool_execution_tracker.wait_for_completion(
+                    tool_execution_data, timeout=timeout
+                ):
+                    logger.info(
+                        f"Tool completion signalled for execution_id: {self.execution_id} and file_execution_id: {file_execution_id}"
+                    )
+                    return True
+            except Exception as e:
+                logger.warning(
+                    f"Failed to wait for tool completion signal, polling instead: {e}"
+                )
+                time.sleep(timeout)
+
+            status = self._check_tool_run_status(container_name)
+            elapsed = (datetime.now(UTC) - start_time).total_seconds()
+            logger.info(
+                f"Tool status {status} for execution_id: {self.execution_id} and file_execution_id: {file_execution_id} - elapsed: {elapsed:.2f}s"
+            )
+            if status and status.get("status") in COMPLETED_FINAL_STATUSES:
+                return True
+        return False
+
     def call_tool_handler(
         self,
         file_execution_id: str,
@@ -200,20 +243,7 @@ class ToolSandboxHelper:
             logger.warning(
                 f"File execution data not found for execution_id: {self.execution_id} and file_execution_id: {file_execution_id}"
             )
-            file_execution_tracker.set_data(
-                execution_id=self.execution_id,
-                file_execution_id=file_execution_id,
-                file_execution_data=FileExecutionData(
-                    execution_id=self.execution_id,
-                    file_execution_id=file_execution_id,
-                    organization_id=self.organization_id,
-                    stage_status=FileExecutionStageData(
-                        stage=FileExecutionStage.INITIALIZATION,
-                        status=FileExecutionStageStatus.SUCCESS,
-                    ),
-                    status_history=[],
-                ),
-            )
+            self._init_file_execution_data(file_execution_id)
             response = self._run_and_poll(
                 file_execution_id=file_execution_id,
                 image_name=image_name,
@@ -221,13 +251,7 @@ class ToolSandboxHelper:
                 settings=settings,
                 retry_count=retry_count,
             )
-
-            self._update_stage_status_for_tool_execution(file_execution_id, response)
-            self._update_stage_status(
-                status=FileExecutionStageStatus.IN_PROGRESS,
-                stage=FileExecutionStage.FINALIZATION,
-                file_execution_id=file_execution_id,
-            )
+            self._complete_tool_execution_stage(file_execution_id, response)
         else:
             logger.info(
                 f"File execution data {file_execution_data} found for execution_id: {self.execution_id} and file_execution_id: {file_execution_id}"
@@ -248,12 +272,7 @@ class ToolSandboxHelper:
                     file_execution_id=file_execution_id,
                     file_execution_data=file_execution_data,
                 )
-                self._update_stage_status_for_tool_execution(file_execution_id, response)
-                self._update_stage_status(
-                    status=FileExecutionStageStatus.IN_PROGRESS,
-                    stage=FileExecutionStage.FINALIZATION,
-                    file_execution_id=file_execution_id,
-                )
+                self._complete_tool_execution_stage(file_execution_id, response)
             elif stage.is_before(FileExecutionStage.TOOL_EXECUTION):
                 self._update_stage_status(
                     status=FileExecutionStageStatus.SUCCESS,
@@ -267,12 +286,7 @@ class ToolSandboxHelper:
                     settings=settings,
                     retry_count=retry_count,
                 )
-                self._update_stage_status_for_tool_execution(file_execution_id, response)
-                self._update_stage_status(
-                    status=FileExecutionStageStatus.IN_PROGRESS,
-                    stage=FileExecutionStage.FINALIZATION,
-                    file_execution_id=file_execution_id,
-                )
+                self._complete_tool_execution_stage(file_execution_id, response)
             else:
                 logger.warning(
                     f"File execution data stage {file_execution_data.stage_status.stage} is after tool execution for execution_id: {self.execution_id} and file_execution_id: {file_execution_id}"
@@ -286,6 +300,187 @@ class ToolSandboxHelper:
         )
         return response
 
+    def call_tool_batch_handler(
+        self,
+        file_execution_ids: list[str],
+        image_name: str,
+        image_tag: str,
+        settings: dict[str, Any],
+        retry_count: int | None = None,
+    ) -> dict[str, RunnerContainerRunResponse]:
+        """Calling unstract runner to run the required tool on a batch of files.
+
+        Files that still need the tool are run in a single container, one
+        after the other. Files already past (or in) the tool execution stage
+        are resolved the same way as in `call_tool_handler`.
+
+        Args:
+            file_execution_ids (list[str]): file executions to run the tool on
+            image_name (str): image name
+            image_tag (str): image tag
+            settings (dict[str, Any]): tool settings
+
+        Returns:
+            dict[str, RunnerContainerRunResponse]: tool response per file_execution_id
+        """
+        file_execution_tracker = FileExecutionStatusTracker()
+        responses: dict[str, RunnerContainerRunResponse] = {}
+        pending_file_execution_ids: list[str] = []
+        for file_execution_id in file_execution_ids:
+            file_execution_data = file_execution_tracker.get_data(
+                execution_id=self.execution_id, file_execution_id=file_execution_id
+            )
+            if not file_execution_data:
+                logger.warning(
+                    f"File execution data not found for execution_id: {self.execution_id} and file_execution_id: {file_execution_id}"
+                )
+                self._init_file_execution_data(file_execution_id)
+                pending_file_execution_ids.append(file_execution_id)
+                continue
+            if file_execution_data.error:
+                responses[file_execution_id] = self._create_run_response(
+                    status=RunnerContainerRunStatus.ERROR,
+                    error=file_execution_data.error,
+                )
+                continue
+
+            stage = file_execution_data.stage_status.stage
+            if stage == FileExecutionStage.TOOL_EXECUTION:
+                response = self.poll_tool_status(
+                    file_execution_id=file_execution_id,
+                    file_execution_data=file_execution_data,
+                )
+                self._complete_tool_execution_stage(file_execution_id, response)
+                responses[file_execution_id] = response
+            elif stage.is_before(FileExecutionStage.TOOL_EXECUTION):
+                self._update_stage_status(
+                    status=FileExecutionStageStatus.SUCCESS,
+                    stage=stage,
+                    file_execution_id=file_execution_id,
+                )
+                pending_file_execution_ids.append(file_execution_id)
+            else:
+                # Assuming the tool execution is successful
+                responses[file_execution_id] = self._create_run_response(
+                    status=RunnerContainerRunStatus.SUCCESS,
+                )
+
+        if pending_file_execution_ids:
+            batch_responses = self._run_and_poll_batch(
+                file_execution_ids=pending_file_execution_ids,
+                image_name=image_name,
+                image_tag=image_tag,
+                settings=settings,
+                retry_count=retry_count,
+            )
+            for file_execution_id, response in batch_responses.items():
+                self._complete_tool_execution_stage(file_execution_id, response)
+                responses[file_execution_id] = response
+        logger.info(
+            f"Tool batch execution responses: {responses} for execution_id={self.execution_id}"
+        )
+        return {
+            file_execution_id: responses[file_execution_id]
+            for file_execution_id in file_execution_ids
+        }
+
+    def _run_and_poll_batch(
+        self,
+        file_execution_ids: list[str],
+        image_name: str,
+        image_tag: str,
+        settings: dict[str, Any],
+        retry_count: int | None = None,
+    ) -> dict[str, RunnerContainerRunResponse]:
+        batch_id = file_execution_ids[0]
+        container_name = UnstractUtils.build_tool_container_name(
+            tool_image=image_name,
+            tool_version=image_tag,
+            file_execution_id=batch_id,
+            retry_count=retry_count,
+        )
+        logger.info(
+            f"Calling runner to run tool container {container_name} for execution_id={self.execution_id}, file_execution_ids={file_execution_ids}"
+        )
+        headers = {
+            "X-Request-ID": batch_id,
+        }
+        data = self.create_tool_request_data(
+            batch_id, image_name, image_tag, settings, retry_count
+        )
+        data.pop("file_execution_id")
+        data["file_execution_ids"] = file_execution_ids
+        data["container_name"] = container_name
+        response_json = self._post_to_runner(
+            endpoint=UnstractRunner.RUN_BATCH_API_ENDPOINT, headers=headers, json=data
+        )
+        batch_response = RunnerContainerRunResponse.from_dict(response_json)
+
+        if batch_response.status == RunnerContainerRunStatus.RUNNING:
+            logger.info(
+                f"Polling tool container {container_name} for execution_id={self.execution_id}"
+            )
+            return self.poll_tool_batch_status(
+                file_execution_ids=file_execution_ids,
+                container_name=container_name,
+            )
+
+        file_results: dict[str, Any] = response_json.get("files") or {}
+        responses: dict[str, RunnerContainerRunResponse] = {}
+        for file_execution_id in file_execution_ids:
+            file_result = file_results.get(file_execution_id)
+            if not file_result:
+                responses[file_execution_id] = self._create_run_response(
+                    status=RunnerContainerRunStatus.ERROR,
+                    error=batch_response.error or "Tool did not run for this file",
+                )
+                continue
+            responses[file_execution_id] = self._create_run_response(
+                status=RunnerContainerRunStatus(file_result.get("status")),
+                error=file_result.get("error"),
+            )
+        return responses
+
+    def poll_tool_batch_status(
+        self,
+        file_execution_ids: list[str],
+        container_name: str,
+    ) -> dict[str, RunnerContainerRunResponse]:
+        """Wait for a batch container to exit and collect each file's status."""
+        max_wait_seconds = self._get_max_polling_wait_seconds()
+        responses: dict[str, RunnerContainerRunResponse] = {}
+        if self._wait_for_tool_container(
+            container_name=container_name, file_execution_id=file_execution_ids[-1]
+        ):
+            for file_execution_id in file_execution_ids:
+                error = self._handle_tool_execution_status(
+                    execution_id=self.execution_id,
+                    file_execution_id=file_execution_id,
+                    container_name=container_name,
+                    require_status=True,
+                )
+                responses[file_execution_id] = self._create_run_response(
+                    status=RunnerContainerRunStatus.ERROR
+                    if error
+                    else RunnerContainerRunStatus.SUCCESS,
+                    error=error,
+                )
+        else:
+            logger.error(
+                f"Tool {container_name} is not completed within {max_wait_seconds} seconds"
+            )
+            for file_execution_id in file_execution_ids:
+                responses[file_execution_id] = self._create_run_response(
+                    status=RunnerContainerRunStatus.ERROR,
+                    error=f"Tool is not completed within {max_wait_seconds} seconds",
+                )
+
+        self.cleanup_tool_container(
+            container_name=container_name,
+            file_execution_id=file_execution_ids[0],
+        )
+        return responses
+
     def _run_and_poll(
         self,
         file_execution_id: str,
@@ -372,6 +567,34 @@ class ToolSandboxHelper:
             stage_status=stage_status,
         )
 
+    def _init_file_execution_data(self, file_execution_id: str) -> None:
+        """Start tracking a file execution that has no tracker data yet."""
+        FileExecutionStatusTracker().set_data(
+            FileExecutionData(
+                execution_id=self.execution_id,
+                file_execution_id=file_execution_id,
+                organization_id=self.organization_id,
+                stage_status=FileExecutionStageData(
+                    stage=FileExecutionStage.INITIALIZATION,
+                    status=FileExecutionStageStatus.SUCCESS,
+                ),
+                status_history=[],
+            )
+        )
+
+    def _complete_tool_execution_stage(
+        self,
+        file_execution_id: str,
+        response: RunnerContainerRunResponse,
+    ) -> None:
+        """Record the tool's outcome and move the file on to finalization."""
+        self._update_stage_status_for_tool_execution(file_execution_id, response)
+        self._update_stage_status(
+            status=FileExecutionStageStatus.IN_PROGRESS,
+            stage=FileExecutionStage.FINALIZATION,
+            file_execution_id=file_execution_id,
+        )
+
     def _update_stage_status_for_tool_execution(
         self,
         file_execution_id: str,
@@ -414,13 +637,21 @@ class ToolSandboxHelper:
             file_execution_id, image_name, image_tag, settings, retry_count
         )
 
+        response_json = self._post_to_runner(
+            endpoint=UnstractRunner.RUN_API_ENDPOINT, headers=headers, json=data
+        )
+        return RunnerContainerRunResponse.from_dict(response_json)
+
+    def _post_to_runner(
+        self, endpoint: str, headers: dict[str, str], json: dict[str, Any]
+    ) -> dict[str, Any]:
         response: Response = Response()
         try:
             response = self.http_client(
                 method=HTTPMethod.POST,
-                endpoint=UnstractRunner.RUN_API_ENDPOINT,
+                endpoint=endpoint,
                 headers=headers,
-                json=data,
+                json=json,
             )
             response.raise_for_status()
         except ConnectionError as connect_err:
@@ -438,7 +669,7 @@ class ToolSandboxHelper:
                 error_message = response.text
             logger.error(f"Error from runner: {error_message}")
             raise ToolSanboxError(error_message) from e
-        return RunnerContainerRunResponse.from_dict(response.json())
+        return response.json()
 
     def create_tool_request_data(
         self,
@@ -512,9 +743,18 @@ class ToolSandboxHelper:
         return params
 
     def _handle_tool_execution_status(
-        self, execution_id: str, file_execution_id: str, container_name: str
+        self,
+        execution_id: str,
+        file_execution_id: str,
+        container_name: str,
+        require_status: bool = False,
     ) -> str | None:
-        """Get the tool execution status data from the tool execution tracker."""
+        """Get the tool execution status data from the tool execution tracker.
+
+        Args:
+            require_status (bool): Treat a missing status as an error. Used for
+                batched runs where a file may never have been reached.
+        """
         error = None
         tool_execution_data = ToolExecutionData(
             execution_id=execution_id,
@@ -530,6 +770,8 @@ class ToolSandboxHelper:
                     f"Execution ID: {execution_id}, docker "
                     f"container: {container_name} - failed to fetch execution status"
                 )
+                if require_status:
+                    error = "Tool did not report a status for this file"
                 return error
             status = tool_execution_status_data.status
             error = tool_execution_status_data.error
@@ -104,3 +104,14 @@ class ToolSandbox:
             self.settings,
             retry_count,
         )
+
+    def run_tool_batch(
+        self, file_execution_ids: list[str], retry_count: int | None = None
+    ) -> dict[str, RunnerContainerRunResponse]:
+        return self.helper.call_tool_batch_handler(
+            file_execution_ids,
+            self.image_name,
+            self.image_tag,
+            self.settings,
+            retry_count,
+        )
@@ -0,0 +1,79 @@
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+from unstract.core.runner.enum import ContainerStatus
+from unstract.tool_sandbox.helper import ToolSandboxHelper
+
+HELPER_MODULE = "unstract.tool_sandbox.helper"
+
+
+class WaitForToolContainerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.helper = ToolSandboxHelper(
+            organization_id="org",
+            workflow_id="workflow",
+            execution_id="execution",
+            messaging_channel="channel",
+            environment_variables={},
+        )
+        tracker_patcher = patch(f"{HELPER_MODULE}.ToolExecutionTracker")
+        self.tracker = tracker_patcher.start().return_value
+        self.addCleanup(tracker_patcher.stop)
+        status_patcher = patch.object(self.helper, "_check_tool_run_status")
+        self.check_tool_run_status = status_patcher.start()
+        self.addCleanup(status_patcher.stop)
+        env_patcher = patch.dict(
+            os.environ,
+            {
+                "MAX_RUNNER_POLLING_WAIT_SECONDS": "1",
+                "RUNNER_POLLING_INTERVAL_SECONDS": "2",
+            },
+        )
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+
+    def wait(self) -> bool:
+        return self.helper._wait_for_tool_container(
+            container_name="container", file_execution_id="file-1"
+        )
+
+    def test_completion_signal_ends_wait(self):
+        self.tracker.wait_for_completion.return_value = True
+
+        self.assertTrue(self.wait())
+        tool_execution_data = self.tracker.wait_for_completion.call_args.args[0]
+        self.assertEqual(tool_execution_data.file_execution_id, "file-1")
+        self.check_tool_run_status.assert_not_called()
+
+    def test_exited_container_without_signal(self):
+        # The sidecar died before signalling
+        self.tracker.wait_for_completion.return_value = False
+        self.check_tool_run_status.return_value = {"status": ContainerStatus.EXITED.value}
+
+        self.assertTrue(self.wait())
+        self.check_tool_run_status.assert_called_once_with("container")
+
+    def test_timeout_while_container_runs(self):
+        def block(tool_execution_data, timeout):
+            time.sleep(timeout)
+            return False
+
+        self.tracker.wait_for_completion.side_effect = block
+        self.check_tool_run_status.return_value = {"status": "running"}
+
+        self.assertFalse(self.wait())
+        self.check_tool_run_status.assert_called_with("container")
+
+    def test_polls_when_signal_is_unavailable(self):
+        self.tracker.wait_for_completion.side_effect = ConnectionError("redis down")
+        self.check_tool_run_status.return_value = {"status": ContainerStatus.EXITED.value}
+
+        with patch(f"{HELPER_MODULE}.time.sleep") as sleep:
+            self.assertTrue(self.wait())
+        sleep.assert_called_once_with(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
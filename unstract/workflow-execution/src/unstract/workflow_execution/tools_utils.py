@@ -207,6 +207,39 @@ class ToolsUtils:
                     raise e
         return None
 
+    def run_tool_batch(
+        self,
+        file_execution_ids: list[str],
+        tool_sandbox: ToolSandbox,
+        max_retries: int = ToolExecution.MAXIMUM_RETRY,
+    ) -> dict[str, RunnerContainerRunResponse]:
+        """Run the tool over a batch of files in a single container.
+
+        Retried as a whole like `run_tool_with_retry()`, files that already
+        completed in a previous attempt are not run again.
+
+        Args:
+            file_execution_ids (list[str]): Files to run the tool on, in order
+            tool_sandbox (ToolSandbox): Sandbox of the tool to run
+
+        Returns:
+            dict[str, RunnerContainerRunResponse]: Response per file_execution_id
+        """
+        for retry_count in range(max_retries):
+            try:
+                return tool_sandbox.run_tool_batch(file_execution_ids, retry_count)
+            except Exception as e:
+                if retry_count < max_retries - 1:
+                    logger.warning(
+                        f"Exception - Retrying ({retry_count + 1}/{max_retries}): {str(e)}"
+                    )
+                else:
+                    logger.warning(
+                        f"Operation failed after '{max_retries}' retries, error: {e}"
+                    )
+                    raise e
+        return {}
+
     def get_tool_environment_variables(self) -> dict[str, Any]:
         """Obtain a dictionary of env variables required by a tool.
 
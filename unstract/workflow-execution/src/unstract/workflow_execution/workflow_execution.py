@@ -7,6 +7,7 @@ import redis
 
 from unstract.core.pubsub_helper import LogPublisher
 from unstract.tool_sandbox import ToolSandbox
+from unstract.tool_sandbox.dto import RunnerContainerRunResponse
 from unstract.workflow_execution.constants import StepExecution, ToolExecution
 from unstract.workflow_execution.dto import ToolInstance, WorkflowDto
 from unstract.workflow_execution.enums import (
@@ -65,11 +66,45 @@ class WorkflowExecutionService:
         self.messaging_channel: str | None = None
         self.input_files: list[str] = []
         self.log_stage: LogStage = LogStage.COMPILE
+        self.tool_run_response: RunnerContainerRunResponse | None = None
 
     def set_messaging_channel(self, messaging_channel: str) -> None:
         self.messaging_channel = messaging_channel
         self.tool_utils.set_messaging_channel(messaging_channel)
 
+    def set_tool_run_response(
+        self, tool_run_response: RunnerContainerRunResponse | None
+    ) -> None:
+        """Use the outcome of a batched tool run instead of running the tool.
+
+        Args:
+            tool_run_response (RunnerContainerRunResponse | None): Response
+                for this file from `execute_tool_batch()`
+        """
+        self.tool_run_response = tool_run_response
+
+    def execute_tool_batch(
+        self, file_execution_ids: list[str]
+    ) -> dict[str, RunnerContainerRunResponse]:
+        """Run the workflow's tool over a batch of files in one container.
+
+        Only workflows with a single tool can be batched, the responses are
+        then handed to each file's execution through `set_tool_run_response()`.
+
+        Args:
+            file_execution_ids (list[str]): Files to run the tool on, in order
+
+        Returns:
+            dict[str, RunnerContainerRunResponse]: Response per file_execution_id
+        """
+        if len(self.tool_sandboxes) != 1:
+            raise BadRequestException(
+                "Batched tool runs need a workflow with exactly one tool"
+            )
+        return self.tool_utils.run_tool_batch(
+            file_execution_ids=file_execution_ids, tool_sandbox=self.tool_sandboxes[0]
+        )
+
     def compile_workflow(self, execution_id: str) -> dict[str, Any]:
         """Compiling workflow Validating all steps and tool instances.
 
@@ -209,9 +244,11 @@ class WorkflowExecutionService:
                 message="Ready for execution",
                 component=tool_instance_id,
             )
-            result = self.tool_utils.run_tool(
-                file_execution_id=self.file_execution_id, tool_sandbox=sandbox
-            )
+            result = self.tool_run_response
+            if not result:
+                result = self.tool_utils.run_tool(
+                    file_execution_id=self.file_execution_id, tool_sandbox=sandbox
+                )
             if result and result.error:
                 raise ToolOutputNotFoundException(result.error)
             if not self.validate_execution_result(step + 1):
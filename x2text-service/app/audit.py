@@ -0,0 +1,119 @@
+import atexit
+import datetime
+import logging
+import queue
+import threading
+import time
+import uuid
+from typing import Any
+
+from app.env import Env
+from app.models import X2TextAudit, be_db
+
+
+class AuditRecorder:
+    """Records `X2TextAudit` entries in batches off the request path.
+
+    Entries are queued and written by a background thread with one multi-row
+    insert per batch, either once `AUDIT_BATCH_SIZE` entries are queued or
+    every `AUDIT_FLUSH_INTERVAL_IN_SECOND`. Entries still queued when the
+    process exits are written by `drain()`, registered with `atexit`.
+    """
+
+    DRAIN_TIMEOUT_IN_SECOND = 10
+
+    # `None` is queued to stop the worker
+    _queue: "queue.Queue[dict[str, Any] | None]" = queue.Queue()
+    _worker: threading.Thread | None = None
+    _lock = threading.Lock()
+    _drain_registered = False
+
+    @classmethod
+    def record(
+        cls,
+        org_id: str,
+        file_name: str,
+        file_type: str,
+        file_size_in_kb: float,
+        status: str,
+    ) -> None:
+        cls._ensure_worker()
+        cls._queue.put(
+            {
+                "id": uuid.uuid4(),
+                "created_at": datetime.datetime.now(),
+                "org_id": org_id,
+                "file_name": file_name,
+                "file_type": file_type,
+                "file_size_in_kb": file_size_in_kb,
+                "status": status,
+            }
+        )
+
+    @classmethod
+    def _ensure_worker(cls) -> None:
+        # Started lazily so that every worker process gets its own thread
+        if cls._worker and cls._worker.is_alive():
+            return
+        with cls._lock:
+            if cls._worker and cls._worker.is_alive():
+                return
+            cls._worker = threading.Thread(
+                target=cls._run, name="x2text-audit-recorder", daemon=True
+            )
+            cls._worker.start()
+            if not cls._drain_registered:
+                atexit.register(cls.drain)
+                cls._drain_registered = True
+
+    @classmethod
+    def _run(cls) -> None:
+        while True:
+            entry = cls._queue.get()
+            if entry is None:
+                return
+            batch = [entry]
+            deadline = time.monotonic() + Env.AUDIT_FLUSH_INTERVAL_IN_SECOND
+            try:
+                while len(batch) < Env.AUDIT_BATCH_SIZE:
+                    timeout = max(deadline - time.monotonic(), 0)
+                    entry = cls._queue.get(timeout=timeout)
+                    if entry is None:
+                        cls._flush(batch)
+                        return
+                    batch.append(entry)
+            except queue.Empty:
+                pass
+            cls._flush(batch)
+
+    @classmethod
+    def drain(cls) -> None:
+        """Writes the queued entries, called when the process exits.
+
+        The worker is stopped once it has written the batch it holds, and any
+        entries left in the queue are written from the calling thread.
+        """
+        worker = cls._worker
+        if worker and worker.is_alive():
+            cls._queue.put(None)
+            worker.join(timeout=cls.DRAIN_TIMEOUT_IN_SECOND)
+            if worker.is_alive():
+                logging.error("Timed out writing the pending x2text audit entries")
+        batch: list[dict[str, Any]] = []
+        while True:
+            try:
+                entry = cls._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not None:
+                batch.append(entry)
+        for start in range(0, len(batch), Env.AUDIT_BATCH_SIZE):
+            cls._flush(batch[start : start + Env.AUDIT_BATCH_SIZE])
+
+    @staticmethod
+    def _flush(batch: list[dict[str, Any]]) -> None:
+        try:
+            with be_db.connection_context():
+                X2TextAudit.insert_many(batch).execute()
+        except Exception as e:
+            logging.error("Failed to record %d x2text audit entries: %s", len(batch), e)
@@ -1,17 +1,19 @@
 """Basic Controller."""
 
 import logging
-from io import BytesIO
+from collections.abc import Iterator
 from typing import Any
 
 import requests
-from flask import Blueprint, request, send_file
+from flask import Blueprint, Response, request
 
+from app.audit import AuditRecorder
 from app.authentication_middleware import (
     AuthenticationMiddleware,
     authentication_middleware,
 )
-from app.models import X2TextAudit
+from app.env import Env
+from app.upstream import MultipartStream, UpstreamSessionPool
 from app.util import X2TextUtil
 
 basic = Blueprint("basic", __name__)
@@ -48,7 +50,7 @@ def test_connection() -> Any:
     files = {"files": ("test")}
 
     try:
-        response = requests.request(
+        response = UpstreamSessionPool.get_session(url).request(
             "POST",
             url,
             headers=headers,
@@ -94,45 +96,76 @@ def process() -> Any:
     bearer_token = AuthenticationMiddleware.get_token_from_auth_header(request)
     _, org_id = AuthenticationMiddleware.get_organization_from_bearer_token(bearer_token)
 
-    x2_text_audit: X2TextAudit = X2TextAudit.create(
-        org_id=org_id,
-        file_name=uploaded_file.filename,
-        file_type=uploaded_file.mimetype,
-        file_size_in_kb=round(file_size_in_kb, 2),
-    )
-
-    files = {
-        "files": (
-            uploaded_file.filename,
-            uploaded_file.stream,
-            uploaded_file.content_type,
-        )
+    audit_details = {
+        "org_id": org_id,
+        "file_name": uploaded_file.filename,
+        "file_type": uploaded_file.mimetype,
+        "file_size_in_kb": round(file_size_in_kb, 2),
     }
 
     unstructured_api_key = X2TextUtil.get_value_for_key(UNSTRUCTURED_API_KEY, form_data)
+    # Streams the spooled upload to the backend instead of encoding it in memory
+    body = MultipartStream(
+        fields=form_data,
+        file_field="files",
+        file_name=uploaded_file.filename,
+        file=uploaded_file.stream,
+        file_content_type=uploaded_file.content_type,
+    )
     headers = {
         "accept": "application/json",
         "unstructured-api-key": unstructured_api_key,
+        "Content-Type": body.content_type,
     }
-    payload = form_data
-
-    response = requests.request(
-        "POST",
-        url,
-        headers=headers,
-        data=payload,
-        files=files,
-        timeout=None,
+
+    try:
+        response = UpstreamSessionPool.get_session(url).request(
+            "POST",
+            url,
+            headers=headers,
+            data=body,
+            timeout=None,
+            stream=True,
+        )
+    except Exception:
+        AuditRecorder.record(status="Failed", **audit_details)
+        raise
+    if not response.ok:
+        AuditRecorder.record(status="Failed", **audit_details)
+        return_val = X2TextUtil.read_response(response=response)
+        response.close()
+        logging.error("Text extraction failed: [%s] %s", response.status_code, return_val)
+        return return_val, response.status_code
+
+    text_chunks = X2TextUtil.iter_text_content(
+        response.iter_content(chunk_size=Env.STREAM_CHUNK_SIZE)
+    )
+    try:
+        # Reads up to the first element so that malformed responses still fail
+        # before the reply is started
+        first_chunk = next(text_chunks, b"")
+    except Exception:
+        response.close()
+        AuditRecorder.record(status="Failed", **audit_details)
+        raise
+
+    def stream_text() -> Iterator[bytes]:
+        status = "Failed"
+        try:
+            yield first_chunk
+            yield from text_chunks
+            status = "Success"
+        except Exception as e:
+            logging.error("Error while streaming extracted text: %s", e)
+            # The 200 is already sent, so the server aborts the response and the
+            # client gets a transport error instead of a truncated text
+            raise
+        finally:
+            response.close()
+            AuditRecorder.record(status=status, **audit_details)
+
+    return Response(
+        stream_text(),
+        mimetype="text/plain",
+        headers={"Content-Disposition": "attachment; filename=infile.txt"},
     )
-    if response.ok:
-        json_response = response.json()
-        response_text = X2TextUtil.get_text_content(json_response)
-        file_stream = BytesIO(response_text.encode("utf-8"))
-        x2_text_audit.status = "Success"
-        x2_text_audit.save()
-        return send_file(file_stream, download_name="infile.txt", as_attachment=True)
-    x2_text_audit.status = "Failed"
-    x2_text_audit.save()
-    return_val = X2TextUtil.read_response(response=response)
-    logging.error("Text extraction failed: [%s] %s", response.status_code, return_val)
-    return return_val, response.status_code
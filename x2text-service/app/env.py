@@ -51,6 +51,12 @@ class Env:
     DB_USERNAME = EnvManager.get_required_setting("DB_USERNAME")
     DB_PASSWORD = EnvManager.get_required_setting("DB_PASSWORD")
     DB_NAME = EnvManager.get_required_setting("DB_NAME")
+    UPSTREAM_POOL_MAXSIZE = int(os.environ.get("UPSTREAM_POOL_MAXSIZE", 10))
+    STREAM_CHUNK_SIZE = int(os.environ.get("STREAM_CHUNK_SIZE", 64 * 1024))
+    AUDIT_BATCH_SIZE = int(os.environ.get("AUDIT_BATCH_SIZE", 50))
+    AUDIT_FLUSH_INTERVAL_IN_SECOND = float(
+        os.environ.get("AUDIT_FLUSH_INTERVAL_IN_SECOND", 2)
+    )
 
 
 EnvManager.raise_for_missing_envs()
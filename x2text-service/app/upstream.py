@@ -0,0 +1,112 @@
+import threading
+import uuid
+from collections.abc import Iterator
+from io import BytesIO
+from typing import IO, Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.env import Env
+
+
+class UpstreamSessionPool:
+    """Keeps one pooled `requests.Session` per extraction backend host.
+
+    Connections (and TLS sessions) to a backend are reused across requests
+    instead of being set up again for every call.
+    """
+
+    _sessions: dict[str, requests.Session] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_session(cls, url: str) -> requests.Session:
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}"
+        session = cls._sessions.get(host)
+        if session:
+            return session
+        with cls._lock:
+            session = cls._sessions.get(host)
+            if not session:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=Env.UPSTREAM_POOL_MAXSIZE
+                )
+                session.mount(f"{parts.scheme}://", adapter)
+                cls._sessions[host] = session
+        return session
+
+
+class MultipartStream:
+    """Multipart form body which streams its file from disk.
+
+    Unlike `requests`' own multipart encoding, the file is never read into
+    memory as a whole. The length is known upfront so that the body is sent
+    with a `Content-Length` rather than chunked.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, Any],
+        file_field: str,
+        file_name: str,
+        file: IO[bytes],
+        file_content_type: str | None,
+        chunk_size: int = Env.STREAM_CHUNK_SIZE,
+    ) -> None:
+        if not file.seekable():
+            file = BytesIO(file.read())
+        self.boundary = uuid.uuid4().hex
+        self.file = file
+        self.chunk_size = chunk_size
+        self.file_start = file.tell()
+        file.seek(0, 2)
+        self.file_size = file.tell() - self.file_start
+        file.seek(self.file_start)
+
+        head = b"".join(
+            self._part_header(name=name) + str(value).encode("utf-8") + b"\r\n"
+            for name, value in fields.items()
+            if value is not None
+        )
+        self.head = head + self._part_header(
+            name=file_field,
+            file_name=file_name,
+            content_type=file_content_type or "application/octet-stream",
+        )
+        self.tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _part_header(
+        self,
+        name: str,
+        file_name: str | None = None,
+        content_type: str | None = None,
+    ) -> bytes:
+        disposition = f'form-data; name="{self._quote(name)}"'
+        if file_name is not None:
+            disposition += f'; filename="{self._quote(file_name)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return f"{header}\r\n".encode()
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', "%22").replace("\r\n", " ")
+
+    def __len__(self) -> int:
+        return len(self.head) + self.file_size + len(self.tail)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.head
+        self.file.seek(self.file_start)
+        while chunk := self.file.read(self.chunk_size):
+            yield chunk
+        yield self.tail
@@ -1,3 +1,6 @@
+import codecs
+import json
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from requests import Response
@@ -17,6 +20,57 @@ class X2TextUtil:
         )
         return combined_text
 
+    @staticmethod
+    def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+        """Parses the items of a JSON array incrementally from its chunks.
+
+        Raises:
+            ValueError: If the chunks do not form a JSON array
+        """
+        decoder = json.JSONDecoder()
+        utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        buffer = ""
+        started = False
+        for chunk in chunks:
+            buffer += utf8_decoder.decode(chunk)
+            while True:
+                buffer = buffer.lstrip()
+                if not started:
+                    if not buffer:
+                        break
+                    if buffer[0] != "[":
+                        raise ValueError("Response is not a JSON array")
+                    buffer = buffer[1:]
+                    started = True
+                    continue
+                if buffer.startswith(","):
+                    buffer = buffer[1:]
+                    continue
+                if buffer.startswith("]"):
+                    return
+                try:
+                    item, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    break
+                # A complete item is always followed by a `,` or `]`, otherwise
+                # it may be a number cut short by the chunk boundary
+                if not buffer[end:].lstrip().startswith((",", "]")):
+                    break
+                yield item
+                buffer = buffer[end:]
+        raise ValueError("Incomplete JSON array in response")
+
+    @staticmethod
+    def iter_text_content(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Streams the combined text of the elements in a JSON response.
+
+        Equivalent to `get_text_content()` without loading the whole
+        response in memory.
+        """
+        for index, item in enumerate(X2TextUtil.iter_json_array(chunks)):
+            text: str = item["text"]
+            yield (f"\n{text}" if index else text).encode("utf-8")
+
     @staticmethod
     def read_response(response: Response) -> dict[str, Any]:
         if response.headers.get("Content-Type") == "application/json":
@@ -0,0 +1,6 @@
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# `app.env` requires the DB settings, which are never connected to in tests
+load_dotenv(Path(__file__).parent.parent / "sample.env")
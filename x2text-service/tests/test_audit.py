@@ -0,0 +1,83 @@
+import queue
+import unittest
+from unittest.mock import patch
+
+from app import audit
+from app.audit import AuditRecorder
+
+
+class AuditRecorderTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        patchers = [
+            patch.object(AuditRecorder, "_queue", queue.Queue()),
+            patch.object(AuditRecorder, "_worker", None),
+            patch.object(AuditRecorder, "_drain_registered", False),
+            # Entries are held by the worker well beyond the test
+            patch.object(audit.Env, "AUDIT_FLUSH_INTERVAL_IN_SECOND", 60),
+            patch.object(audit.Env, "AUDIT_BATCH_SIZE", 2),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        flush_patcher = patch.object(AuditRecorder, "_flush")
+        self.flush = flush_patcher.start()
+        self.addCleanup(flush_patcher.stop)
+        register_patcher = patch.object(audit.atexit, "register")
+        self.register = register_patcher.start()
+        self.addCleanup(register_patcher.stop)
+
+    def record(self, file_name: str) -> None:
+        AuditRecorder.record(
+            org_id="org",
+            file_name=file_name,
+            file_type="application/pdf",
+            file_size_in_kb=1.0,
+            status="Success",
+        )
+
+    def flushed_file_names(self) -> list[str]:
+        return [
+            entry["file_name"]
+            for call in self.flush.call_args_list
+            for entry in call.args[0]
+        ]
+
+    def test_drain_is_registered_at_exit_once(self) -> None:
+        self.record("one.pdf")
+        self.record("two.pdf")
+
+        self.register.assert_called_once_with(AuditRecorder.drain)
+
+    def test_drain_writes_entries_held_by_worker(self) -> None:
+        for file_name in ("one.pdf", "two.pdf", "three.pdf"):
+            self.record(file_name)
+        worker = AuditRecorder._worker
+
+        AuditRecorder.drain()
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(
+            sorted(self.flushed_file_names()), ["one.pdf", "three.pdf", "two.pdf"]
+        )
+
+    def test_drain_writes_queued_entries_without_worker(self) -> None:
+        with patch.object(AuditRecorder, "_ensure_worker"):
+            for file_name in ("one.pdf", "two.pdf", "three.pdf"):
+                self.record(file_name)
+
+        AuditRecorder.drain()
+
+        # Written in batches of `AUDIT_BATCH_SIZE`
+        self.assertEqual(
+            [len(call.args[0]) for call in self.flush.call_args_list], [2, 1]
+        )
+        self.assertEqual(self.flushed_file_names(), ["one.pdf", "two.pdf", "three.pdf"])
+
+    def test_drain_without_entries(self) -> None:
+        AuditRecorder.drain()
+
+        self.flush.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import json
+import unittest
+from collections.abc import Iterable, Iterator
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import requests
+from flask import Flask
+
+from app.controllers import api, controller
+from app.upstream import MultipartStream
+
+HEADERS = {"Authorization": "Bearer platform-key"}
+ELEMENTS = [{"text": "first"}, {"text": "second"}, {"text": "third"}]
+
+
+class UpstreamResponse:
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        status_code: int = 200,
+        content_type: str = "application/json",
+    ) -> None:
+        self.chunks = chunks
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = {"Content-Type": content_type}
+        self.closed = False
+
+    def iter_content(self, chunk_size: int) -> Iterable[bytes]:
+        return self.chunks
+
+    def json(self) -> object:
+        return json.loads(b"".join(self.chunks))
+
+    @property
+    def text(self) -> str:
+        return b"".join(self.chunks).decode("utf-8")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def failing_after(data: bytes) -> Iterator[bytes]:
+    yield data
+    raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+
+class ProcessTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session = MagicMock()
+        self.record = MagicMock()
+        patchers = [
+            patch.object(
+                controller.AuthenticationMiddleware,
+                "validate_bearer_token",
+                return_value=True,
+            ),
+            patch.object(
+                controller.AuthenticationMiddleware,
+                "get_organization_from_bearer_token",
+                return_value=(1, "org"),
+            ),
+            patch.object(
+                controller.UpstreamSessionPool,
+                "get_session",
+                return_value=self.session,
+            ),
+            patch.object(controller.AuditRecorder, "record", self.record),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        app = Flask(__name__)
+        app.register_blueprint(api, url_prefix="/api/v1")
+        self.client = app.test_client()
+
+    def process(self, upstream_response: UpstreamResponse):
+        self.session.request.return_value = upstream_response
+        return self.client.post(
+            "/api/v1/x2text/process",
+            data={
+                "unstructured-url": "https://api.example.com/general",
+                "unstructured-api-key": "api-key",
+                "strategy": "fast",
+                "file": (BytesIO(b"%PDF-1.4 content"), "doc.pdf", "application/pdf"),
+            },
+            headers=HEADERS,
+        )
+
+    def audited_status(self) -> str:
+        self.record.assert_called_once()
+        return self.record.call_args.kwargs["status"]
+
+    def test_text_is_streamed(self) -> None:
+        upstream_response = UpstreamResponse([json.dumps(ELEMENTS).encode()])
+
+        response = self.process(upstream_response)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_data(as_text=True), "first\nsecond\nthird")
+        self.assertTrue(upstream_response.closed)
+        self.assertEqual(self.audited_status(), "Success")
+        request_kwargs = self.session.request.call_args.kwargs
+        self.assertIsInstance(request_kwargs["data"], MultipartStream)
+        self.assertTrue(request_kwargs["stream"])
+        self.assertEqual(request_kwargs["headers"]["unstructured-api-key"], "api-key")
+
+    def test_upstream_error_status(self) -> None:
+        upstream_response = UpstreamResponse(
+            [b'{"detail": "Invalid API key"}'], status_code=401
+        )
+
+        response = self.process(upstream_response)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json, {"detail": "Invalid API key"})
+        self.assertEqual(self.audited_status(), "Failed")
+
+    def test_malformed_response_fails_before_streaming(self) -> None:
+        upstream_response = UpstreamResponse([b"<html>Bad gateway</html>"])
+
+        response = self.process(upstream_response)
+
+        self.assertEqual(response.status_code, 500)
+        self.assertTrue(upstream_response.closed)
+        self.assertEqual(self.audited_status(), "Failed")
+
+    def test_failure_while_streaming_aborts_response(self) -> None:
+        data = json.dumps(ELEMENTS).encode()
+        upstream_response = UpstreamResponse(failing_after(data[: len(data) // 2]))
+
+        response = self.process(upstream_response)
+
+        # The error reaches the server, which aborts the started response
+        self.assertEqual(response.status_code, 200)
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            response.get_data()
+        self.assertTrue(upstream_response.closed)
+        self.assertEqual(self.audited_status(), "Failed")
+
+
+if __name__ == "__main__":
+    unittest.main()
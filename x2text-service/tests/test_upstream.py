@@ -0,0 +1,133 @@
+import threading
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from werkzeug.formparser import parse_form_data
+from werkzeug.test import EnvironBuilder
+
+from app.env import Env
+from app.upstream import MultipartStream, UpstreamSessionPool
+
+
+class UpstreamSessionPoolTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = patch.dict(UpstreamSessionPool._sessions, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_session_is_shared_per_host(self) -> None:
+        session = UpstreamSessionPool.get_session("https://api.example.com/general")
+
+        self.assertIs(
+            UpstreamSessionPool.get_session("https://api.example.com/test?x=1"),
+            session,
+        )
+        self.assertIsNot(
+            UpstreamSessionPool.get_session("https://other.example.com/general"),
+            session,
+        )
+        self.assertIsNot(
+            UpstreamSessionPool.get_session("http://api.example.com/general"),
+            session,
+        )
+
+    def test_session_pool_size(self) -> None:
+        session = UpstreamSessionPool.get_session("https://api.example.com/general")
+
+        adapter = session.get_adapter("https://api.example.com/general")
+        self.assertEqual(adapter._pool_maxsize, Env.UPSTREAM_POOL_MAXSIZE)
+
+    def test_concurrent_requests_share_one_session(self) -> None:
+        sessions = []
+        barrier = threading.Barrier(8)
+
+        def get_session() -> None:
+            barrier.wait()
+            sessions.append(
+                UpstreamSessionPool.get_session("https://api.example.com/general")
+            )
+
+        threads = [threading.Thread(target=get_session) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+
+
+class MultipartStreamTestCase(unittest.TestCase):
+    CONTENT = b"%PDF-1.4\n" + bytes(range(256)) * 10
+
+    def stream(self, file: BytesIO, **kwargs) -> MultipartStream:
+        return MultipartStream(
+            fields={"strategy": "hi_res", "languages": None, "pages": 3},
+            file_field="files",
+            file_name='my "report".pdf',
+            file=file,
+            file_content_type="application/pdf",
+            **kwargs,
+        )
+
+    def parse(self, body: MultipartStream) -> tuple[dict, dict]:
+        data = b"".join(body)
+        environ = EnvironBuilder(
+            method="POST",
+            input_stream=BytesIO(data),
+            content_type=body.content_type,
+            content_length=len(data),
+        ).get_environ()
+        _, form, files = parse_form_data(environ)
+        return form, files
+
+    def test_body_is_valid_multipart(self) -> None:
+        form, files = self.parse(self.stream(BytesIO(self.CONTENT)))
+
+        # Fields without a value are not sent
+        self.assertEqual(form.to_dict(), {"strategy": "hi_res", "pages": "3"})
+        self.assertEqual(files["files"].filename, 'my "report".pdf')
+        self.assertEqual(files["files"].content_type, "application/pdf")
+        self.assertEqual(files["files"].read(), self.CONTENT)
+
+    def test_length_matches_body(self) -> None:
+        body = self.stream(BytesIO(self.CONTENT))
+
+        self.assertEqual(len(body), len(b"".join(body)))
+
+    def test_file_is_read_in_chunks(self) -> None:
+        body = self.stream(BytesIO(self.CONTENT), chunk_size=100)
+
+        chunks = list(body)
+
+        self.assertEqual(chunks[0], body.head)
+        self.assertEqual(chunks[-1], body.tail)
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks[1:-1]))
+        self.assertEqual(b"".join(chunks[1:-1]), self.CONTENT)
+
+    def test_body_can_be_sent_again(self) -> None:
+        body = self.stream(BytesIO(self.CONTENT))
+
+        self.assertEqual(b"".join(body), b"".join(body))
+
+    def test_file_is_sent_from_its_position(self) -> None:
+        file = BytesIO(b"skipped" + self.CONTENT)
+        file.seek(len(b"skipped"))
+
+        _, files = self.parse(self.stream(file))
+
+        self.assertEqual(files["files"].read(), self.CONTENT)
+
+    def test_unseekable_file(self) -> None:
+        file = BytesIO(self.CONTENT)
+        file.seekable = lambda: False
+
+        body = self.stream(file)
+        _, files = self.parse(body)
+
+        self.assertEqual(files["files"].read(), self.CONTENT)
+        self.assertEqual(len(body), len(b"".join(body)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+
+from app.util import X2TextUtil
+
+ELEMENTS = [
+    {"type": "Title", "text": "Résumé", "metadata": {"page_number": 1}},
+    {"type": "NarrativeText", "text": 'Brackets ] and commas , in "text"'},
+    {"type": "Table", "text": "", "metadata": {"coordinates": [[1.5, 2], [3, 4]]}},
+    {"type": "NarrativeText", "text": "日本語のテキスト"},
+]
+
+
+def split(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class IterJsonArrayTestCase(unittest.TestCase):
+    def test_items_across_any_chunk_boundary(self) -> None:
+        data = json.dumps(ELEMENTS, ensure_ascii=False, indent=2).encode("utf-8")
+
+        # Splits inside multi-byte characters, strings and numbers too
+        for size in (1, 2, 3, 7, 64, len(data)):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    list(X2TextUtil.iter_json_array(split(data, size))), ELEMENTS
+                )
+
+    def test_scalar_items(self) -> None:
+        chunks = [b"[1", b"23, tr", b"ue, nu", b"ll, 4.", b"5]"]
+
+        self.assertEqual(list(X2TextUtil.iter_json_array(chunks)), [123, True, None, 4.5])
+
+    def test_empty_array(self) -> None:
+        self.assertEqual(list(X2TextUtil.iter_json_array([b" [ ", b" ]\n"])), [])
+
+    def test_not_an_array(self) -> None:
+        for data in (b'{"detail": "Invalid file"}', b"Internal Server Error"):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    list(X2TextUtil.iter_json_array([data]))
+
+    def test_incomplete_array(self) -> None:
+        data = json.dumps(ELEMENTS).encode("utf-8")
+
+        for truncated in (b"", data[:-1], data[: len(data) // 2]):
+            with self.subTest(truncated=truncated):
+                with self.assertRaises(ValueError):
+                    list(X2TextUtil.iter_json_array(split(truncated, 16)))
+
+    def test_items_are_yielded_as_they_arrive(self) -> None:
+        def chunks():
+            yield b'[{"text": "first"},'
+            raise ConnectionError("Connection reset")
+
+        items = X2TextUtil.iter_json_array(chunks())
+
+        self.assertEqual(next(items), {"text": "first"})
+        with self.assertRaises(ConnectionError):
+            next(items)
+
+
+class IterTextContentTestCase(unittest.TestCase):
+    def test_same_as_get_text_content(self) -> None:
+        data = json.dumps(ELEMENTS).encode("utf-8")
+
+        text = b"".join(X2TextUtil.iter_text_content(split(data, 5)))
+
+        self.assertEqual(text.decode("utf-8"), X2TextUtil.get_text_content(ELEMENTS))
+
+
+if __name__ == "__main__":
+    unittest.main()